@@ -10,8 +10,13 @@ Backwards compatibility is not guaranteed at this time.
 from graphrag.api.index import build_index
 from graphrag.api.prompt_tune import generate_indexing_prompts
 from graphrag.api.query import (
+    SearchEngine,
     basic_search,
     basic_search_streaming,
+    build_basic_search_engine,
+    build_drift_search_engine,
+    build_global_search_engine,
+    build_local_search_engine,
     drift_search,
     drift_search_streaming,
     global_search,
@@ -41,6 +46,11 @@ __all__ = [  # noqa: RUF022
     "multi_index_drift_search",
     "multi_index_global_search",
     "multi_index_local_search",
+    "SearchEngine",
+    "build_global_search_engine",
+    "build_local_search_engine",
+    "build_drift_search_engine",
+    "build_basic_search_engine",
     # prompt tuning API
     "DocSelectionType",
     "generate_indexing_prompts",
@@ -32,6 +32,8 @@ async def build_index(
     memory_profile: bool = False,
     callbacks: list[WorkflowCallbacks] | None = None,
     progress_logger: ProgressLogger | None = None,
+    resume: bool = False,
+    profile: bool = False,
 ) -> list[PipelineRunResult]:
     """Run the pipeline with the given configuration.
 
@@ -47,6 +49,10 @@ async def build_index(
         A list of callbacks to register.
     progress_logger : ProgressLogger | None default=None
         The progress logger.
+    resume : bool default=False
+        Whether to skip workflows that already completed with the same inputs and configuration.
+    profile : bool default=False
+        Whether to run the workflows one at a time and write a profile of each to the reporting directory.
 
     Returns
     -------
@@ -75,6 +81,8 @@ async def build_index(
         callbacks=workflow_callbacks,
         logger=logger,
         is_update_run=is_update_run,
+        resume=resume,
+        profile=profile,
     ):
         outputs.append(output)
         if output.errors and len(output.errors) > 0:
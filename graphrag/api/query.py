@@ -12,11 +12,13 @@ Contains the following functions:
  - global_search_streaming: Perform a global search and stream results back.
  - local_search: Perform a local search.
  - local_search_streaming: Perform a local search and stream results back.
+ - build_*_search_engine: Build a reusable search engine once and query it many times.
 
 WARNING: This API is under development and may undergo changes in future releases.
 Backwards compatibility is not guaranteed at this time.
 """
 
+import copy
 from collections.abc import AsyncGenerator
 from typing import Any
 
@@ -47,6 +49,8 @@ from graphrag.query.indexer_adapters import (
     read_indexer_reports,
     read_indexer_text_units,
 )
+from graphrag.query.structured_search.base import BaseSearch
+from graphrag.query.structured_search.drift_search.search import DRIFTSearch
 from graphrag.utils.api import (
     get_embedding_store,
     load_search_prompt,
@@ -57,6 +61,61 @@ from graphrag.utils.cli import redact
 logger = PrintProgressLogger("")
 
 
+class SearchEngine:
+    """A prebuilt search engine that can be reused across queries.
+
+    The context builder (and the id->object lookups it holds) is built once;
+    each query runs on a shallow per-query copy of the engine carrying its own
+    callbacks, so concurrent queries on the same event loop do not share state.
+    """
+
+    def __init__(self, engine: BaseSearch):
+        self.engine = engine
+
+    def _bind(self, callbacks: list[QueryCallbacks] | None) -> BaseSearch:
+        if isinstance(self.engine, DRIFTSearch):
+            # DRIFT keeps its query state on the engine, so start from a fresh one
+            return DRIFTSearch(
+                model=self.engine.model,
+                context_builder=self.engine.context_builder,
+                token_encoder=self.engine.token_encoder,
+                callbacks=callbacks,
+                primer_prompt=self.engine.primer.primer_prompt,
+            )
+        engine = copy.copy(self.engine)
+        engine.callbacks = callbacks or []  # type: ignore
+        return engine
+
+    def stream_search(
+        self, query: str, callbacks: list[QueryCallbacks] | None = None
+    ) -> AsyncGenerator:
+        """Run a query and stream the response back."""
+        return self._bind(callbacks).stream_search(query=query)
+
+    async def search(
+        self, query: str, callbacks: list[QueryCallbacks] | None = None
+    ) -> tuple[
+        str | dict[str, Any] | list[dict[str, Any]],
+        str | list[pd.DataFrame] | dict[str, pd.DataFrame],
+    ]:
+        """Run a query and return the response and context data."""
+        callbacks = list(callbacks or [])
+        full_response = ""
+        context_data = {}
+
+        def on_context(context: Any) -> None:
+            nonlocal context_data
+            context_data = context
+
+        local_callbacks = NoopQueryCallbacks()
+        local_callbacks.on_context = on_context
+        callbacks.append(local_callbacks)
+
+        async for chunk in self.stream_search(query=query, callbacks=callbacks):
+            full_response += chunk
+        return full_response, context_data
+
+
 @validate_call(config={"arbitrary_types_allowed": True})
 async def global_search(
     config: GraphRagConfig,
@@ -155,6 +214,43 @@ def global_search_streaming(
     ------
     TODO: Document any exceptions to expect.
     """
+    return build_global_search_engine(
+        config=config,
+        entities=entities,
+        communities=communities,
+        community_reports=community_reports,
+        community_level=community_level,
+        dynamic_community_selection=dynamic_community_selection,
+        response_type=response_type,
+    ).stream_search(query=query, callbacks=callbacks)
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+def build_global_search_engine(
+    config: GraphRagConfig,
+    entities: pd.DataFrame,
+    communities: pd.DataFrame,
+    community_reports: pd.DataFrame,
+    community_level: int | None,
+    dynamic_community_selection: bool,
+    response_type: str,
+) -> SearchEngine:
+    """Build a reusable global search engine.
+
+    Parameters
+    ----------
+    - config (GraphRagConfig): A graphrag configuration (from settings.yaml)
+    - entities (pd.DataFrame): A DataFrame containing the final entities (from entities.parquet)
+    - communities (pd.DataFrame): A DataFrame containing the final communities (from communities.parquet)
+    - community_reports (pd.DataFrame): A DataFrame containing the final community reports (from community_reports.parquet)
+    - community_level (int): The community level to search at.
+    - dynamic_community_selection (bool): Enable dynamic community selection instead of using all community reports at a fixed level.
+    - response_type (str): The type of response to return.
+
+    Returns
+    -------
+    SearchEngine: An engine that can serve any number of (concurrent) queries.
+    """
     communities_ = read_indexer_communities(communities, community_reports)
     reports = read_indexer_reports(
         community_reports,
@@ -186,10 +282,9 @@ def global_search_streaming(
         map_system_prompt=map_prompt,
         reduce_system_prompt=reduce_prompt,
         general_knowledge_inclusion_prompt=knowledge_prompt,
-        callbacks=callbacks,
         no_data_answer=no_data_answer,
     )
-    return search_engine.stream_search(query=query)
+    return SearchEngine(search_engine)
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -436,6 +531,48 @@ def local_search_streaming(
     ------
     TODO: Document any exceptions to expect.
     """
+    return build_local_search_engine(
+        config=config,
+        entities=entities,
+        communities=communities,
+        community_reports=community_reports,
+        text_units=text_units,
+        relationships=relationships,
+        covariates=covariates,
+        community_level=community_level,
+        response_type=response_type,
+    ).stream_search(query=query, callbacks=callbacks)
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+def build_local_search_engine(
+    config: GraphRagConfig,
+    entities: pd.DataFrame,
+    communities: pd.DataFrame,
+    community_reports: pd.DataFrame,
+    text_units: pd.DataFrame,
+    relationships: pd.DataFrame,
+    covariates: pd.DataFrame | None,
+    community_level: int,
+    response_type: str,
+) -> SearchEngine:
+    """Build a reusable local search engine.
+
+    Parameters
+    ----------
+    - config (GraphRagConfig): A graphrag configuration (from settings.yaml)
+    - entities (pd.DataFrame): A DataFrame containing the final entities (from entities.parquet)
+    - community_reports (pd.DataFrame): A DataFrame containing the final community reports (from community_reports.parquet)
+    - text_units (pd.DataFrame): A DataFrame containing the final text units (from text_units.parquet)
+    - relationships (pd.DataFrame): A DataFrame containing the final relationships (from relationships.parquet)
+    - covariates (pd.DataFrame): A DataFrame containing the final covariates (from covariates.parquet)
+    - community_level (int): The community level to search at.
+    - response_type (str): The response type to return.
+
+    Returns
+    -------
+    SearchEngine: An engine that can serve any number of (concurrent) queries.
+    """
     vector_store_args = {}
     for index, store in config.vector_store.items():
         vector_store_args[index] = store.model_dump()
@@ -461,9 +598,8 @@ def local_search_streaming(
         description_embedding_store=description_embedding_store,
         response_type=response_type,
         system_prompt=prompt,
-        callbacks=callbacks,
     )
-    return search_engine.stream_search(query=query)
+    return SearchEngine(search_engine)
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -791,6 +927,45 @@ def drift_search_streaming(
     ------
     TODO: Document any exceptions to expect.
     """
+    return build_drift_search_engine(
+        config=config,
+        entities=entities,
+        communities=communities,
+        community_reports=community_reports,
+        text_units=text_units,
+        relationships=relationships,
+        community_level=community_level,
+        response_type=response_type,
+    ).stream_search(query=query, callbacks=callbacks)
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+def build_drift_search_engine(
+    config: GraphRagConfig,
+    entities: pd.DataFrame,
+    communities: pd.DataFrame,
+    community_reports: pd.DataFrame,
+    text_units: pd.DataFrame,
+    relationships: pd.DataFrame,
+    community_level: int,
+    response_type: str,
+) -> SearchEngine:
+    """Build a reusable DRIFT search engine.
+
+    Parameters
+    ----------
+    - config (GraphRagConfig): A graphrag configuration (from settings.yaml)
+    - entities (pd.DataFrame): A DataFrame containing the final entities (from entities.parquet)
+    - community_reports (pd.DataFrame): A DataFrame containing the final community reports (from community_reports.parquet)
+    - text_units (pd.DataFrame): A DataFrame containing the final text units (from text_units.parquet)
+    - relationships (pd.DataFrame): A DataFrame containing the final relationships (from relationships.parquet)
+    - community_level (int): The community level to search at.
+    - response_type (str): The response type to return.
+
+    Returns
+    -------
+    SearchEngine: An engine that can serve any number of (concurrent) queries.
+    """
     vector_store_args = {}
     for index, store in config.vector_store.items():
         vector_store_args[index] = store.model_dump()
@@ -828,11 +1003,10 @@ def drift_search_streaming(
         local_system_prompt=prompt,
         reduce_system_prompt=reduce_prompt,
         response_type=response_type,
-        callbacks=callbacks,
         primer_prompt=primer_prompt,
         primer_expand_query_prompt=primer_expand_query_prompt,
     )
-    return search_engine.stream_search(query=query)
+    return SearchEngine(search_engine)
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -1112,6 +1286,28 @@ def basic_search_streaming(
     ------
     TODO: Document any exceptions to expect.
     """
+    return build_basic_search_engine(
+        config=config,
+        text_units=text_units,
+    ).stream_search(query=query, callbacks=callbacks)
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+def build_basic_search_engine(
+    config: GraphRagConfig,
+    text_units: pd.DataFrame,
+) -> SearchEngine:
+    """Build a reusable basic search engine.
+
+    Parameters
+    ----------
+    - config (GraphRagConfig): A graphrag configuration (from settings.yaml)
+    - text_units (pd.DataFrame): A DataFrame containing the final text units (from text_units.parquet)
+
+    Returns
+    -------
+    SearchEngine: An engine that can serve any number of (concurrent) queries.
+    """
     vector_store_args = {}
     for index, store in config.vector_store.items():
         vector_store_args[index] = store.model_dump()
@@ -1130,9 +1326,8 @@ def basic_search_streaming(
         text_units=read_indexer_text_units(text_units),
         text_unit_embeddings=description_embedding_store,
         system_prompt=prompt,
-        callbacks=callbacks,
     )
-    return search_engine.stream_search(query=query)
+    return SearchEngine(search_engine)
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
 from graphrag.config.enums import CacheType
@@ -18,6 +19,10 @@ if TYPE_CHECKING:
 from graphrag.cache.json_pipeline_cache import JsonPipelineCache
 from graphrag.cache.memory_pipeline_cache import InMemoryCache
 from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.cache.sqlite_pipeline_cache import (
+    SQLITE_CACHE_FILENAME,
+    SqlitePipelineCache,
+)
 
 
 class CacheFactory:
@@ -52,6 +57,10 @@ class CacheFactory:
                 return JsonPipelineCache(
                     FilePipelineStorage(root_dir=root_dir).child(kwargs["base_dir"])
                 )
+            case CacheType.sqlite:
+                return SqlitePipelineCache(
+                    str(Path(root_dir) / kwargs["base_dir"] / SQLITE_CACHE_FILENAME)
+                )
             case CacheType.blob:
                 return JsonPipelineCache(create_blob_storage(**kwargs))
             case CacheType.cosmosdb:
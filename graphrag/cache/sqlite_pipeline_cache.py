@@ -0,0 +1,221 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing 'SqlitePipelineCache' model."""
+
+import asyncio
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.utils.profiling import record_io
+
+log = logging.getLogger(__name__)
+
+SQLITE_CACHE_FILENAME = "cache.db"
+"""The name of the database file created in the cache base_dir."""
+
+_DEFAULT_BATCH_SIZE = 64
+_DEFAULT_FLUSH_INTERVAL = 1.0
+
+
+class _SqliteCacheDatabase:
+    """A WAL-mode sqlite database with a write buffer, shared by a cache and its children."""
+
+    def __init__(self, path: str, batch_size: int, flush_interval: float):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._lock = threading.Lock()
+        # buffered writes; a None value marks a buffered delete
+        self._pending: dict[str, str | None] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_loop: asyncio.AbstractEventLoop | None = None
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID"
+        )
+        self._conn.commit()
+        # buffered writes must not be lost when the process exits between flushes
+        atexit.register(self.flush)
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, value: str | None) -> None:
+        with self._lock:
+            self._pending[key] = value
+            full = len(self._pending) >= self._batch_size
+        if full:
+            self.flush()
+        else:
+            self._schedule_flush()
+
+    def clear(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._pending if key.startswith(prefix)]:
+                del self._pending[key]
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE substr(key, 1, ?) = ?",
+                    (len(prefix), prefix),
+                )
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)",
+                    [
+                        (key, value)
+                        for key, value in pending.items()
+                        if value is not None
+                    ],
+                )
+                self._conn.executemany(
+                    "DELETE FROM cache WHERE key = ?",
+                    [(key,) for key, value in pending.items() if value is None],
+                )
+
+    def _schedule_flush(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # outside of an event loop writes go out by batch, on flush() or at exit
+            return
+        with self._lock:
+            # a handle left behind by a loop that has since closed will never fire
+            if self._flush_handle is None or self._flush_loop is not loop:
+                self._flush_handle = loop.call_later(self._flush_interval, self.flush)
+                self._flush_loop = loop
+
+
+class SqlitePipelineCache(PipelineCache):
+    """Sqlite pipeline cache class definition.
+
+    All entries live in a single WAL-mode database file. Reads are a single primary key
+    lookup, and writes are buffered and committed in batches of `batch_size`, or after
+    `flush_interval` seconds, whichever comes first. Values are stored in the same JSON
+    format as the file cache, so an existing file cache can be migrated as-is with
+    `migrate_file_cache`.
+    """
+
+    _db: _SqliteCacheDatabase
+    _prefix: str
+
+    def __init__(
+        self,
+        db_path: str,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        flush_interval: float = _DEFAULT_FLUSH_INTERVAL,
+        *,
+        _db: _SqliteCacheDatabase | None = None,
+        _prefix: str = "",
+    ):
+        """Init method definition."""
+        self._db = _db or _SqliteCacheDatabase(db_path, batch_size, flush_interval)
+        self._db_path = db_path
+        self._prefix = _prefix
+
+    async def get(self, key: str) -> Any:
+        """Get method definition."""
+        data = self._db.get(self._prefix + key)
+        if data is None:
+            return None
+        record_io(bytes_read=len(data.encode("utf-8")))
+        try:
+            return json.loads(data).get("result")
+        except json.decoder.JSONDecodeError:
+            await self.delete(key)
+            return None
+
+    async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set method definition."""
+        if value is None:
+            return
+        data = json.dumps({"result": value, **(debug_data or {})}, ensure_ascii=False)
+        record_io(bytes_written=len(data.encode("utf-8")))
+        self._db.put(self._prefix + key, data)
+
+    async def has(self, key: str) -> bool:
+        """Has method definition."""
+        return self._db.get(self._prefix + key) is not None
+
+    async def delete(self, key: str) -> None:
+        """Delete method definition."""
+        self._db.put(self._prefix + key, None)
+
+    async def clear(self) -> None:
+        """Clear method definition."""
+        self._db.clear(self._prefix)
+
+    def child(self, name: str) -> "SqlitePipelineCache":
+        """Child method definition."""
+        return SqlitePipelineCache(
+            self._db_path, _db=self._db, _prefix=f"{self._prefix}{name}/"
+        )
+
+    def flush(self) -> None:
+        """Commit any buffered writes."""
+        self._db.flush()
+
+
+def migrate_file_cache(
+    source_dir: str | Path,
+    db_path: str | Path,
+    batch_size: int = 1000,
+) -> int:
+    """Copy the entries of a file cache directory into a sqlite cache database.
+
+    Keys are the file paths relative to `source_dir`, which is how the file cache
+    namespaces its children. Entries that are not valid JSON are skipped, since the
+    file cache would discard them on read anyway. Returns the number of entries copied.
+    """
+    source = Path(source_dir)
+    db_path = Path(db_path)
+    db = _SqliteCacheDatabase(str(db_path), batch_size, _DEFAULT_FLUSH_INTERVAL)
+    num_copied = 0
+    num_skipped = 0
+    for dirpath, _, filenames in os.walk(source):
+        for filename in filenames:
+            path = Path(dirpath) / filename
+            # the database (and its -wal/-shm files) may live in the cache directory
+            if path.parent == db_path.parent and filename.startswith(db_path.name):
+                continue
+            try:
+                data = path.read_text(encoding="utf-8")
+                json.loads(data)
+            except (UnicodeDecodeError, json.decoder.JSONDecodeError):
+                num_skipped += 1
+                continue
+            db.put(path.relative_to(source).as_posix(), data)
+            num_copied += 1
+    db.flush()
+    log.info(
+        "migrated %d cache entries from %s to %s, skipped %d",
+        num_copied,
+        source,
+        db_path,
+        num_skipped,
+    )
+    return num_copied
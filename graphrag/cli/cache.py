@@ -0,0 +1,40 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""CLI implementation of the migrate-cache subcommand."""
+
+from pathlib import Path
+
+from graphrag.cache.sqlite_pipeline_cache import (
+    SQLITE_CACHE_FILENAME,
+    migrate_file_cache,
+)
+from graphrag.config.load_config import load_config
+from graphrag.logger.factory import LoggerFactory, LoggerType
+
+
+def migrate_cache_cli(root_dir: Path, config_filepath: Path | None) -> None:
+    """
+    Migrate the file cache of a project into a sqlite cache database.
+
+    The database is written to the configured cache base_dir, which is where the
+    sqlite cache type looks for it. The json files are left in place.
+
+    Parameters
+    ----------
+    root_dir : Path
+        The project root directory.
+    config_filepath : Path | None
+        The configuration to use.
+    """
+    progress_logger = LoggerFactory().create_logger(LoggerType.RICH)
+    config = load_config(root_dir, config_filepath)
+    cache_dir = Path(config.root_dir) / config.cache.base_dir
+    db_path = cache_dir / SQLITE_CACHE_FILENAME
+
+    progress_logger.info(f"Migrating file cache at {cache_dir} to {db_path}")  # noqa: G004
+    num_copied = migrate_file_cache(cache_dir, db_path)
+    progress_logger.success(
+        f"Migrated {num_copied} cache entries. Set cache.type to sqlite to use them."  # noqa: G004
+    )
+    progress_logger.stop()
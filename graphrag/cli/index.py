@@ -72,6 +72,8 @@ def index_cli(
     dry_run: bool,
     skip_validation: bool,
     output_dir: Path | None,
+    resume: bool = False,
+    profile: bool = False,
 ):
     """Run the pipeline with the given config."""
     cli_overrides = {}
@@ -91,6 +93,8 @@ def index_cli(
         logger=logger,
         dry_run=dry_run,
         skip_validation=skip_validation,
+        resume=resume,
+        profile=profile,
     )
 
 
@@ -104,6 +108,7 @@ def update_cli(
     config_filepath: Path | None,
     skip_validation: bool,
     output_dir: Path | None,
+    profile: bool = False,
 ):
     """Run the pipeline with the given config."""
     cli_overrides = {}
@@ -124,6 +129,7 @@ def update_cli(
         logger=logger,
         dry_run=False,
         skip_validation=skip_validation,
+        profile=profile,
     )
 
 
@@ -137,6 +143,8 @@ def _run_index(
     logger,
     dry_run,
     skip_validation,
+    resume=False,
+    profile=False,
 ):
     progress_logger = LoggerFactory().create_logger(logger)
     info, error, success = _logger(progress_logger)
@@ -175,6 +183,8 @@ def _run_index(
             is_update_run=is_update_run,
             memory_profile=memprofile,
             progress_logger=progress_logger,
+            resume=resume,
+            profile=profile,
         )
     )
     encountered_errors = any(
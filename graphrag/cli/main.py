@@ -158,6 +158,18 @@ def _index_cli(
             resolve_path=True,
         ),
     ] = None,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            help="Skip workflows that already completed with the same inputs and configuration."
+        ),
+    ] = False,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            help="Run the workflows one at a time and write a profile of each to the reporting directory."
+        ),
+    ] = False,
 ):
     """Build a knowledge graph index."""
     from graphrag.cli.index import index_cli
@@ -173,6 +185,8 @@ def _index_cli(
         skip_validation=skip_validation,
         output_dir=output,
         method=method,
+        resume=resume,
+        profile=profile,
     )
 
 
@@ -222,6 +236,12 @@ def _update_cli(
             resolve_path=True,
         ),
     ] = None,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            help="Run the workflows one at a time and write a profile of each to the reporting directory."
+        ),
+    ] = False,
 ):
     """
     Update an existing knowledge graph index.
@@ -240,9 +260,35 @@ def _update_cli(
         skip_validation=skip_validation,
         output_dir=output,
         method=method,
+        profile=profile,
     )
 
 
+@app.command("migrate-cache")
+def _migrate_cache_cli(
+    config: Annotated[
+        Path | None,
+        typer.Option(
+            help="The configuration to use.", exists=True, file_okay=True, readable=True
+        ),
+    ] = None,
+    root: Annotated[
+        Path,
+        typer.Option(
+            help="The project root directory.",
+            exists=True,
+            dir_okay=True,
+            writable=True,
+            resolve_path=True,
+        ),
+    ] = Path(),  # set default to current directory
+):
+    """Migrate a file cache into a single-file sqlite cache."""
+    from graphrag.cli.cache import migrate_cache_cli
+
+    migrate_cache_cli(root_dir=root, config_filepath=config)
+
+
 @app.command("prompt-tune")
 def _prompt_tune_cli(
     root: Annotated[
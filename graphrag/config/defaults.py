@@ -11,6 +11,7 @@ from graphrag.config.enums import (
     AuthType,
     CacheType,
     ChunkStrategyType,
+    ClusterStrategyType,
     InputFileType,
     InputType,
     ModelType,
@@ -75,6 +76,17 @@ class ChunksDefaults:
     encoding_model: str = "cl100k_base"
     prepend_metadata: bool = False
     chunk_size_includes_metadata: bool = False
+    workers: int = 1
+
+
+@dataclass
+class DeduplicateTextUnitsDefaults:
+    """Default values for near-duplicate text unit detection."""
+
+    enabled: bool = False
+    threshold: float = 0.9
+    num_perm: int = 128
+    shingle_size: int = 5
 
 
 @dataclass
@@ -84,6 +96,7 @@ class ClusterGraphDefaults:
     max_cluster_size: int = 10
     use_lcc: bool = True
     seed: int = 0xDEADBEEF
+    strategy: ClusterStrategyType = ClusterStrategyType.graspologic
 
 
 @dataclass
@@ -186,6 +199,7 @@ class ExtractGraphDefaults:
     model_id: str = DEFAULT_CHAT_MODEL_ID
     continue_prompt: None = None
     loop_prompt: None = None
+    batch_max_tokens: int = 0
 
 
 @dataclass
@@ -293,6 +307,9 @@ class LanguageModelDefaults:
     max_retries: int = 10
     max_retry_wait: float = 10.0
     concurrent_requests: int = 25
+    adaptive_concurrency: bool = False
+    min_concurrent_requests: int = 1
+    max_concurrent_requests: int = 50
     responses: None = None
     async_mode: AsyncType = AsyncType.Threaded
 
@@ -419,6 +436,9 @@ class GraphRagConfigDefaults:
     embed_graph: EmbedGraphDefaults = field(default_factory=EmbedGraphDefaults)
     embed_text: EmbedTextDefaults = field(default_factory=EmbedTextDefaults)
     chunks: ChunksDefaults = field(default_factory=ChunksDefaults)
+    deduplicate_text_units: DeduplicateTextUnitsDefaults = field(
+        default_factory=DeduplicateTextUnitsDefaults
+    )
     snapshots: SnapshotsDefaults = field(default_factory=SnapshotsDefaults)
     extract_graph: ExtractGraphDefaults = field(default_factory=ExtractGraphDefaults)
     extract_graph_nlp: ExtractGraphNLPDefaults = field(
@@ -442,6 +462,8 @@ class GraphRagConfigDefaults:
         default_factory=lambda: {DEFAULT_VECTOR_STORE_ID: VectorStoreDefaults()}
     )
     workflows: None = None
+    concurrent_workflows: int = 4
+    max_table_memory_mb: int = 1024
 
 
 language_model_defaults = LanguageModelDefaults()
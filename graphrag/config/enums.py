@@ -21,6 +21,8 @@ class CacheType(str, Enum):
     """The blob cache configuration type."""
     cosmosdb = "cosmosdb"
     """The cosmosdb cache configuration type"""
+    sqlite = "sqlite"
+    """The single-file sqlite cache configuration type."""
 
     def __repr__(self):
         """Get a string representation."""
@@ -140,6 +142,18 @@ class ChunkStrategyType(str, Enum):
     tokens = "tokens"
     sentence = "sentence"
     chinese = "chinese"
+    chinese_tokens = "chinese_tokens"
+
+    def __repr__(self):
+        """Get a string representation."""
+        return f'"{self.value}"'
+
+
+class ClusterStrategyType(str, Enum):
+    """ClusterStrategy class definition."""
+
+    graspologic = "graspologic"
+    igraph = "igraph"
 
     def __repr__(self):
         """Get a string representation."""
@@ -83,7 +83,7 @@ chunks:
 ## connection_string and container_name must be provided
 
 cache:
-  type: {graphrag_config_defaults.cache.type.value} # [file, blob, cosmosdb]
+  type: {graphrag_config_defaults.cache.type.value} # [file, sqlite, blob, cosmosdb]
   base_dir: "{graphrag_config_defaults.cache.base_dir}"
 
 reporting:
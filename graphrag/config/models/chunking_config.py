@@ -40,3 +40,7 @@ class ChunkingConfig(BaseModel):
         description="Count metadata in max tokens.",
         default=graphrag_config_defaults.chunks.chunk_size_includes_metadata,
     )
+    workers: int = Field(
+        description="The number of processes to chunk the documents in.",
+        default=graphrag_config_defaults.chunks.workers,
+    )
@@ -6,6 +6,7 @@
 from pydantic import BaseModel, Field
 
 from graphrag.config.defaults import graphrag_config_defaults
+from graphrag.config.enums import ClusterStrategyType
 
 
 class ClusterGraphConfig(BaseModel):
@@ -23,3 +24,7 @@ class ClusterGraphConfig(BaseModel):
         description="The seed to use for the clustering.",
         default=graphrag_config_defaults.cluster_graph.seed,
     )
+    strategy: ClusterStrategyType = Field(
+        description="The clustering strategy to use.",
+        default=graphrag_config_defaults.cluster_graph.strategy,
+    )
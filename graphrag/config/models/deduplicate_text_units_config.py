@@ -0,0 +1,29 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Parameterization settings for the default configuration."""
+
+from pydantic import BaseModel, Field
+
+from graphrag.config.defaults import graphrag_config_defaults
+
+
+class DeduplicateTextUnitsConfig(BaseModel):
+    """Configuration section for near-duplicate text unit detection."""
+
+    enabled: bool = Field(
+        description="Whether near-duplicate text units reuse the graph and claim extraction results of the text unit they duplicate.",
+        default=graphrag_config_defaults.deduplicate_text_units.enabled,
+    )
+    threshold: float = Field(
+        description="The estimated Jaccard similarity of the character shingles of two text units from which they are near-duplicates.",
+        default=graphrag_config_defaults.deduplicate_text_units.threshold,
+    )
+    num_perm: int = Field(
+        description="The number of MinHash permutations to estimate the similarity with.",
+        default=graphrag_config_defaults.deduplicate_text_units.num_perm,
+    )
+    shingle_size: int = Field(
+        description="The number of characters in a shingle.",
+        default=graphrag_config_defaults.deduplicate_text_units.shingle_size,
+    )
@@ -46,6 +46,10 @@ class ExtractGraphConfig(BaseModel):
         description="The entity extraction loop prompt to use.",
         default=graphrag_config_defaults.extract_graph.loop_prompt,
     )
+    batch_max_tokens: int = Field(
+        description="The maximum number of tokens of text units packed into a single extraction request, 0 to send each text unit on its own.",
+        default=graphrag_config_defaults.extract_graph.batch_max_tokens,
+    )
 
     def resolved_strategy(
         self, root_dir: str, model_config: LanguageModelConfig
@@ -76,4 +80,5 @@ class ExtractGraphConfig(BaseModel):
             )
             if self.loop_prompt
             else None,
+            "batch_max_tokens": self.batch_max_tokens,
         }
@@ -17,6 +17,9 @@ from graphrag.config.models.cache_config import CacheConfig
 from graphrag.config.models.chunking_config import ChunkingConfig
 from graphrag.config.models.cluster_graph_config import ClusterGraphConfig
 from graphrag.config.models.community_reports_config import CommunityReportsConfig
+from graphrag.config.models.deduplicate_text_units_config import (
+    DeduplicateTextUnitsConfig,
+)
 from graphrag.config.models.drift_search_config import DRIFTSearchConfig
 from graphrag.config.models.embed_graph_config import EmbedGraphConfig
 from graphrag.config.models.extract_claims_config import ClaimExtractionConfig
@@ -192,6 +195,12 @@ class GraphRagConfig(BaseModel):
     )
     """The chunking configuration to use."""
 
+    deduplicate_text_units: DeduplicateTextUnitsConfig = Field(
+        description="The near-duplicate text unit detection configuration to use.",
+        default=DeduplicateTextUnitsConfig(),
+    )
+    """The near-duplicate text unit detection configuration to use."""
+
     snapshots: SnapshotsConfig = Field(
         description="The snapshots configuration to use.",
         default=SnapshotsConfig(),
@@ -282,6 +291,20 @@ class GraphRagConfig(BaseModel):
     )
     """List of workflows to run, in execution order."""
 
+    concurrent_workflows: int = Field(
+        description="The maximum number of independent workflows to run at the same time.",
+        default=graphrag_config_defaults.concurrent_workflows,
+        ge=1,
+    )
+    """The maximum number of independent workflows to run at the same time."""
+
+    max_table_memory_mb: int = Field(
+        description="The maximum size of the tables kept in memory for the following workflows, in megabytes.",
+        default=graphrag_config_defaults.max_table_memory_mb,
+        ge=0,
+    )
+    """The maximum size of the tables kept in memory for the following workflows, in megabytes."""
+
     def _validate_vector_store_db_uri(self) -> None:
         """Validate the vector store configuration."""
         for store in self.vector_store.values():
@@ -240,6 +240,18 @@ class LanguageModelConfig(BaseModel):
         description="Whether to use concurrent requests for the LLM service.",
         default=language_model_defaults.concurrent_requests,
     )
+    adaptive_concurrency: bool = Field(
+        description="Whether to adapt the number of concurrent requests to the latency and throttling of the LLM service, starting from concurrent_requests.",
+        default=language_model_defaults.adaptive_concurrency,
+    )
+    min_concurrent_requests: int = Field(
+        description="The minimum number of concurrent requests with adaptive concurrency.",
+        default=language_model_defaults.min_concurrent_requests,
+    )
+    max_concurrent_requests: int = Field(
+        description="The maximum number of concurrent requests with adaptive concurrency.",
+        default=language_model_defaults.max_concurrent_requests,
+    )
     responses: list[str | BaseModel] | None = Field(
         default=language_model_defaults.responses,
         description="Static responses to use in mock mode.",
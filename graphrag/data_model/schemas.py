@@ -56,6 +56,9 @@ TEXT_UNIT_IDS = "text_unit_ids"
 COVARIATE_IDS = "covariate_ids"
 DOCUMENT_IDS = "document_ids"
 
+# the text unit a near-duplicate text unit reuses the extraction results of
+DUPLICATE_OF = "duplicate_of"
+
 PERIOD = "period"
 SIZE = "size"
 
@@ -24,7 +24,7 @@ async def load_text(
 ) -> pd.DataFrame:
     """Load text inputs from a directory."""
 
-    async def load_file(path: str, group: dict | None = None) -> pd.DataFrame:
+    async def load_file(path: str, group: dict | None = None) -> dict:
         if group is None:
             group = {}
         text = await storage.get(path, encoding=config.encoding)
@@ -32,6 +32,6 @@ async def load_text(
         new_item["id"] = gen_sha512_hash(new_item, new_item.keys())
         new_item["title"] = str(Path(path).name)
         new_item["creation_date"] = await storage.get_creation_date(path)
-        return pd.DataFrame([new_item])
+        return new_item
 
     return await load_files(load_file, config, storage, progress)
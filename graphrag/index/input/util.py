@@ -3,6 +3,7 @@
 
 """Shared column processing for structured input files."""
 
+import asyncio
 import logging
 import re
 from typing import Any
@@ -17,38 +18,68 @@ from graphrag.storage.pipeline_storage import PipelineStorage
 log = logging.getLogger(__name__)
 
 
+MAX_CONCURRENT_FILES = 32
+"""The number of input files read at the same time."""
+
+
 async def load_files(
     loader: Any,
     config: InputConfig,
     storage: PipelineStorage,
     progress: ProgressLogger | None,
+    max_concurrency: int = MAX_CONCURRENT_FILES,
 ) -> pd.DataFrame:
-    """Load files from storage and apply a loader function."""
-    files = list(
-        storage.find(
-            re.compile(config.file_pattern),
-            progress=progress,
-            file_filter=config.file_filter,
-        )
-    )
+    """Load files from storage and apply a loader function.
 
-    if len(files) == 0:
-        msg = f"No {config.file_type} files found in {config.base_dir}"
-        raise ValueError(msg)
+    The files are loaded while the storage is still being searched, up to
+    `max_concurrency` at a time. The loader returns either a DataFrame or a single
+    record (a dict of column values); records are gathered column by column rather
+    than into a DataFrame per file. The rows keep the order the files were found in.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    results: list[pd.DataFrame | dict | None] = []
+    pending: set[asyncio.Task] = set()
 
-    files_loaded = []
-
-    for file, group in files:
+    async def load(index: int, file: str, group: dict) -> None:
         try:
-            files_loaded.append(await loader(file, group))
+            results[index] = await loader(file, group)
         except Exception as e:  # noqa: BLE001 (catching Exception is fine here)
             log.warning("Warning! Error loading file %s. Skipping...", file)
             log.warning("Error: %s", e)
+        finally:
+            semaphore.release()
+
+    try:
+        for file, group in storage.find(
+            re.compile(config.file_pattern),
+            progress=progress,
+            file_filter=config.file_filter,
+        ):
+            await semaphore.acquire()
+            results.append(None)
+            task = asyncio.create_task(load(len(results) - 1, file, group))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        await asyncio.gather(*pending)
+    finally:
+        for task in pending:
+            task.cancel()
+
+    if len(results) == 0:
+        msg = f"No {config.file_type} files found in {config.base_dir}"
+        raise ValueError(msg)
 
+    files_loaded = [loaded for loaded in results if loaded is not None]
     log.info(
-        "Found %d %s files, loading %d", len(files), config.file_type, len(files_loaded)
+        "Found %d %s files, loading %d",
+        len(results),
+        config.file_type,
+        len(files_loaded),
     )
-    result = pd.concat(files_loaded)
+    if len(files_loaded) == 0:
+        msg = f"None of the {config.file_type} files found in {config.base_dir} could be loaded"
+        raise ValueError(msg)
+    result = pd.concat(_combine_records(files_loaded), ignore_index=True)
     total_files_log = (
         f"Total number of unfiltered {config.file_type} rows: {len(result)}"
     )
@@ -56,6 +87,35 @@ async def load_files(
     return result
 
 
+def _combine_records(loaded: list[pd.DataFrame | dict]) -> list[pd.DataFrame]:
+    """Turn each run of consecutive records into a single DataFrame, built from column buffers."""
+    frames = []
+    columns: dict[str, list] = {}
+    count = 0
+
+    def flush() -> None:
+        nonlocal columns, count
+        if count > 0:
+            frames.append(pd.DataFrame(columns))
+        columns = {}
+        count = 0
+
+    for item in loaded:
+        if isinstance(item, pd.DataFrame):
+            flush()
+            frames.append(item)
+            continue
+        for key, value in item.items():
+            # a column missing from the earlier records is empty there
+            columns.setdefault(key, [None] * count).append(value)
+        count += 1
+        for values in columns.values():
+            if len(values) < count:
+                values.append(None)
+    flush()
+    return frames
+
+
 def process_data_columns(
     documents: pd.DataFrame, config: InputConfig, path: str
 ) -> pd.DataFrame:
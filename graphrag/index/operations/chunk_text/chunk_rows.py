@@ -0,0 +1,80 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the chunk_row and chunk_shard methods definitions.
+
+These run in the worker processes of create_base_text_units, which import this
+module on their own, so it keeps its imports to the chunking operation.
+"""
+
+import json
+from functools import partial
+from typing import Any
+
+import pandas as pd
+
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.config.models.chunking_config import ChunkStrategyType
+from graphrag.index.operations.chunk_text.chunk_text import chunk_text
+from graphrag.index.operations.chunk_text.strategies import get_encoding_fn
+
+
+def chunk_row(
+    row: dict[str, Any],
+    callbacks: WorkflowCallbacks,
+    size: int,
+    overlap: int,
+    encoding_model: str,
+    strategy: ChunkStrategyType,
+    prepend_metadata: bool,
+    chunk_size_includes_metadata: bool,
+) -> list[Any]:
+    """Chunk the texts of one aggregated row, prepending its metadata if asked to."""
+    line_delimiter = ".\n"
+    metadata_str = ""
+    metadata_tokens = 0
+
+    if prepend_metadata and "metadata" in row:
+        metadata = row["metadata"]
+        if isinstance(metadata, str):
+            metadata = json.loads(metadata)
+        if isinstance(metadata, dict):
+            metadata_str = (
+                line_delimiter.join(f"{k}: {v}" for k, v in metadata.items())
+                + line_delimiter
+            )
+
+        if chunk_size_includes_metadata:
+            encode, _ = get_encoding_fn(encoding_model)
+            metadata_tokens = len(encode(metadata_str))
+            if metadata_tokens >= size:
+                message = "Metadata tokens exceeds the maximum tokens per chunk. Please increase the tokens per chunk."
+                raise ValueError(message)
+
+    chunked = chunk_text(
+        pd.DataFrame([row]).reset_index(drop=True),
+        column="texts",
+        size=size - metadata_tokens,
+        overlap=overlap,
+        encoding_model=encoding_model,
+        strategy=strategy,
+        callbacks=callbacks,
+    )[0]
+
+    if prepend_metadata:
+        for index, chunk in enumerate(chunked):
+            if isinstance(chunk, str):
+                chunked[index] = metadata_str + chunk
+            else:
+                chunked[index] = (
+                    (chunk[0], metadata_str + chunk[1], chunk[2]) if chunk else None
+                )
+
+    return chunked
+
+
+def chunk_shard(rows: list[dict[str, Any]], chunk_row: partial) -> list[list[Any]]:
+    """Chunk a shard of rows with the given chunk_row, in a worker process."""
+    callbacks = NoopWorkflowCallbacks()
+    return [chunk_row(row, callbacks=callbacks) for row in rows]
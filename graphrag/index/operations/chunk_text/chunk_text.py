@@ -53,6 +53,15 @@ def chunk_text(
     ```yaml
     strategy: sentence
     ```
+
+    ### chinese_tokens
+    This strategy chunks a piece of text into chunks of up to `size` tokens, cut at paragraph, sentence or clause boundaries (Chinese or English punctuation). The strategy config is as follows:
+
+    ```yaml
+    strategy: chinese_tokens
+    size: 1200 # Optional, The chunk size to use, in tokens, default: 1200
+    overlap: 100 # Optional, The chunk overlap to use, in tokens, default: 100
+    ```
     """
     strategy_exec = load_strategy(strategy)
     
@@ -125,6 +134,12 @@ def load_strategy(strategy: ChunkStrategyType) -> ChunkStrategy:
             from graphrag.index.operations.chunk_text.strategies import run_chinese
 
             return run_chinese
+        case ChunkStrategyType.chinese_tokens:
+            from graphrag.index.operations.chunk_text.strategies import (
+                run_chinese_tokens,
+            )
+
+            return run_chinese_tokens
         case ChunkStrategyType.sentence:
             # NLTK
             from graphrag.index.operations.chunk_text.bootstrap import bootstrap
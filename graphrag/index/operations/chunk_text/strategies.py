@@ -15,6 +15,9 @@ from graphrag.index.text_splitting.text_splitting import (
     split_multiple_texts_on_tokens,
 )
 from graphrag.index.text_splitting.chinese_recursive_text_splitter import ChineseRecursiveTextSplitter
+from graphrag.index.text_splitting.chinese_token_text_splitter import (
+    ChineseTokenTextSplitter,
+)
 from graphrag.logger.progress import ProgressTicker
 
 
@@ -99,6 +102,25 @@ def run_chinese(
     )
 
 
+def run_chinese_tokens(
+    input: list[str], config: ChunkingConfig, tick: ProgressTicker
+) -> Iterable[TextChunk]:
+    """Chunks text into chunks of up to `size` tokens, cut at punctuation."""
+    text_splitter = ChineseTokenTextSplitter(
+        chunk_size=config.size,
+        chunk_overlap=config.overlap,
+        encoding_name=config.encoding_model,
+    )
+    for doc_idx, text in enumerate(input):
+        for chunk, n_tokens in text_splitter.split_text(text):
+            yield TextChunk(
+                text_chunk=chunk,
+                source_doc_indices=[doc_idx],
+                n_tokens=n_tokens,
+            )
+        tick(1)
+
+
 def _split_text_to_chinese(
     texts: list[str], enc: Tokenizer, tick: ProgressTicker
 ) -> list[TextChunk]:
@@ -4,33 +4,47 @@
 """A module containing cluster_graph, apply_clustering and run_layout methods definition."""
 
 import logging
+import random
+from collections.abc import Callable
 
-import networkx as nx
+import numpy as np
 
-from graphrag.index.utils.stable_lcc import stable_largest_connected_component
+from graphrag.config.enums import ClusterStrategyType
+from graphrag.index.operations.compact_graph import CompactGraph
 
 Communities = list[tuple[int, int, int, list[str]]]
 
+ClusterStrategy = Callable[
+    [CompactGraph, int, bool, int | None],
+    tuple[dict[int, dict[str, int]], dict[int, int]],
+]
+"""A hierarchical clustering, returning the community of each node title per level and the parent of each community."""
+
+LEIDEN_RANDOMNESS = 0.001
+"""The randomness of the igraph Leiden refinement, as in graspologic."""
+
+LEIDEN_ITERATIONS = 2
+"""The number of igraph Leiden iterations run on each graph or community."""
+
 
 log = logging.getLogger(__name__)
 
 
 def cluster_graph(
-    graph: nx.Graph,
+    graph: CompactGraph,
     max_cluster_size: int,
     use_lcc: bool,
     seed: int | None = None,
+    strategy: ClusterStrategyType = ClusterStrategyType.graspologic,
 ) -> Communities:
     """Apply a hierarchical clustering algorithm to a graph."""
-    if len(graph.nodes) == 0:
+    if graph.node_count == 0:
         log.warning("Graph has no nodes")
         return []
 
-    node_id_to_community_map, parent_mapping = _compute_leiden_communities(
-        graph=graph,
-        max_cluster_size=max_cluster_size,
-        use_lcc=use_lcc,
-        seed=seed,
+    strategy_exec = load_strategy(strategy)
+    node_id_to_community_map, parent_mapping = strategy_exec(
+        graph, max_cluster_size, use_lcc, seed
     )
 
     levels = sorted(node_id_to_community_map.keys())
@@ -52,22 +66,36 @@ def cluster_graph(
     return results
 
 
+def load_strategy(strategy: ClusterStrategyType) -> ClusterStrategy:
+    """Load strategy method definition."""
+    match strategy:
+        case ClusterStrategyType.graspologic:
+            return _compute_leiden_communities
+        case ClusterStrategyType.igraph:
+            return _compute_igraph_leiden_communities
+        case _:
+            msg = f"Unknown strategy: {strategy}"
+            raise ValueError(msg)
+
+
 # Taken from graph_intelligence & adapted
 def _compute_leiden_communities(
-    graph: nx.Graph | nx.DiGraph,
+    graph: CompactGraph,
     max_cluster_size: int,
     use_lcc: bool,
     seed: int | None = None,
 ) -> tuple[dict[int, dict[str, int]], dict[int, int]]:
     """Return Leiden root communities and their hierarchy mapping."""
     # NOTE: This import is done here to reduce the initial import time of the graphrag package
-    from graspologic.partition import hierarchical_leiden
+    # the native leiden implementation is called directly, as graspologic drops the
+    # self-loops from edge lists, but not from the networkx graphs it used to be given
+    from graspologic_native import hierarchical_leiden
 
-    if use_lcc:
-        graph = stable_largest_connected_component(graph)
+    # the edges in the order networkx lists them, so the clustering stays the same
+    edges = graph.edge_list(use_lcc=use_lcc)
 
     community_mapping = hierarchical_leiden(
-        graph, max_cluster_size=max_cluster_size, random_seed=seed
+        edges=edges, max_cluster_size=max_cluster_size, seed=seed
     )
     results: dict[int, dict[str, int]] = {}
     hierarchy: dict[int, int] = {}
@@ -80,3 +108,133 @@ def _compute_leiden_communities(
         )
 
     return results, hierarchy
+
+
+def _compute_igraph_leiden_communities(
+    graph: CompactGraph,
+    max_cluster_size: int,
+    use_lcc: bool,
+    seed: int | None = None,
+) -> tuple[dict[int, dict[str, int]], dict[int, int]]:
+    """Return Leiden root communities and their hierarchy mapping, clustered with igraph.
+
+    This builds the same hierarchy as graspologic: the graph is clustered, then every
+    community larger than `max_cluster_size` is clustered again on its own, one level
+    down, unless it cannot be split. It works on the integer node ids of the graph
+    throughout, and the LCC is taken without relabeling the nodes. Results are
+    deterministic for a given seed, but not the same as graspologic's.
+    """
+    # NOTE: This import is done here to reduce the initial import time of the graphrag package
+    import igraph
+
+    if use_lcc:
+        nodes = graph.largest_connected_component()
+        in_lcc = np.zeros(graph.node_count, dtype=bool)
+        in_lcc[nodes] = True
+        edges = in_lcc[graph.sources]
+        sources, targets = graph.sources[edges], graph.targets[edges]
+    else:
+        nodes = np.arange(graph.node_count)
+        sources, targets = graph.sources, graph.targets
+
+    results: dict[int, dict[str, int]] = {}
+    hierarchy: dict[int, int] = {}
+    next_cluster = 0
+    # the (parent, sorted node ids, edges) of the communities to cluster at each level
+    pending = [(-1, nodes, sources, targets)]
+    level = 0
+    # igraph draws from a global random number generator, seeded for the run
+    igraph.set_random_number_generator(random.Random(seed))
+    try:
+        while pending:
+            to_split = []
+            for parent, nodes, sources, targets in pending:
+                membership = _igraph_leiden(nodes, sources, targets)
+                cluster_count = int(membership.max()) + 1
+                if parent != -1 and cluster_count == 1:
+                    # the community cannot be split, so it stays as it is
+                    continue
+                first_cluster = next_cluster
+                next_cluster += cluster_count
+                hierarchy.update(
+                    dict.fromkeys(range(first_cluster, next_cluster), parent)
+                )
+                results.setdefault(level, {}).update(
+                    zip(
+                        graph.titles[nodes],
+                        (membership + first_cluster).tolist(),
+                        strict=True,
+                    )
+                )
+                to_split.extend(
+                    (first_cluster + cluster, *community)
+                    for cluster, *community in _split_large_clusters(
+                        nodes, sources, targets, membership, max_cluster_size
+                    )
+                )
+            pending = to_split
+            level += 1
+    finally:
+        igraph.set_random_number_generator(random)
+
+    return results, hierarchy
+
+
+def _igraph_leiden(
+    nodes: np.ndarray, sources: np.ndarray, targets: np.ndarray
+) -> np.ndarray:
+    """Cluster a graph by modularity, returning the community of each node, from 0."""
+    import igraph
+
+    edges = np.column_stack(
+        [
+            np.searchsorted(nodes, sources),
+            np.searchsorted(nodes, targets),
+        ]
+    )
+    partition = igraph.Graph(n=len(nodes), edges=edges).community_leiden(
+        objective_function="modularity",
+        beta=LEIDEN_RANDOMNESS,
+        n_iterations=LEIDEN_ITERATIONS,
+    )
+    return np.asarray(partition.membership)
+
+
+def _split_large_clusters(
+    nodes: np.ndarray,
+    sources: np.ndarray,
+    targets: np.ndarray,
+    membership: np.ndarray,
+    max_cluster_size: int,
+) -> list[tuple[int, np.ndarray, np.ndarray, np.ndarray]]:
+    """Get the communities larger than `max_cluster_size`, with their nodes and inner edges.
+
+    Communities are given by their index in `membership`, their nodes sorted.
+    """
+    sizes = np.bincount(membership)
+    large = sizes > max_cluster_size
+    if not large.any():
+        return []
+
+    node_order = np.argsort(membership, kind="stable")
+    cluster_nodes = np.split(nodes[node_order], np.cumsum(sizes)[:-1])
+
+    source_membership = membership[np.searchsorted(nodes, sources)]
+    target_membership = membership[np.searchsorted(nodes, targets)]
+    inner = (source_membership == target_membership) & large[source_membership]
+    edge_order = np.flatnonzero(inner)
+    edge_order = edge_order[np.argsort(source_membership[edge_order], kind="stable")]
+    edge_counts = np.bincount(source_membership[edge_order], minlength=len(sizes))
+    edge_bounds = np.cumsum(edge_counts)[:-1]
+    cluster_sources = np.split(sources[edge_order], edge_bounds)
+    cluster_targets = np.split(targets[edge_order], edge_bounds)
+
+    return [
+        (
+            int(cluster),
+            cluster_nodes[cluster],
+            cluster_sources[cluster],
+            cluster_targets[cluster],
+        )
+        for cluster in np.flatnonzero(large)
+    ]
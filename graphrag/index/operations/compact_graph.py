@@ -0,0 +1,132 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the CompactGraph model and create_compact_graph method definition."""
+
+from dataclasses import dataclass
+from functools import cached_property
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from graphrag.index.utils.stable_lcc import normalize_node_name
+
+
+@dataclass
+class CompactGraph:
+    """An undirected graph held as arrays of integer node ids.
+
+    Nodes are numbered in order of first appearance in the edges, and the edges are
+    kept once each, in order of first appearance, the way `create_graph` builds its
+    networkx graph. This keeps what is computed from it (degrees, connected
+    components, clustering input) the same as what networkx computes, without the
+    memory and time a networkx graph takes on large graphs.
+    """
+
+    titles: np.ndarray
+    """The title of each node, by node id."""
+
+    sources: np.ndarray
+    """The node id of the first end of each edge."""
+
+    targets: np.ndarray
+    """The node id of the second end of each edge."""
+
+    @property
+    def node_count(self) -> int:
+        """Get the number of nodes."""
+        return len(self.titles)
+
+    @cached_property
+    def degree(self) -> np.ndarray:
+        """Get the degree of each node, by node id (self-loops count twice, as in networkx)."""
+        return np.bincount(
+            np.concatenate([self.sources, self.targets]), minlength=self.node_count
+        )
+
+    def largest_connected_component(self) -> np.ndarray:
+        """Get the node ids of the largest connected component.
+
+        Ties go to the component with the lowest node id, as in networkx.
+        """
+        labels = np.arange(self.node_count)
+        while True:
+            # hook each end of an edge to the lower label, then shortcut the labels so
+            # every node points to the lowest node id of its component found so far
+            lower = np.minimum(labels[self.sources], labels[self.targets])
+            np.minimum.at(labels, self.sources, lower)
+            np.minimum.at(labels, self.targets, lower)
+            while True:
+                shortcut = labels[labels]
+                if np.array_equal(shortcut, labels):
+                    break
+                labels = shortcut
+            if np.array_equal(labels[self.sources], labels[self.targets]):
+                break
+        largest = np.argmax(np.bincount(labels, minlength=self.node_count))
+        return np.flatnonzero(labels == largest)
+
+    def edge_list(self, use_lcc: bool = False) -> list[tuple[str, str, float]]:
+        """Get the edges as (source, target, weight) tuples, in networkx edge order.
+
+        With `use_lcc`, only the edges of the largest connected component are listed,
+        with normalized node titles and in sorted order, as they are in
+        `stable_largest_connected_component`.
+        """
+        low = np.minimum(self.sources, self.targets)
+        high = np.maximum(self.sources, self.targets)
+        if not use_lcc:
+            # edges are listed from their lowest node, in order of appearance
+            order = np.argsort(low, kind="stable")
+            sources = self.titles[low[order]]
+            targets = self.titles[high[order]]
+            return list(zip(sources, targets, np.ones(len(order)), strict=True))
+
+        in_lcc = np.zeros(self.node_count, dtype=bool)
+        in_lcc[self.largest_connected_component()] = True
+        keep = in_lcc[low]
+        names = pd.Series(self.titles).map(normalize_node_name).to_numpy()
+        sources = names[low[keep]]
+        targets = names[high[keep]]
+        swap = sources > targets
+        edges = pd.DataFrame({
+            "source": np.where(swap, targets, sources),
+            "target": np.where(swap, sources, targets),
+        })
+        edges = edges.drop_duplicates().sort_values(["source", "target"])
+        return list(
+            zip(edges["source"], edges["target"], np.ones(len(edges)), strict=True)
+        )
+
+    def to_networkx(self, with_edges: bool = True) -> nx.Graph:
+        """Create the networkx graph, with the nodes only if `with_edges` is False."""
+        graph = nx.Graph()
+        graph.add_nodes_from(self.titles)
+        if with_edges:
+            graph.add_edges_from(
+                zip(self.titles[self.sources], self.titles[self.targets], strict=True)
+            )
+        return graph
+
+
+def create_compact_graph(
+    edges: pd.DataFrame, source: str = "source", target: str = "target"
+) -> CompactGraph:
+    """Create a compact graph from an edges dataframe."""
+    ends = np.column_stack([edges[source].to_numpy(), edges[target].to_numpy()])
+    codes, titles = pd.factorize(ends.ravel(), use_na_sentinel=False)
+    codes = codes.reshape(-1, 2)
+
+    # an undirected edge is kept once, where it first appears
+    node_count = len(titles)
+    low = np.minimum(codes[:, 0], codes[:, 1]).astype(np.int64)
+    high = np.maximum(codes[:, 0], codes[:, 1]).astype(np.int64)
+    _, first_seen = np.unique(low * node_count + high, return_index=True)
+    first_seen.sort()
+
+    return CompactGraph(
+        titles=np.asarray(titles, dtype=object),
+        sources=codes[first_seen, 0],
+        targets=codes[first_seen, 1],
+    )
@@ -0,0 +1,160 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Near-duplicate text unit detection with MinHash signatures and locality-sensitive hashing."""
+
+import re
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+import graphrag.data_model.schemas as schemas
+
+# the probability two texts as similar as the threshold share a bucket in at least
+# one band, and so get compared
+_CANDIDATE_RECALL = 0.99
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def find_duplicates(
+    texts: list[str] | pd.Series,
+    threshold: float,
+    num_perm: int = 128,
+    shingle_size: int = 5,
+    seed: int = 0,
+) -> np.ndarray:
+    """Find the texts that are near-duplicates of an earlier one.
+
+    The texts are compared on the sets of their `shingle_size` character shingles,
+    ignoring case and runs of whitespace. MinHash signatures of `num_perm` values are
+    split into bands for locality-sensitive hashing, so only the texts sharing a band
+    get compared; the number of bands is chosen so that texts whose estimated Jaccard
+    similarity is `threshold` nearly always do.
+
+    A text is a duplicate of the first earlier text, that is not a duplicate itself,
+    with an estimated similarity of at least `threshold`. Returns, for every text, the
+    index of the text it duplicates, or -1.
+    """
+    signatures = minhash_signatures(texts, num_perm, shingle_size, seed)
+    bands, rows = _lsh_bands(num_perm, threshold)
+    buckets = np.empty((len(signatures), bands), dtype=np.int64)
+    for band in range(bands):
+        values = np.ascontiguousarray(signatures[:, band * rows : (band + 1) * rows])
+        keys = values.view(np.dtype((np.void, values.dtype.itemsize * rows)))
+        # bucket ids of the different bands do not overlap
+        buckets[:, band] = np.unique(keys, return_inverse=True)[1].ravel()
+        buckets[:, band] += band * len(signatures)
+
+    duplicate_of = np.full(len(signatures), -1, dtype=np.int64)
+    canonical: dict[int, list[int]] = defaultdict(list)
+    min_matches = threshold * num_perm
+    for index, text_buckets in enumerate(buckets.tolist()):
+        for bucket in text_buckets:
+            match = next(
+                (
+                    other
+                    for other in canonical.get(bucket, [])
+                    if np.count_nonzero(signatures[other] == signatures[index])
+                    >= min_matches
+                ),
+                None,
+            )
+            if match is not None:
+                duplicate_of[index] = match
+                break
+        else:
+            for bucket in text_buckets:
+                canonical[bucket].append(index)
+    return duplicate_of
+
+
+def minhash_signatures(
+    texts: list[str] | pd.Series, num_perm: int, shingle_size: int, seed: int = 0
+) -> np.ndarray:
+    """Get the MinHash signatures of the character shingles of the texts, as a (texts, num_perm) array.
+
+    The shingles are hashed from the code points of the text, so the signatures are the
+    same from one run to the next.
+    """
+    rng = np.random.default_rng(seed)
+    # multiply-shift hashing of 32-bit keys, with odd multipliers
+    multipliers = rng.integers(0, 2**63, num_perm, dtype=np.uint64) * 2 + 1
+    increments = rng.integers(0, 2**63, num_perm, dtype=np.uint64)
+    signatures = np.empty((len(texts), num_perm), dtype=np.uint32)
+    for index, text in enumerate(texts):
+        hashes = np.multiply.outer(_shingle_hashes(text, shingle_size), multipliers)
+        hashes += increments
+        # the high bits are the hash, taking them after the minimum gives the same one
+        signatures[index] = hashes.min(axis=0) >> np.uint64(32)
+    return signatures
+
+
+def _shingle_hashes(text: str, shingle_size: int) -> np.ndarray:
+    """Get the distinct 32-bit hashes of the character shingles of a text."""
+    normalized = _WHITESPACE.sub(" ", f"{text}").strip().lower()
+    code_points = np.frombuffer(normalized.encode("utf-32-le"), dtype=np.uint32)
+    # a text shorter than a shingle is a shingle of its own
+    size = min(shingle_size, len(code_points))
+    count = len(code_points) - size + 1
+    hashes = np.zeros(count, dtype=np.uint64)
+    for offset in range(size):
+        hashes = (
+            hashes * np.uint64(0x100000001B3) + code_points[offset : offset + count]
+        )
+    return np.unique((hashes ^ (hashes >> np.uint64(32))) & np.uint64(0xFFFFFFFF))
+
+
+def _lsh_bands(num_perm: int, threshold: float) -> tuple[int, int]:
+    """Get the most selective split of the signatures into bands that still finds the texts similar enough."""
+    for rows in range(num_perm, 0, -1):
+        bands = num_perm // rows
+        recall = 1 - (1 - threshold**rows) ** bands
+        if num_perm % rows == 0 and recall >= _CANDIDATE_RECALL:
+            return bands, rows
+    return num_perm, 1
+
+
+def get_duplicates(text_units: pd.DataFrame, id_column: str) -> pd.Series:
+    """Get the ids of the text units the near-duplicate text units duplicate, by the ids of the near-duplicates.
+
+    Empty unless the text units went through the near-duplicate detection.
+    """
+    if schemas.DUPLICATE_OF not in text_units:
+        return pd.Series(dtype=object)
+    duplicates = text_units[text_units[schemas.DUPLICATE_OF].notna()]
+    return pd.Series(
+        duplicates[schemas.DUPLICATE_OF].to_numpy(),
+        index=duplicates[id_column].to_numpy(),
+        dtype=object,
+    )
+
+
+def copy_to_duplicates(
+    records: pd.DataFrame, duplicate_of: pd.Series, column: str
+) -> pd.DataFrame:
+    """Copy the records extracted from canonical text units to their duplicates.
+
+    `duplicate_of` maps the ids of the duplicate text units to the ids of their
+    canonical ones, and `column` holds the comma-separated text unit ids a record was
+    extracted from, which are replaced by the ids of the duplicates in the copies.
+    """
+    if records.empty or duplicate_of.empty:
+        return records.iloc[:0]
+    pairs = pd.DataFrame({
+        "_canonical": duplicate_of.to_numpy(),
+        "_duplicate": duplicate_of.index.to_numpy(),
+    })
+    sources = records[column].astype(str).str.split(",").str[0].str.strip()
+    copies = records.assign(_canonical=sources.to_numpy()).merge(pairs, on="_canonical")
+    copies[column] = [
+        source.replace(canonical, duplicate)
+        for source, canonical, duplicate in zip(
+            copies[column].astype(str),
+            copies["_canonical"],
+            copies["_duplicate"],
+            strict=True,
+        )
+    ]
+    return copies.drop(columns=["_canonical", "_duplicate"])
@@ -3,6 +3,7 @@
 
 """A module containing embed_text, load_strategy and create_row_from_embedding_data methods definition."""
 
+import asyncio
 import logging
 from enum import Enum
 from typing import Any
@@ -13,7 +14,11 @@ import pandas as pd
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.embeddings import create_collection_name
-from graphrag.index.operations.embed_text.strategies.typing import TextEmbeddingStrategy
+from graphrag.index.operations.embed_text.embedding_store import TextEmbeddingStore
+from graphrag.index.operations.embed_text.strategies.typing import (
+    TextEmbeddingResult,
+    TextEmbeddingStrategy,
+)
 from graphrag.vector_stores.base import BaseVectorStore, VectorStoreDocument
 from graphrag.vector_stores.factory import VectorStoreFactory
 
@@ -44,6 +49,8 @@ async def embed_text(
     embedding_name: str,
     id_column: str = "id",
     title_column: str | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+    embedding_store: TextEmbeddingStore | None = None,
 ):
     """
     Embed a piece of text into a vector space. The operation outputs a new column containing a mapping between doc_id and vector.
@@ -75,7 +82,16 @@ async def embed_text(
             type: lancedb # The type of vector store to use, available options are: azure_ai_search, lancedb
             <...>
     ```
+
+    Embedding requests are bounded by `semaphore`, which can be shared between
+    concurrent embed_text calls; by default one is created from `num_threads`.
+    When an `embedding_store` is given, texts it has already embedded are not sent again.
     """
+    strategy = {
+        **strategy,
+        "semaphore": semaphore or asyncio.Semaphore(strategy.get("num_threads", 4)),
+        "embedding_store": embedding_store,
+    }
     vector_store_config = strategy.get("vector_store")
 
     if vector_store_config:
@@ -163,24 +179,49 @@ async def _text_embed_with_vector_store(
         msg = f"Column {id_column} not found in input dataframe with columns {input.columns}"
         raise ValueError(msg)
 
-    total_rows = 0
-    for row in input[embed_column]:
-        if isinstance(row, list):
-            total_rows += len(row)
-        else:
-            total_rows += 1
+    batches = [
+        input.iloc[start : start + insert_batch_size]
+        for start in range(0, input.shape[0], insert_batch_size)
+    ]
+
+    async def embed_batch(batch: pd.DataFrame) -> TextEmbeddingResult:
+        texts: list[str] = batch[embed_column].to_numpy().tolist()
+        return await strategy_exec(texts, callbacks, cache, strategy_config)
+
+    # all batches are queued on the shared request semaphore up front; each one is
+    # loaded into the vector store, in order, while later batches are still embedding
+    embed_tasks = [asyncio.create_task(embed_batch(batch)) for batch in batches]
+    try:
+        return await _load_embedded_batches(
+            batches,
+            embed_tasks,
+            vector_store,
+            overwrite,
+            embed_column,
+            title,
+            id_column,
+        )
+    finally:
+        for task in embed_tasks:
+            task.cancel()
 
-    i = 0
-    starting_index = 0
 
+async def _load_embedded_batches(
+    batches: list[pd.DataFrame],
+    embed_tasks: list[asyncio.Task[TextEmbeddingResult]],
+    vector_store: BaseVectorStore,
+    overwrite: bool,
+    embed_column: str,
+    title_column: str,
+    id_column: str,
+) -> list[list[float]]:
     all_results = []
 
-    while insert_batch_size * i < input.shape[0]:
-        batch = input.iloc[insert_batch_size * i : insert_batch_size * (i + 1)]
+    for i, (batch, embed_task) in enumerate(zip(batches, embed_tasks, strict=True)):
         texts: list[str] = batch[embed_column].to_numpy().tolist()
-        titles: list[str] = batch[title].to_numpy().tolist()
+        titles: list[str] = batch[title_column].to_numpy().tolist()
         ids: list[str] = batch[id_column].to_numpy().tolist()
-        result = await strategy_exec(texts, callbacks, cache, strategy_config)
+        result = await embed_task
         if result.embeddings:
             embeddings = [
                 embedding for embedding in result.embeddings if embedding is not None
@@ -202,9 +243,9 @@ async def _text_embed_with_vector_store(
             )
             documents.append(document)
 
-        vector_store.load_documents(documents, overwrite and i == 0)
-        starting_index += len(documents)
-        i += 1
+        await asyncio.to_thread(
+            vector_store.load_documents, documents, overwrite and i == 0
+        )
 
     return all_results
 
@@ -214,7 +255,11 @@ def _create_vector_store(
 ) -> BaseVectorStore:
     vector_store_type: str = str(vector_store_config.get("type"))
     if collection_name:
-        vector_store_config.update({"collection_name": collection_name})
+        # copy, as the config is shared by embeddings that run concurrently
+        vector_store_config = {
+            **vector_store_config,
+            "collection_name": collection_name,
+        }
 
     vector_store = VectorStoreFactory().create_vector_store(
         vector_store_type, kwargs=vector_store_config
@@ -0,0 +1,184 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the TextEmbeddingStore class definition."""
+
+import asyncio
+import base64
+import hashlib
+import unicodedata
+from collections.abc import Awaitable, Callable
+
+import numpy as np
+
+from graphrag.cache.pipeline_cache import PipelineCache
+
+MANIFEST_KEY = "batches"
+"""The cache key of the list of batches stored so far."""
+
+
+class TextEmbeddingStore:
+    """
+    Content-addressed store of text embeddings.
+
+    Vectors are keyed by the hash of the normalized text together with the model and
+    encoding that produced them, so they are reused across fields and across
+    (incremental) runs. A text that is being embedded by one caller is awaited by the
+    others instead of being sent twice.
+
+    The vectors are persisted in the pipeline cache one embedded batch at a time, as
+    the list of the batch keys and a single float32 array. A manifest lists the
+    batches, and is written once by flush, after the run's batches are stored. The
+    keys of every batch are read when the store is first used, and the vectors of a
+    batch only once one of them is needed.
+    """
+
+    def __init__(self, cache: PipelineCache):
+        self._cache = cache.child("text_embedding_store")
+        self._vectors: dict[str, np.ndarray] = {}
+        self._pending: dict[str, asyncio.Future[np.ndarray]] = {}
+        self._batches: list[str] | None = None
+        self._batch_keys: dict[str, list[str]] = {}
+        self._locations: dict[str, str] = {}
+        self._loading: dict[str, asyncio.Task[None]] = {}
+        self._open_lock = asyncio.Lock()
+        self._unflushed = False
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(text: str, model: str, encoding: str) -> str:
+        """Get the store key for a text embedded with the given model and encoding."""
+        normalized = unicodedata.normalize("NFC", text).strip()
+        content = f"{model}\x1f{encoding}\x1f{normalized}"
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    async def get_or_embed(
+        self,
+        keys: list[str],
+        texts: list[str],
+        embed: Callable[[list[str]], Awaitable[list[list[float]]]],
+    ) -> list[list[float]]:
+        """Get the vectors for texts, calling embed only for the ones not seen before."""
+        await self._open()
+        waiting: dict[str, asyncio.Future[np.ndarray]] = {}
+        claimed: dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key in self._vectors or key in waiting or key in claimed:
+                continue
+            if key in self._pending:
+                waiting[key] = self._pending[key]
+            else:
+                self._pending[key] = asyncio.get_running_loop().create_future()
+                claimed[key] = text
+
+        try:
+            batches = {
+                self._locations[key] for key in claimed if key in self._locations
+            }
+            await asyncio.gather(*[self._load(batch) for batch in batches])
+            unseen = {
+                key: text for key, text in claimed.items() if key not in self._vectors
+            }
+
+            self.misses += len(unseen)
+            self.hits += len(keys) - len(unseen)
+            if unseen:
+                vectors = await embed(list(unseen.values()))
+                await self._put(dict(zip(unseen, vectors, strict=True)))
+        except BaseException as e:
+            self._release(list(claimed), e)
+            raise
+
+        for future in waiting.values():
+            await future
+        return [self._vectors[key].tolist() for key in keys]
+
+    async def flush(self) -> None:
+        """Write the manifest, if batches were stored since it was last written."""
+        # batches are only added once stored, so the manifest lists complete ones
+        if not self._unflushed:
+            return
+        self._unflushed = False
+        await self._cache.set(MANIFEST_KEY, list(self._batches or []))
+
+    def stats(self) -> dict[str, float]:
+        """Get the hit and miss counts of the store."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    async def _open(self) -> None:
+        async with self._open_lock:
+            if self._batches is not None:
+                return
+            batches = await self._cache.get(MANIFEST_KEY) or []
+            batch_keys = await asyncio.gather(
+                *[self._cache.get(f"{batch}.keys") for batch in batches]
+            )
+            self._batches = []
+            for batch, keys in zip(batches, batch_keys, strict=True):
+                if keys is not None:
+                    self._add_batch(batch, keys)
+
+    def _add_batch(self, batch: str, keys: list[str]) -> None:
+        if self._batches is not None and batch not in self._batch_keys:
+            self._batches.append(batch)
+        self._batch_keys[batch] = keys
+        # a text embedded again, as its vectors were lost, is read from the latest batch
+        for key in keys:
+            self._locations[key] = batch
+
+    async def _load(self, batch: str) -> None:
+        if batch not in self._loading:
+            self._loading[batch] = asyncio.create_task(self._read_batch(batch))
+        # a cancelled caller leaves the batch loading for the others
+        await asyncio.shield(self._loading[batch])
+
+    async def _read_batch(self, batch: str) -> None:
+        value = await self._cache.get(f"{batch}.vectors")
+        if value is None:
+            # the vectors are gone, the texts are embedded again
+            return
+        keys = self._batch_keys[batch]
+        vectors = np.frombuffer(base64.b64decode(value), dtype=np.float32)
+        for key, vector in zip(keys, vectors.reshape(len(keys), -1), strict=True):
+            if key not in self._vectors:
+                self._resolve(key, vector)
+
+    async def _put(self, vectors: dict[str, list[float]]) -> None:
+        keys = list(vectors)
+        array = np.asarray(list(vectors.values()), dtype=np.float32)
+        for key, vector in zip(keys, array, strict=True):
+            self._resolve(key, vector)
+        # the keys are all the same length, so their concatenation identifies the batch
+        batch = hashlib.sha256("".join(keys).encode("ascii")).hexdigest()
+        await asyncio.gather(
+            self._cache.set(
+                f"{batch}.vectors", base64.b64encode(array.tobytes()).decode("ascii")
+            ),
+            self._cache.set(f"{batch}.keys", keys),
+        )
+        self._add_batch(batch, keys)
+        self._unflushed = True
+
+    def _resolve(self, key: str, vector: np.ndarray) -> None:
+        self._vectors[key] = vector
+        future = self._pending.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(vector)
+
+    def _release(self, keys: list[str], error: BaseException) -> None:
+        for key in keys:
+            future = self._pending.pop(key, None)
+            if future is None or future.done():
+                continue
+            if isinstance(error, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(error)
+                # mark it retrieved, there may be no other caller waiting on it
+                future.exception()
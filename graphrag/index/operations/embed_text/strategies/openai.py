@@ -12,6 +12,7 @@ import numpy as np
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.language_model_config import LanguageModelConfig
+from graphrag.index.operations.embed_text.embedding_store import TextEmbeddingStore
 from graphrag.index.operations.embed_text.strategies.typing import TextEmbeddingResult
 from graphrag.index.text_splitting.text_splitting import TokenTextSplitter
 from graphrag.index.utils.is_null import is_null
@@ -37,35 +38,51 @@ async def run(
     llm_config = args["llm"]
     llm_config = LanguageModelConfig(**args["llm"])
     splitter = _get_splitter(llm_config, batch_max_tokens)
+    # the vectors kept in the embedding store are not cached a second time by the model
+    embedding_store: TextEmbeddingStore | None = args.get("embedding_store")
     model = ModelManager().get_or_create_embedding_model(
-        name="text_embedding",
+        name="text_embedding" if embedding_store is None else "text_embedding_stored",
         model_type=llm_config.type,
         config=llm_config,
         callbacks=callbacks,
-        cache=cache,
+        cache=cache if embedding_store is None else None,
+    )
+    semaphore: asyncio.Semaphore = args.get("semaphore") or asyncio.Semaphore(
+        args.get("num_threads", 4)
     )
-    semaphore: asyncio.Semaphore = asyncio.Semaphore(args.get("num_threads", 4))
 
     # Break up the input texts. The sizes here indicate how many snippets are in each input text
     texts, input_sizes = _prepare_embed_texts(input, splitter)
-    text_batches = _create_text_batches(
-        texts,
-        batch_size,
-        batch_max_tokens,
-        splitter,
-    )
-    log.info(
-        "embedding %d inputs via %d snippets using %d batches. max_batch_size=%d, max_tokens=%d",
-        len(input),
-        len(texts),
-        len(text_batches),
-        batch_size,
-        batch_max_tokens,
-    )
-    ticker = progress_ticker(callbacks.progress, len(text_batches))
 
-    # Embed each chunk of snippets
-    embeddings = await _execute(model, text_batches, ticker, semaphore)
+    async def embed_snippets(snippets: list[str]) -> list[list[float]]:
+        text_batches = _create_text_batches(
+            snippets,
+            batch_size,
+            batch_max_tokens,
+            splitter,
+        )
+        log.info(
+            "embedding %d inputs via %d snippets using %d batches. max_batch_size=%d, max_tokens=%d",
+            len(input),
+            len(snippets),
+            len(text_batches),
+            batch_size,
+            batch_max_tokens,
+        )
+        ticker = progress_ticker(callbacks.progress, len(text_batches))
+
+        # Embed each chunk of snippets
+        return await _execute(model, text_batches, ticker, semaphore)
+
+    # only snippets that are not in the embedding store yet are batched and sent
+    if embedding_store is not None:
+        keys = [
+            TextEmbeddingStore.key(text, llm_config.model, llm_config.encoding_model)
+            for text in texts
+        ]
+        embeddings = await embedding_store.get_or_embed(keys, texts, embed_snippets)
+    else:
+        embeddings = await embed_snippets(texts)
     embeddings = _reconstitute_embeddings(embeddings, input_sizes)
 
     return TextEmbeddingResult(embeddings=embeddings)
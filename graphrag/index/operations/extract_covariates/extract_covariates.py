@@ -15,11 +15,13 @@ from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.defaults import graphrag_config_defaults
 from graphrag.config.enums import AsyncType
 from graphrag.config.models.language_model_config import LanguageModelConfig
+from graphrag.index.operations.deduplicate_text_units import get_duplicates
 from graphrag.index.operations.extract_covariates.claim_extractor import ClaimExtractor
 from graphrag.index.operations.extract_covariates.typing import (
     Covariate,
     CovariateExtractionResult,
 )
+from graphrag.index.utils.concurrency_limiter import AdaptiveConcurrencyLimiter
 from graphrag.index.utils.derive_from_rows import derive_from_rows
 from graphrag.language_model.manager import ModelManager
 
@@ -39,6 +41,7 @@ async def extract_covariates(
     async_mode: AsyncType = AsyncType.AsyncIO,
     entity_types: list[str] | None = None,
     num_threads: int = 4,
+    limiter: AdaptiveConcurrencyLimiter | None = None,
 ):
     """Extract claims from a piece of text."""
     log.debug("extract_covariates strategy=%s", strategy)
@@ -54,6 +57,14 @@ async def extract_covariates(
     if strategy_config.get("llm") and strategy_config["llm"]["max_retries"] == -1:
         strategy_config["llm"]["max_retries"] = len(input)
 
+    # near-duplicate text units get the claims of the text unit they duplicate
+    duplicate_of = get_duplicates(input, "id")
+    rows = (
+        input[~input["id"].isin(duplicate_of.index)]
+        if not duplicate_of.empty
+        else input
+    )
+
     async def run_strategy(row):
         text = row[column]
         result = await run_extract_claims(
@@ -64,19 +75,25 @@ async def extract_covariates(
             cache=cache,
             strategy_config=strategy_config,
         )
-        return [
-            create_row_from_claim_data(row, item, covariate_type)
-            for item in result.covariate_data
-        ]
+        return result.covariate_data
 
     results = await derive_from_rows(
-        input,
+        rows,
         run_strategy,
         callbacks,
         async_type=async_mode,
         num_threads=num_threads,
+        limiter=limiter,
+        # the longest texts are extracted first, so they do not stretch the end of the run
+        costs=rows[column].str.len().to_numpy(),
+        name="extract_claims",
     )
-    return pd.DataFrame([item for row in results for item in row or []])
+    claims = dict(zip(rows["id"], results, strict=True))
+    return pd.DataFrame([
+        create_row_from_claim_data(row, item, covariate_type)
+        for _, row in input.iterrows()
+        for item in claims.get(duplicate_of.get(row["id"], row["id"])) or []
+    ])
 
 
 def create_row_from_claim_data(row, covariate_data: Covariate, covariate_type: str):
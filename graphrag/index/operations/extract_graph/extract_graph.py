@@ -11,12 +11,18 @@ import pandas as pd
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
+from graphrag.index.operations.deduplicate_text_units import (
+    copy_to_duplicates,
+    get_duplicates,
+)
 from graphrag.index.operations.extract_graph.typing import (
     Document,
     EntityExtractStrategy,
     ExtractEntityStrategyType,
 )
+from graphrag.index.utils.concurrency_limiter import AdaptiveConcurrencyLimiter
 from graphrag.index.utils.derive_from_rows import derive_from_rows
+from graphrag.index.utils.tokens import num_tokens_from_string
 
 log = logging.getLogger(__name__)
 
@@ -34,6 +40,7 @@ async def extract_graph(
     async_mode: AsyncType = AsyncType.AsyncIO,
     entity_types=DEFAULT_ENTITY_TYPES,
     num_threads: int = 4,
+    limiter: AdaptiveConcurrencyLimiter | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Extract entities from a piece of text.
@@ -70,6 +77,7 @@ async def extract_graph(
         record_delimiter: "##" # Optional, the delimiter to use for the LLM to mark a record
 
         encoding_name: cl100k_base # Optional, The encoding to use for the LLM with gleanings
+        batch_max_tokens: 0 # Optional, pack consecutive text units into one extraction request of up to this many tokens
 
         llm: # The configuration for the LLM
             type: openai # the type of llm to use, available options are: openai, azure, openai_chat, azure_openai_chat.  The last two being chat based LLMs.
@@ -98,14 +106,40 @@ async def extract_graph(
     if strategy_config.get("llm") and strategy_config["llm"]["max_retries"] == -1:
         strategy_config["llm"]["max_retries"] = len(text_units)
 
+    # near-duplicate text units get copies of the graph of the text unit they duplicate
+    duplicate_of = get_duplicates(text_units, id_column)
+    if not duplicate_of.empty:
+        text_units = text_units[~text_units[id_column].isin(duplicate_of.index)]
+
+    # small text units can be packed into a single extraction request
+    batch_max_tokens = strategy_config.get("batch_max_tokens", 0)
+    rows = (
+        _batch_documents(
+            text_units,
+            text_column,
+            id_column,
+            batch_max_tokens,
+            strategy_config.get("encoding_name"),
+        )
+        if batch_max_tokens > 0
+        else text_units
+    )
+    # the longest texts are extracted first, so they do not stretch the end of the run
+    costs = (
+        rows["n_tokens"] if batch_max_tokens > 0 else rows[text_column].str.len()
+    ).to_numpy()
+
     num_started = 0
 
     async def run_strategy(row):
         nonlocal num_started
-        text = row[text_column]
-        id = row[id_column]
+        docs = (
+            row["documents"]
+            if batch_max_tokens > 0
+            else [Document(text=row[text_column], id=row[id_column])]
+        )
         result = await strategy_exec(
-            [Document(text=text, id=id)],
+            docs,
             entity_types,
             callbacks,
             cache,
@@ -115,11 +149,14 @@ async def extract_graph(
         return [result.entities, result.relationships, result.graph]
 
     results = await derive_from_rows(
-        text_units,
+        rows,
         run_strategy,
         callbacks,
         async_type=async_mode,
         num_threads=num_threads,
+        limiter=limiter,
+        costs=costs,
+        name="extract_graph",
     )
 
     entity_dfs = []
@@ -129,6 +166,20 @@ async def extract_graph(
             entity_dfs.append(pd.DataFrame(result[0]))
             relationship_dfs.append(pd.DataFrame(result[1]))
 
+    if entity_dfs and not duplicate_of.empty:
+        entity_dfs.append(
+            copy_to_duplicates(
+                pd.concat(entity_dfs, ignore_index=True), duplicate_of, "source_id"
+            )
+        )
+        relationship_dfs.append(
+            copy_to_duplicates(
+                pd.concat(relationship_dfs, ignore_index=True),
+                duplicate_of,
+                "source_id",
+            )
+        )
+
     entities = _merge_entities(entity_dfs)
     relationships = _merge_relationships(relationship_dfs)
 
@@ -150,6 +201,29 @@ def _load_strategy(strategy_type: ExtractEntityStrategyType) -> EntityExtractStr
             raise ValueError(msg)
 
 
+def _batch_documents(
+    text_units: pd.DataFrame,
+    text_column: str,
+    id_column: str,
+    max_tokens: int,
+    encoding_name: str | None,
+) -> pd.DataFrame:
+    """Pack consecutive text units into batches of documents of up to max_tokens tokens.
+
+    A text unit longer than max_tokens gets a batch of its own.
+    """
+    batches: list[list[Document]] = []
+    batch_tokens: list[int] = []
+    for text, id in zip(text_units[text_column], text_units[id_column], strict=True):
+        tokens = num_tokens_from_string(text, encoding_name=encoding_name)
+        if not batches or batch_tokens[-1] + tokens > max_tokens:
+            batches.append([])
+            batch_tokens.append(0)
+        batches[-1].append(Document(text=text, id=id))
+        batch_tokens[-1] += tokens
+    return pd.DataFrame({"documents": batches, "n_tokens": batch_tokens})
+
+
 def _merge_entities(entity_dfs) -> pd.DataFrame:
     all_entities = pd.concat(entity_dfs, ignore_index=True)
     return (
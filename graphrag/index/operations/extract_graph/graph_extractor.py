@@ -18,6 +18,9 @@ from graphrag.index.typing.error_handler import ErrorHandlerFn
 from graphrag.index.utils.string import clean_str
 from graphrag.language_model.protocol.base import ChatModel
 from graphrag.prompts.index.extract_graph import (
+    BATCH_CONTINUE_PROMPT,
+    BATCH_INPUT_TEXT,
+    BATCH_TEXT_UNIT,
     CONTINUE_PROMPT,
     GRAPH_EXTRACTION_PROMPT,
     LOOP_PROMPT,
@@ -104,26 +107,9 @@ class GraphExtractor:
         self, texts: list[str], prompt_variables: dict[str, Any] | None = None
     ) -> GraphExtractionResult:
         """Call method definition."""
-        if prompt_variables is None:
-            prompt_variables = {}
         all_records: dict[int, str] = {}
         source_doc_map: dict[int, str] = {}
-
-        # Wire defaults into the prompt variables
-        prompt_variables = {
-            **prompt_variables,
-            self._tuple_delimiter_key: prompt_variables.get(self._tuple_delimiter_key)
-            or DEFAULT_TUPLE_DELIMITER,
-            self._record_delimiter_key: prompt_variables.get(self._record_delimiter_key)
-            or DEFAULT_RECORD_DELIMITER,
-            self._completion_delimiter_key: prompt_variables.get(
-                self._completion_delimiter_key
-            )
-            or DEFAULT_COMPLETION_DELIMITER,
-            self._entity_types_key: ",".join(
-                prompt_variables[self._entity_types_key] or DEFAULT_ENTITY_TYPES
-            ),
-        }
+        prompt_variables = self._wire_prompt_variables(prompt_variables)
 
         for doc_index, text in enumerate(texts):
             try:
@@ -153,25 +139,127 @@ class GraphExtractor:
             source_docs=source_doc_map,
         )
 
+    async def extract_batch(
+        self, texts: list[str], prompt_variables: dict[str, Any] | None = None
+    ) -> list[nx.Graph]:
+        """Extract a graph from each text, sending all the texts in a single request.
+
+        The texts are numbered in the input, and the model is asked to mark where the
+        records of each one start, in its first response and in every gleaning, so they
+        are parsed back into one graph per text, each with a `source_id` of 0. Records
+        that do not follow a mark for one of the texts are dropped.
+        """
+        prompt_variables = self._wire_prompt_variables(prompt_variables)
+        tuple_delimiter = prompt_variables[self._tuple_delimiter_key]
+        record_delimiter = prompt_variables[self._record_delimiter_key]
+        input_text = BATCH_INPUT_TEXT.format(
+            text_unit_count=len(texts),
+            tuple_delimiter=tuple_delimiter,
+            text_units="\n\n".join(
+                BATCH_TEXT_UNIT.format(number=number, text=text)
+                for number, text in enumerate(texts, start=1)
+            ),
+        )
+        continue_prompt = self._continue_prompt + BATCH_CONTINUE_PROMPT.format(
+            tuple_delimiter=tuple_delimiter
+        )
+        try:
+            responses = await self._extract(
+                input_text, prompt_variables, continue_prompt
+            )
+        except Exception as e:
+            log.exception("error extracting graph")
+            self._on_error(
+                e,
+                traceback.format_exc(),
+                {
+                    "doc_index": list(range(len(texts))),
+                    "text": input_text,
+                },
+            )
+            return [nx.Graph() for _ in texts]
+
+        doc_records: list[list[str]] = [[] for _ in texts]
+        marker = re.compile(
+            rf'\(\s*"text_unit"\s*{re.escape(tuple_delimiter)}\s*(\d+)\s*\)'
+        )
+        unmarked = 0
+        # every response starts with no text unit, a gleaning does not continue the
+        # text unit the previous response ended with
+        for response in responses:
+            # splits into the records before the first mark, then (number, records) pairs
+            parts = marker.split(response)
+            doc_index = None
+            unmarked += _count_records(parts[0])
+            for number, records in zip(parts[1::2], parts[2::2], strict=True):
+                doc_index = int(number) - 1 if 0 < int(number) <= len(texts) else None
+                if doc_index is None:
+                    unmarked += _count_records(records)
+                else:
+                    doc_records[doc_index].append(records)
+        if unmarked > 0:
+            log.warning(
+                "dropped %d records of a batched graph extraction not marked with one of its %d text units",
+                unmarked,
+                len(texts),
+            )
+
+        return [
+            await self._process_results(
+                {0: record_delimiter.join(records)}, tuple_delimiter, record_delimiter
+            )
+            for records in doc_records
+        ]
+
+    def _wire_prompt_variables(
+        self, prompt_variables: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """Wire defaults into the prompt variables."""
+        if prompt_variables is None:
+            prompt_variables = {}
+        return {
+            **prompt_variables,
+            self._tuple_delimiter_key: prompt_variables.get(self._tuple_delimiter_key)
+            or DEFAULT_TUPLE_DELIMITER,
+            self._record_delimiter_key: prompt_variables.get(self._record_delimiter_key)
+            or DEFAULT_RECORD_DELIMITER,
+            self._completion_delimiter_key: prompt_variables.get(
+                self._completion_delimiter_key
+            )
+            or DEFAULT_COMPLETION_DELIMITER,
+            self._entity_types_key: ",".join(
+                prompt_variables[self._entity_types_key] or DEFAULT_ENTITY_TYPES
+            ),
+        }
+
     async def _process_document(
         self, text: str, prompt_variables: dict[str, str]
     ) -> str:
+        return "".join(await self._extract(text, prompt_variables))
+
+    async def _extract(
+        self,
+        text: str,
+        prompt_variables: dict[str, str],
+        continue_prompt: str | None = None,
+    ) -> list[str]:
+        """Get the extraction response for a text, followed by the gleaning responses."""
         response = await self._model.achat(
             self._extraction_prompt.format(**{
                 **prompt_variables,
                 self._input_text_key: text,
             }),
         )
-        results = response.output.content or ""
+        results = [response.output.content or ""]
 
         # Repeat to ensure we maximize entity count
         for i in range(self._max_gleanings):
             response = await self._model.achat(
-                self._continue_prompt,
+                continue_prompt or self._continue_prompt,
                 name=f"extract-continuation-{i}",
                 history=response.history,
             )
-            results += response.output.content or ""
+            results.append(response.output.content or "")
 
             # if this is the final glean, don't bother updating the continuation flag
             if i >= self._max_gleanings - 1:
@@ -303,6 +391,10 @@ class GraphExtractor:
         return graph
 
 
+def _count_records(text: str) -> int:
+    return len(re.findall(r'\(\s*"(?:entity|relationship)"', text))
+
+
 def _unpack_descriptions(data: Mapping) -> list[str]:
     value = data.get("description", None)
     return [] if value is None else value.split("\n")
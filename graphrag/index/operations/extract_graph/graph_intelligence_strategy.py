@@ -4,6 +4,7 @@
 """A module containing run_graph_intelligence,  run_extract_graph and _create_text_splitter methods to run graph intelligence."""
 
 import networkx as nx
+import pandas as pd
 
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
@@ -72,37 +73,47 @@ async def run_extract_graph(
         loop_prompt=loop_prompt,
     )
     text_list = [doc.text.strip() for doc in docs]
-
-    results = await extractor(
-        list(text_list),
-        {
-            "entity_types": entity_types,
-            "tuple_delimiter": tuple_delimiter,
-            "record_delimiter": record_delimiter,
-            "completion_delimiter": completion_delimiter,
-        },
+    prompt_variables = {
+        "entity_types": entity_types,
+        "tuple_delimiter": tuple_delimiter,
+        "record_delimiter": record_delimiter,
+        "completion_delimiter": completion_delimiter,
+    }
+
+    if args.get("batch_max_tokens", 0) > 0 and len(docs) > 1:
+        # one request for all the documents, parsed back into a graph per document
+        graphs = await extractor.extract_batch(text_list, prompt_variables)
+        graph_docs = [[doc] for doc in docs]
+    else:
+        results = await extractor(list(text_list), prompt_variables)
+        graphs = [results.output]
+        graph_docs = [docs]
+
+    entities = []
+    relationships = []
+    for graph, source_docs in zip(graphs, graph_docs, strict=True):
+        # Map the "source_id" back to the "id" field
+        for _, node in graph.nodes(data=True):  # type: ignore
+            if node is not None:
+                node["source_id"] = ",".join(
+                    source_docs[int(id)].id for id in node["source_id"].split(",")
+                )
+
+        for _, _, edge in graph.edges(data=True):  # type: ignore
+            if edge is not None:
+                edge["source_id"] = ",".join(
+                    source_docs[int(id)].id for id in edge["source_id"].split(",")
+                )
+
+        entities.extend(
+            ({"title": item[0], **(item[1] or {})})
+            for item in graph.nodes(data=True)
+            if item is not None
+        )
+        relationships.append(nx.to_pandas_edgelist(graph))
+
+    return EntityExtractionResult(
+        entities,
+        pd.concat(relationships, ignore_index=True),
+        graphs[0] if len(graphs) == 1 else None,
     )
-
-    graph = results.output
-    # Map the "source_id" back to the "id" field
-    for _, node in graph.nodes(data=True):  # type: ignore
-        if node is not None:
-            node["source_id"] = ",".join(
-                docs[int(id)].id for id in node["source_id"].split(",")
-            )
-
-    for _, _, edge in graph.edges(data=True):  # type: ignore
-        if edge is not None:
-            edge["source_id"] = ",".join(
-                docs[int(id)].id for id in edge["source_id"].split(",")
-            )
-
-    entities = [
-        ({"title": item[0], **(item[1] or {})})
-        for item in graph.nodes(data=True)
-        if item is not None
-    ]
-
-    relationships = nx.to_pandas_edgelist(graph)
-
-    return EntityExtractionResult(entities, relationships, graph)
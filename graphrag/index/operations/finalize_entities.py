@@ -10,8 +10,11 @@ import pandas as pd
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.embed_graph_config import EmbedGraphConfig
 from graphrag.data_model.schemas import ENTITIES_FINAL_COLUMNS
+from graphrag.index.operations.compact_graph import (
+    CompactGraph,
+    create_compact_graph,
+)
 from graphrag.index.operations.compute_degree import compute_degree
-from graphrag.index.operations.create_graph import create_graph
 from graphrag.index.operations.embed_graph.embed_graph import embed_graph
 from graphrag.index.operations.layout_graph.layout_graph import layout_graph
 
@@ -22,17 +25,23 @@ def finalize_entities(
     callbacks: WorkflowCallbacks,
     embed_config: EmbedGraphConfig | None = None,
     layout_enabled: bool = False,
+    graph: CompactGraph | None = None,
 ) -> pd.DataFrame:
     """All the steps to transform final entities."""
-    graph = create_graph(relationships)
+    if graph is None:
+        graph = create_compact_graph(relationships)
+    embed_enabled = embed_config is not None and embed_config.enabled
+    # the zero layout only places the nodes, the edges are only needed to embed or
+    # lay out the graph
+    nx_graph = graph.to_networkx(with_edges=embed_enabled or layout_enabled)
     graph_embeddings = None
-    if embed_config is not None and embed_config.enabled:
+    if embed_config is not None and embed_enabled:
         graph_embeddings = embed_graph(
-            graph,
+            nx_graph,
             embed_config,
         )
     layout = layout_graph(
-        graph,
+        nx_graph,
         callbacks,
         layout_enabled,
         embeddings=graph_embeddings,
@@ -8,18 +8,23 @@ from uuid import uuid4
 import pandas as pd
 
 from graphrag.data_model.schemas import RELATIONSHIPS_FINAL_COLUMNS
+from graphrag.index.operations.compact_graph import (
+    CompactGraph,
+    create_compact_graph,
+)
 from graphrag.index.operations.compute_degree import compute_degree
 from graphrag.index.operations.compute_edge_combined_degree import (
     compute_edge_combined_degree,
 )
-from graphrag.index.operations.create_graph import create_graph
 
 
 def finalize_relationships(
     relationships: pd.DataFrame,
+    graph: CompactGraph | None = None,
 ) -> pd.DataFrame:
     """All the steps to transform final relationships."""
-    graph = create_graph(relationships)
+    if graph is None:
+        graph = create_compact_graph(relationships)
     degrees = compute_degree(graph)
 
     final_relationships = relationships.drop_duplicates(subset=["source", "target"])
@@ -2,6 +2,11 @@
 # Licensed under the MIT License
 """Sort context by degree in descending order."""
 
+import csv
+import io
+import itertools
+
+import numpy as np
 import pandas as pd
 
 import graphrag.data_model.schemas as schemas
@@ -21,37 +26,48 @@ def sort_context(
     edge_target_column: str = schemas.EDGE_TARGET,
     claim_details_column: str = schemas.CLAIM_DETAILS,
 ) -> str:
-    """Sort context by degree in descending order, optimizing for performance."""
+    """Sort context by degree in descending order, optimizing for performance.
 
-    def _get_context_string(
-        entities: list[dict],
-        edges: list[dict],
-        claims: list[dict],
-        sub_community_reports: list[dict] | None = None,
-    ) -> str:
-        """Concatenate structured data into a context string."""
-        contexts = []
-        if sub_community_reports:
-            report_df = pd.DataFrame(sub_community_reports)
-            if not report_df.empty:
-                contexts.append(
-                    f"----Reports-----\n{report_df.to_csv(index=False, sep=',')}"
-                )
+    Edges are added in order until the rendered context would exceed `max_tokens`.
+    Instead of re-rendering and re-tokenizing the whole context after every edge,
+    the token count of every CSV row is computed once and a running total is kept;
+    the selected prefix is rendered a single time at the end.
+    """
+    context_string, _, _ = _sort_context(
+        local_context,
+        sub_community_reports,
+        max_tokens,
+        node_name_column,
+        node_details_column,
+        edge_id_column,
+        edge_details_column,
+        edge_degree_column,
+        edge_source_column,
+        edge_target_column,
+        claim_details_column,
+    )
+    return context_string
 
-        for label, data in [
-            ("Entities", entities),
-            ("Claims", claims),
-            ("Relationships", edges),
-        ]:
-            if data:
-                data_df = pd.DataFrame(data)
-                if not data_df.empty:
-                    contexts.append(
-                        f"-----{label}-----\n{data_df.to_csv(index=False, sep=',')}"
-                    )
 
-        return "\n\n".join(contexts)
+def _sort_context(
+    local_context: list[dict],
+    sub_community_reports: list[dict] | None = None,
+    max_tokens: int | None = None,
+    node_name_column: str = schemas.TITLE,
+    node_details_column: str = schemas.NODE_DETAILS,
+    edge_id_column: str = schemas.SHORT_ID,
+    edge_details_column: str = schemas.EDGE_DETAILS,
+    edge_degree_column: str = schemas.EDGE_DEGREE,
+    edge_source_column: str = schemas.EDGE_SOURCE,
+    edge_target_column: str = schemas.EDGE_TARGET,
+    claim_details_column: str = schemas.CLAIM_DETAILS,
+) -> tuple[str, int | None, int | None]:
+    """Sort the context as `sort_context` does.
 
+    Returns the context string along with its token count and the token count of the
+    whole context before it was trimmed to `max_tokens`, or None for both when
+    `max_tokens` is None.
+    """
     # Preprocess local context
     edges = [
         {**e, schemas.SHORT_ID: int(e[schemas.SHORT_ID])}
@@ -81,10 +97,10 @@ def sort_context(
     # Sort edges by degree (desc) and ID (asc)
     edges.sort(key=lambda x: (-x.get(edge_degree_column, 0), x.get(edge_id_column, "")))
 
-    # Deduplicate and build context incrementally
+    # Deduplicate, recording how many nodes/claims/edges are present after each edge
     edge_ids, nodes_ids, claims_ids = set(), set(), set()
     sorted_edges, sorted_nodes, sorted_claims = [], [], []
-    context_string = ""
+    steps = []
 
     for edge in edges:
         source, target = edge[edge_source_column], edge[edge_target_column]
@@ -108,18 +124,219 @@ def sort_context(
             edge_ids.add(edge[schemas.SHORT_ID])
             sorted_edges.append(edge)
 
-        # Generate new context string
+        steps.append((len(sorted_nodes), len(sorted_claims), len(sorted_edges)))
+
+    if not steps:
+        context_string = _get_context_string([], [], [], sub_community_reports)
+        size = num_tokens(context_string) if max_tokens is not None else None
+        return context_string, size, size
+
+    selected = len(steps) - 1
+    if max_tokens:
+        counter = _ContextTokenCounter(
+            sorted_nodes, sorted_claims, sorted_edges, sub_community_reports
+        )
+        if not counter.supported:
+            return _sort_context_by_rendering(
+                sorted_nodes, sorted_claims, sorted_edges, steps,
+                sub_community_reports, max_tokens,
+            )  # fmt: skip
+        for i, step in enumerate(steps):
+            if counter.count(*step) > max_tokens:
+                # an oversized first edge is still returned on its own
+                selected = max(i - 1, 0)
+                break
+        n_nodes, n_claims, n_edges = steps[selected]
+        context_string = _get_context_string(
+            sorted_nodes[:n_nodes],
+            sorted_edges[:n_edges],
+            sorted_claims[:n_claims],
+            sub_community_reports,
+        )
+        size = counter.count(*steps[selected])
+        if num_tokens(context_string) != size:
+            # row token counts were not additive for this input; use the exact path
+            return _sort_context_by_rendering(
+                sorted_nodes, sorted_claims, sorted_edges, steps,
+                sub_community_reports, max_tokens,
+            )  # fmt: skip
+        return context_string, size, counter.count(*steps[-1])
+
+    n_nodes, n_claims, n_edges = steps[selected]
+    context_string = _get_context_string(
+        sorted_nodes[:n_nodes],
+        sorted_edges[:n_edges],
+        sorted_claims[:n_claims],
+        sub_community_reports,
+    )
+    size = num_tokens(context_string) if max_tokens is not None else None
+    return context_string, size, size
+
+
+def _get_context_string(
+    entities: list[dict],
+    edges: list[dict],
+    claims: list[dict],
+    sub_community_reports: list[dict] | None = None,
+) -> str:
+    """Concatenate structured data into a context string."""
+    contexts = []
+    if sub_community_reports:
+        report_df = pd.DataFrame(sub_community_reports)
+        if not report_df.empty:
+            contexts.append(
+                f"----Reports-----\n{report_df.to_csv(index=False, sep=',')}"
+            )
+
+    for label, data in [
+        ("Entities", entities),
+        ("Claims", claims),
+        ("Relationships", edges),
+    ]:
+        if data:
+            data_df = pd.DataFrame(data)
+            if not data_df.empty:
+                contexts.append(
+                    f"-----{label}-----\n{data_df.to_csv(index=False, sep=',')}"
+                )
+
+    return "\n\n".join(contexts)
+
+
+def _sort_context_by_rendering(
+    sorted_nodes: list[dict],
+    sorted_claims: list[dict],
+    sorted_edges: list[dict],
+    steps: list[tuple[int, int, int]],
+    sub_community_reports: list[dict] | None,
+    max_tokens: int,
+) -> tuple[str, int, int]:
+    """Select the context by rendering and tokenizing the full string after every edge."""
+    context_string, size = "", 0
+    for n_nodes, n_claims, n_edges in steps:
         new_context_string = _get_context_string(
-            sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
+            sorted_nodes[:n_nodes],
+            sorted_edges[:n_edges],
+            sorted_claims[:n_claims],
+            sub_community_reports,
         )
-        if max_tokens and num_tokens(new_context_string) > max_tokens:
+        new_size = num_tokens(new_context_string)
+        if new_size > max_tokens:
             break
-        context_string = new_context_string
-
-    # Return the final context string
-    return context_string or _get_context_string(
-        sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
+        context_string, size = new_context_string, new_size
+    else:
+        return context_string, size, size
+    # the context was trimmed, the whole of it is only rendered to be measured
+    n_nodes, n_claims, n_edges = steps[-1]
+    full_size = num_tokens(
+        _get_context_string(
+            sorted_nodes[:n_nodes],
+            sorted_edges[:n_edges],
+            sorted_claims[:n_claims],
+            sub_community_reports,
+        )
     )
+    if not context_string:
+        return new_context_string, new_size, full_size
+    return context_string, size, full_size
+
+
+class _ContextTokenCounter:
+    """Token count of `_get_context_string` for any prefix of the sorted rows.
+
+    Each CSV row is rendered and tokenized once. Rows end with a newline and the
+    tokenizer never merges across a newline into the next row, so a section costs
+    its title and header plus the sum of its rows; only the last row of a section
+    is counted together with the blank-line separator that follows it.
+    `supported` is False when pandas would render a row differently depending on
+    the other rows (mixed keys or int columns widened to float by nulls).
+    """
+
+    def __init__(
+        self,
+        entities: list[dict],
+        claims: list[dict],
+        edges: list[dict],
+        sub_community_reports: list[dict] | None,
+    ):
+        self.supported = True
+        self._reports: tuple[int, int] | None = None
+        if sub_community_reports:
+            report_df = pd.DataFrame(sub_community_reports)
+            if not report_df.empty:
+                text = f"----Reports-----\n{report_df.to_csv(index=False, sep=',')}"
+                self._reports = (num_tokens(text), num_tokens(text + "\n\n"))
+        self._sections = [
+            self._section("Entities", entities),
+            self._section("Claims", claims),
+            self._section("Relationships", edges),
+        ]
+
+    def _section(self, label: str, rows: list[dict]):
+        if not rows:
+            return None
+        columns = tuple(rows[0].keys())
+        if any(tuple(row.keys()) != columns for row in rows) or not all(
+            _is_row_independent([row[column] for row in rows]) for column in columns
+        ):
+            self.supported = False
+            return None
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+
+        def render(values) -> str:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerow(values)
+            return buffer.getvalue()
+
+        header_tokens = num_tokens(f"-----{label}-----\n" + render(columns))
+        row_tokens, last_row_tokens = [], []
+        for row in rows:
+            line = render([_format_value(row[column]) for column in columns])
+            row_tokens.append(num_tokens(line))
+            last_row_tokens.append(num_tokens(line + "\n\n"))
+        # prefix sums so any section prefix is costed in O(1)
+        cumulative = [0, *itertools.accumulate(row_tokens)]
+        return header_tokens, cumulative, row_tokens, last_row_tokens
+
+    def count(self, n_entities: int, n_claims: int, n_edges: int) -> int:
+        parts = []
+        if self._reports is not None:
+            parts.append(self._reports)
+        for section, n in zip(self._sections, (n_entities, n_claims, n_edges)):
+            if section is not None and n > 0:
+                header_tokens, cumulative, row_tokens, last_row_tokens = section
+                without_last = header_tokens + cumulative[n - 1]
+                parts.append(
+                    (
+                        without_last + row_tokens[n - 1],
+                        without_last + last_row_tokens[n - 1],
+                    )
+                )
+        if not parts:
+            return 0
+        return sum(followed for _, followed in parts[:-1]) + parts[-1][0]
+
+
+def _is_row_independent(values: list) -> bool:
+    """Whether pandas renders each value of a column regardless of the other values."""
+    has_int, has_float_or_null = False, False
+    for value in values:
+        if value is None or isinstance(value, float | np.floating):
+            has_float_or_null = True
+        elif isinstance(value, int | np.integer) and not isinstance(value, bool):
+            has_int = True
+        elif not isinstance(value, str | bool):
+            return False
+    # a null or float in an int column widens the whole column to float
+    return not (has_int and has_float_or_null)
+
+
+def _format_value(value) -> str:
+    if value is None or (isinstance(value, float | np.floating) and np.isnan(value)):
+        return ""
+    return str(value)
 
 
 def parallel_sort_context_batch(community_df, max_tokens, parallel=False):
@@ -129,26 +346,26 @@ def parallel_sort_context_batch(community_df, max_tokens, parallel=False):
         from concurrent.futures import ThreadPoolExecutor
 
         with ThreadPoolExecutor(max_workers=None) as executor:
-            context_strings = list(
+            contexts = list(
                 executor.map(
-                    lambda x: sort_context(x, max_tokens=max_tokens),
+                    lambda x: _sort_context(x, max_tokens=max_tokens),
                     community_df[schemas.ALL_CONTEXT],
                 )
             )
-        community_df[schemas.CONTEXT_STRING] = context_strings
 
     else:
-        # Assign context strings directly to the DataFrame
-        community_df[schemas.CONTEXT_STRING] = community_df[schemas.ALL_CONTEXT].apply(
-            lambda context_list: sort_context(context_list, max_tokens=max_tokens)
-        )
+        contexts = [
+            _sort_context(context_list, max_tokens=max_tokens)
+            for context_list in community_df[schemas.ALL_CONTEXT]
+        ]
 
-    # Calculate other columns
-    community_df[schemas.CONTEXT_SIZE] = community_df[schemas.CONTEXT_STRING].apply(
-        num_tokens
-    )
-    community_df[schemas.CONTEXT_EXCEED_FLAG] = (
-        community_df[schemas.CONTEXT_SIZE] > max_tokens
-    )
+    # Assign the context strings and their sizes to the DataFrame
+    community_df[schemas.CONTEXT_STRING] = [context for context, _, _ in contexts]
+    community_df[schemas.CONTEXT_SIZE] = [size for _, size, _ in contexts]
+    # a context that had to be trimmed still counts as exceeding the limit, so the
+    # level context builder can substitute sub-community reports for it
+    community_df[schemas.CONTEXT_EXCEED_FLAG] = [
+        full_size > max_tokens for _, _, full_size in contexts
+    ]
 
     return community_df
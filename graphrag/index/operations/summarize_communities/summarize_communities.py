@@ -3,14 +3,16 @@
 
 """A module containing create_community_reports and load_strategy methods definition."""
 
+import asyncio
 import logging
+import traceback
 from collections.abc import Callable
+from typing import Any
 
 import pandas as pd
 
 import graphrag.data_model.schemas as schemas
 from graphrag.cache.pipeline_cache import PipelineCache
-from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
 from graphrag.index.operations.summarize_communities.typing import (
@@ -21,7 +23,8 @@ from graphrag.index.operations.summarize_communities.typing import (
 from graphrag.index.operations.summarize_communities.utils import (
     get_levels,
 )
-from graphrag.index.utils.derive_from_rows import derive_from_rows
+from graphrag.index.utils.concurrency_limiter import AdaptiveConcurrencyLimiter
+from graphrag.index.utils.derive_from_rows import ParallelizationError
 from graphrag.logger.progress import progress_ticker
 
 log = logging.getLogger(__name__)
@@ -38,9 +41,20 @@ async def summarize_communities(
     max_input_length: int,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
+    limiter: AdaptiveConcurrencyLimiter | None = None,
 ):
-    """Generate community summaries."""
-    reports: list[CommunityReport | None] = []
+    """
+    Generate community summaries.
+
+    Reports are generated bottom-up. A community whose local context fits within
+    max_input_length is scheduled right away. A community whose local context is too
+    large waits only for its own sub-communities, so its context can substitute their
+    reports, while unrelated subtrees keep generating concurrently.
+    """
+    if async_mode not in (AsyncType.AsyncIO, AsyncType.Threaded):
+        msg = f"Unsupported scheduling type {async_mode}"
+        raise ValueError(msg)
+
     tick = progress_ticker(callbacks.progress, len(local_contexts))
     strategy_exec = load_strategy(strategy["type"])
     strategy_config = {**strategy}
@@ -54,45 +68,113 @@ async def summarize_communities(
         .rename({"children": "sub_community"}, axis=1)
         .loc[:, ["community", "level", "sub_community"]]
     ).dropna()
+    sub_communities = (
+        community_hierarchy.groupby("community")["sub_community"].agg(list).to_dict()
+    )
+
+    # communities that exceed the limit and have sub-communities to substitute must wait for their reports
+    pending_mask = local_contexts.loc[:, schemas.CONTEXT_EXCEED_FLAG].astype(
+        bool
+    ) & local_contexts.loc[:, schemas.COMMUNITY_ID].isin(sub_communities.keys())
 
     levels = get_levels(nodes)
+    semaphore = limiter or asyncio.Semaphore(num_threads or 4)
+    tasks: dict[Any, asyncio.Task] = {}
+    errors: list[tuple[BaseException, str]] = []
+
+    async def run_generate(
+        community_id, level: int, context: str
+    ) -> CommunityReport | None:
+        try:
+            async with semaphore:
+                return await _generate_report(
+                    strategy_exec,
+                    community_id=community_id,
+                    community_level=level,
+                    community_context=context,
+                    callbacks=callbacks,
+                    cache=cache,
+                    strategy=strategy_config,
+                )
+        except Exception as e:  # noqa: BLE001
+            errors.append((e, traceback.format_exc()))
+            return None
+        finally:
+            tick()
 
-    level_contexts = []
+    async def run_generate_after_subcommunities(
+        community_id, level: int
+    ) -> CommunityReport | None:
+        sub_ids = [
+            sub_id for sub_id in sub_communities[community_id] if sub_id in tasks
+        ]
+        sub_reports = [
+            report
+            for report in await asyncio.gather(*(tasks[sub_id] for sub_id in sub_ids))
+            if report is not None
+        ]
+        try:
+            level_context = level_context_builder(
+                pd.DataFrame(sub_reports),
+                community_hierarchy_df=community_hierarchy.loc[
+                    community_hierarchy.loc[:, schemas.COMMUNITY_ID] == community_id
+                ],
+                local_context_df=local_contexts.loc[
+                    local_contexts.loc[:, schemas.COMMUNITY_ID].isin([
+                        community_id,
+                        *sub_ids,
+                    ])
+                ],
+                level=level,
+                max_tokens=max_input_length,
+            )
+        except Exception as e:  # noqa: BLE001
+            errors.append((e, traceback.format_exc()))
+            tick()
+            return None
+        return await run_generate(
+            community_id, level, level_context.iloc[0][schemas.CONTEXT_STRING]
+        )
+
+    # schedule the deepest level first, so its requests are first in line for the semaphore
+    ordered_ids = []
     for level in levels:
         level_context = level_context_builder(
-            pd.DataFrame(reports),
+            None,
             community_hierarchy_df=community_hierarchy,
-            local_context_df=local_contexts,
+            local_context_df=local_contexts.loc[~pending_mask],
             level=level,
             max_tokens=max_input_length,
         )
-        level_contexts.append(level_context)
-
-    for level_context in level_contexts:
-
-        async def run_generate(record):
-            result = await _generate_report(
-                strategy_exec,
-                community_id=record[schemas.COMMUNITY_ID],
-                community_level=record[schemas.COMMUNITY_LEVEL],
-                community_context=record[schemas.CONTEXT_STRING],
-                callbacks=callbacks,
-                cache=cache,
-                strategy=strategy_config,
+        for _, record in level_context.iterrows():
+            community_id = record[schemas.COMMUNITY_ID]
+            tasks[community_id] = asyncio.create_task(
+                run_generate(
+                    community_id,
+                    record[schemas.COMMUNITY_LEVEL],
+                    record[schemas.CONTEXT_STRING],
+                )
             )
-            tick()
-            return result
-
-        local_reports = await derive_from_rows(
-            level_context,
-            run_generate,
-            callbacks=NoopWorkflowCallbacks(),
-            num_threads=num_threads,
-            async_type=async_mode,
-        )
-        reports.extend([lr for lr in local_reports if lr is not None])
+            ordered_ids.append(community_id)
+
+        pending_ids = local_contexts.loc[
+            pending_mask
+            & (local_contexts.loc[:, schemas.COMMUNITY_LEVEL] == level),
+            schemas.COMMUNITY_ID,
+        ]
+        for community_id in pending_ids:
+            tasks[community_id] = asyncio.create_task(
+                run_generate_after_subcommunities(community_id, level)
+            )
+            ordered_ids.append(community_id)
+
+    await asyncio.gather(*tasks.values())
+
+    if len(errors) > 0:
+        raise ParallelizationError(len(errors), errors[0][1])
 
-    return pd.DataFrame(reports)
+    reports = [tasks[community_id].result() for community_id in ordered_ids]
+    return pd.DataFrame([report for report in reports if report is not None])
 
 
 async def _generate_report(
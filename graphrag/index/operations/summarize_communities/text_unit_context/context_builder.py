@@ -138,14 +138,10 @@ def build_level_context(
     level_context_df = level_context_df[level_context_df["_merge"] == "left_only"].drop(
         "_merge", axis=1
     )
-    valid_context_df = cast(
-        "pd.DataFrame",
-        level_context_df[level_context_df[schemas.CONTEXT_EXCEED_FLAG] is False],
-    )
-    invalid_context_df = cast(
-        "pd.DataFrame",
-        level_context_df[level_context_df[schemas.CONTEXT_EXCEED_FLAG] is True],
-    )
+    # the outer merge above leaves the flag as an object column
+    exceed_flag = level_context_df[schemas.CONTEXT_EXCEED_FLAG].astype(bool)
+    valid_context_df = cast("pd.DataFrame", level_context_df[~exceed_flag])
+    invalid_context_df = cast("pd.DataFrame", level_context_df[exceed_flag])
 
     if invalid_context_df.empty:
         return valid_context_df
@@ -199,7 +195,7 @@ def build_level_context(
         .reset_index()
     )
     community_df[schemas.CONTEXT_STRING] = community_df[schemas.ALL_CONTEXT].apply(
-        lambda x: build_mixed_context(x, max_tokens)
+        lambda x: build_mixed_context(x, max_tokens, sort_context_fn=sort_context)
     )
     community_df[schemas.CONTEXT_SIZE] = community_df[schemas.CONTEXT_STRING].apply(
         lambda x: num_tokens(x)
@@ -15,6 +15,8 @@ from graphrag.index.operations.summarize_descriptions.typing import (
     SummarizationStrategy,
     SummarizeStrategyType,
 )
+from graphrag.index.utils.concurrency_limiter import AdaptiveConcurrencyLimiter
+from graphrag.index.utils.scheduling import TaskTimings, gather_longest_first
 from graphrag.logger.progress import ProgressTicker, progress_ticker
 
 log = logging.getLogger(__name__)
@@ -27,6 +29,7 @@ async def summarize_descriptions(
     cache: PipelineCache,
     strategy: dict[str, Any] | None = None,
     num_threads: int = 4,
+    limiter: AdaptiveConcurrencyLimiter | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Summarize entity and relationship descriptions from an entity graph.
@@ -81,51 +84,47 @@ async def summarize_descriptions(
         strategy_config["llm"]["max_retries"] = len(entities_df) + len(relationships_df)
 
     async def get_summarized(
-        nodes: pd.DataFrame, edges: pd.DataFrame, semaphore: asyncio.Semaphore
+        nodes: pd.DataFrame,
+        edges: pd.DataFrame,
+        semaphore: asyncio.Semaphore | AdaptiveConcurrencyLimiter,
     ):
         ticker_length = len(nodes) + len(edges)
 
         ticker = progress_ticker(callbacks.progress, ticker_length)
 
-        node_futures = [
-            do_summarize_descriptions(
-                str(row.title),  # type: ignore
-                sorted(set(row.description)),  # type: ignore
-                ticker,
-                semaphore,
-            )
+        items = [
+            (str(row.title), sorted(set(row.description)))  # type: ignore
             for row in nodes.itertuples(index=False)
+        ] + [
+            ((str(row.source), str(row.target)), sorted(set(row.description)))  # type: ignore
+            for row in edges.itertuples(index=False)
         ]
-
-        node_results = await asyncio.gather(*node_futures)
+        # entities and relationships are summarized together, starting from the ones
+        # with the most to summarize, so they do not stretch the end of the run
+        results = await gather_longest_first(
+            [
+                do_summarize_descriptions(id, descriptions, ticker, semaphore)
+                for id, descriptions in items
+            ],
+            [sum(map(len, descriptions)) for _, descriptions in items],
+        )
+        timings.report("summarize_descriptions", callbacks)
 
         node_descriptions = [
             {
                 "title": result.id,
                 "description": result.description,
             }
-            for result in node_results
+            for result in results[: len(nodes)]
         ]
 
-        edge_futures = [
-            do_summarize_descriptions(
-                (str(row.source), str(row.target)),  # type: ignore
-                sorted(set(row.description)),  # type: ignore
-                ticker,
-                semaphore,
-            )
-            for row in edges.itertuples(index=False)
-        ]
-
-        edge_results = await asyncio.gather(*edge_futures)
-
         edge_descriptions = [
             {
                 "source": result.id[0],
                 "target": result.id[1],
                 "description": result.description,
             }
-            for result in edge_results
+            for result in results[len(nodes) :]
         ]
 
         entity_descriptions = pd.DataFrame(node_descriptions)
@@ -136,16 +135,18 @@ async def summarize_descriptions(
         id: str | tuple[str, str],
         descriptions: list[str],
         ticker: ProgressTicker,
-        semaphore: asyncio.Semaphore,
+        semaphore: asyncio.Semaphore | AdaptiveConcurrencyLimiter,
     ):
         async with semaphore:
-            results = await strategy_exec(
-                id, descriptions, callbacks, cache, strategy_config
-            )
+            with timings.track():
+                results = await strategy_exec(
+                    id, descriptions, callbacks, cache, strategy_config
+                )
             ticker(1)
         return results
 
-    semaphore = asyncio.Semaphore(num_threads)
+    timings = TaskTimings()
+    semaphore = limiter or asyncio.Semaphore(num_threads)
 
     return await get_summarized(entities_df, relationships_df, semaphore)
 
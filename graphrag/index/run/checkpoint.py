@@ -0,0 +1,213 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Workflow checkpoints, used to resume an interrupted pipeline run."""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.typing.pipeline import Pipeline
+from graphrag.index.typing.state import PipelineState
+
+CHECKPOINTS_KEY = "checkpoints"
+"""The key in the pipeline state (context.json) holding the completed workflow fingerprints."""
+
+# the config sections each built-in workflow reads, workflows not listed here are
+# fingerprinted against the whole indexing config
+_WORKFLOW_CONFIG = {
+    "create_base_text_units": ["chunks"],
+    "deduplicate_text_units": ["deduplicate_text_units"],
+    "create_final_documents": [],
+    "extract_graph": ["extract_graph", "summarize_descriptions", "models"],
+    "extract_graph_nlp": ["extract_graph_nlp"],
+    "prune_graph": ["prune_graph"],
+    "finalize_graph": ["embed_graph", "umap", "snapshots"],
+    "extract_covariates": ["extract_claims", "models"],
+    "create_communities": ["cluster_graph"],
+    "create_final_text_units": ["extract_claims"],
+    "create_community_reports": ["community_reports", "extract_claims", "models"],
+    "create_community_reports_text": ["community_reports", "models"],
+    "generate_text_embeddings": ["embed_text", "vector_store", "snapshots", "models"],
+}
+
+# settings that do not change what the indexing workflows produce
+_UNFINGERPRINTED_CONFIG = {
+    "root_dir",
+    "reporting",
+    "output",
+    "outputs",
+    "update_index_output",
+    "cache",
+    "local_search",
+    "global_search",
+    "drift_search",
+    "basic_search",
+    "concurrent_workflows",
+    "max_table_memory_mb",
+}
+
+# language model settings that change how requests are sent, not what comes back
+_UNFINGERPRINTED_MODEL_CONFIG = {
+    "api_key",
+    "auth_type",
+    "organization",
+    "proxy",
+    "audience",
+    "request_timeout",
+    "tokens_per_minute",
+    "requests_per_minute",
+    "retry_strategy",
+    "max_retries",
+    "max_retry_wait",
+    "concurrent_requests",
+    "adaptive_concurrency",
+    "min_concurrent_requests",
+    "max_concurrent_requests",
+    "async_mode",
+}
+
+# settings of the config sections that change how a workflow runs, not what it produces
+_UNFINGERPRINTED_SECTION_CONFIG = {
+    "chunks": {"workers"},
+}
+
+# the creation date of an input file changes whenever it is copied, not when its content does
+_UNFINGERPRINTED_COLUMNS = ["creation_date"]
+
+
+def fingerprint_documents(dataset: pd.DataFrame) -> str:
+    """Get the fingerprint of the input documents."""
+    documents = dataset.drop(columns=_UNFINGERPRINTED_COLUMNS, errors="ignore")
+    hasher = hashlib.sha256(",".join(map(str, documents.columns)).encode("utf-8"))
+    hasher.update(
+        pd.util.hash_pandas_object(documents.astype(str), index=False)
+        .to_numpy()
+        .tobytes()
+    )
+    return hasher.hexdigest()
+
+
+def fingerprint_pipeline(
+    pipeline: Pipeline, config: GraphRagConfig, dataset: pd.DataFrame
+) -> dict[str, str]:
+    """Get the fingerprint of every workflow in the pipeline.
+
+    A workflow's fingerprint covers the fingerprints of the workflows it depends on,
+    so they are chained back to the fingerprint of the input documents.
+    """
+    documents = fingerprint_documents(dataset)
+    dependencies = pipeline.dependencies()
+    fingerprints: dict[str, str] = {}
+    for name in pipeline.names():
+        fingerprints[name] = fingerprint_workflow(
+            name,
+            config,
+            [
+                documents,
+                *[fingerprints[dependency] for dependency in dependencies[name]],
+            ],
+        )
+    return fingerprints
+
+
+def fingerprint_workflow(name: str, config: GraphRagConfig, previous: list[str]) -> str:
+    """Get the fingerprint of a workflow from its config and the fingerprints of its inputs."""
+    sections = _WORKFLOW_CONFIG.get(name)
+    settings = (
+        config.model_dump(mode="json", include=set(sections))
+        if sections is not None
+        else config.model_dump(mode="json", exclude=_UNFINGERPRINTED_CONFIG)
+    )
+    for model in settings.get("models", {}).values():
+        for key in _UNFINGERPRINTED_MODEL_CONFIG:
+            model.pop(key, None)
+    for section, keys in _UNFINGERPRINTED_SECTION_CONFIG.items():
+        for key in keys:
+            settings.get(section, {}).pop(key, None)
+    hasher = hashlib.sha256("\x1f".join([*previous, name, ""]).encode())
+    hasher.update(json.dumps(settings, sort_keys=True, default=str).encode("utf-8"))
+    # prompts are configured as files, so it is their content that matters
+    for prompt in sorted(_prompt_files(settings, Path(config.root_dir))):
+        hasher.update(prompt.read_bytes())
+    return hasher.hexdigest()
+
+
+def get_checkpoints(state: PipelineState) -> dict[str, str]:
+    """Get the completed workflow fingerprints recorded in the pipeline state."""
+    return state.setdefault(CHECKPOINTS_KEY, {})
+
+
+def select_workflows_to_resume(
+    pipeline: Pipeline, fingerprints: dict[str, str], checkpoints: dict[str, str]
+) -> tuple[set[str], bool]:
+    """Get the workflows a resumed run has to run, and whether it has to write the input documents.
+
+    Besides the workflows whose fingerprint changed and everything depending on them, this
+    includes the workflows whose output a rerun workflow reads but that a later workflow
+    has since overwritten in storage (e.g. the graph extraction output, which the graph
+    finalization replaces): the tables have to be put back the way the reader expects.
+    """
+    names = pipeline.names()
+    rerun = {name for name in names if checkpoints.get(name) != fingerprints[name]}
+    if not rerun:
+        return rerun, False
+
+    if any(name not in pipeline.tables for name in names):
+        # without the tables of every workflow, fall back to rerunning everything
+        # from the first workflow that has to run
+        first = min(names.index(name) for name in rerun)
+        return set(names[first:]), first == 0
+
+    dependencies = pipeline.dependencies()
+    write_documents = False
+    changed = True
+    while changed:
+        changed = False
+        for index, name in enumerate(names):
+            if name not in rerun:
+                if any(dependency in rerun for dependency in dependencies[name]):
+                    rerun.add(name)
+                    changed = True
+                continue
+            for table in pipeline.tables[name].reads:
+                writers = [
+                    writer
+                    for writer in names
+                    if table in pipeline.tables[writer].writes
+                ]
+                earlier = [writer for writer in writers if names.index(writer) < index]
+                completed = [writer for writer in writers if writer in checkpoints]
+                produced_by = earlier[-1] if earlier else None
+                stored_by = completed[-1] if completed else None
+                if produced_by is None:
+                    if table == "documents" and not write_documents:
+                        # the input documents are rewritten, which resets what any
+                        # document-writing workflow did to them
+                        write_documents = True
+                        rerun.update(writers)
+                        changed = True
+                elif produced_by != stored_by and produced_by not in rerun:
+                    rerun.add(produced_by)
+                    changed = True
+    return rerun, write_documents
+
+
+def _prompt_files(settings: Any, root_dir: Path) -> set[Path]:
+    if isinstance(settings, list):
+        return set().union(*[_prompt_files(value, root_dir) for value in settings])
+    if not isinstance(settings, dict):
+        return set()
+    files = set()
+    for key, value in settings.items():
+        if isinstance(value, str) and key.endswith("prompt"):
+            path = root_dir / value
+            if path.is_file():
+                files.add(path)
+        else:
+            files |= _prompt_files(value, root_dir)
+    return files
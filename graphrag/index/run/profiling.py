@@ -0,0 +1,129 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Per-workflow resource profiling."""
+
+import cProfile
+import io
+import logging
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+
+from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.utils.profiling import WorkflowProfile, track_profile
+
+try:
+    import resource
+except ImportError:  # not available on windows
+    resource = None
+
+log = logging.getLogger(__name__)
+
+PROFILE_STATS_COUNT = 50
+"""The number of functions listed in the text summary of a workflow profile."""
+
+
+class ResourceMonitor:
+    """Samples the memory of the process in the background for the profiles being recorded."""
+
+    def __init__(self, interval: float = 0.1):
+        self._interval = interval
+        self._tracked: dict[int, WorkflowProfile] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="graphrag-resource-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @asynccontextmanager
+    async def profile(
+        self,
+        name: str,
+        profiles_storage: PipelineStorage | None = None,
+    ) -> AsyncIterator[WorkflowProfile]:
+        """Record the resources used by a workflow within the context.
+
+        With `profiles_storage`, a cProfile of the context is written to it as
+        `<name>.prof`, with a summary of the most expensive calls in `<name>.txt`.
+        The profile covers everything run on the event loop in the meantime, so the
+        workflows have to run one at a time for it to be meaningful.
+        """
+        profile = WorkflowProfile(peak_memory=_memory_usage())
+        with self._lock:
+            self._tracked[id(profile)] = profile
+        profiler = cProfile.Profile() if profiles_storage is not None else None
+        cpu_start = time.process_time()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            with track_profile(profile):
+                yield profile
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            profile.cpu_time = time.process_time() - cpu_start
+            with self._lock:
+                del self._tracked[id(profile)]
+            profile.peak_memory = max(profile.peak_memory, _memory_usage())
+            if profiler is not None and profiles_storage is not None:
+                await _write_profile(profiler, name, profiles_storage)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            memory = _memory_usage()
+            with self._lock:
+                for profile in self._tracked.values():
+                    profile.peak_memory = max(profile.peak_memory, memory)
+
+
+def profile_stats(profile: WorkflowProfile) -> dict[str, float]:
+    """Get the stats of a workflow profile, as recorded in stats.json."""
+    return asdict(profile)
+
+
+async def _write_profile(
+    profiler: cProfile.Profile, name: str, storage: PipelineStorage
+) -> None:
+    profiler.create_stats()
+    # the format of cProfile.Profile.dump_stats, readable with pstats or snakeviz
+    await storage.set(f"{name}.prof", marshal.dumps(profiler.stats))  # type: ignore[attr-defined]
+
+    summary = io.StringIO()
+    stats = pstats.Stats(profiler, stream=summary)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_STATS_COUNT)
+    await storage.set(f"{name}.txt", summary.getvalue())
+    log.info("Wrote the profile of workflow %s", name)
+
+
+def _memory_usage() -> int:
+    """Get the resident memory of the process, in bytes."""
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, AttributeError, ValueError, IndexError):
+        pass
+    if resource is None:
+        return 0
+    # without procfs, fall back to the peak memory of the process so far
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
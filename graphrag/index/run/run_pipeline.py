@@ -3,6 +3,7 @@
 
 """Different methods to run the pipeline."""
 
+import asyncio
 import json
 import logging
 import re
@@ -16,18 +17,32 @@ import pandas as pd
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.config.enums import ReportingType
 from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.config.models.reporting_config import ReportingConfig
 from graphrag.index.input.factory import create_input
+from graphrag.index.run.checkpoint import (
+    fingerprint_pipeline,
+    get_checkpoints,
+    select_workflows_to_resume,
+)
+from graphrag.index.run.profiling import (
+    ResourceMonitor,
+    WorkflowProfile,
+    profile_stats,
+)
 from graphrag.index.run.utils import create_run_context
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.pipeline import Pipeline
 from graphrag.index.typing.pipeline_run_result import PipelineRunResult
+from graphrag.index.typing.workflow import WorkflowFunction, WorkflowFunctionOutput
 from graphrag.index.update.incremental_index import (
     get_delta_docs,
     update_dataframe_outputs,
 )
 from graphrag.logger.base import ProgressLogger
 from graphrag.logger.progress import Progress
+from graphrag.storage.factory import StorageFactory
 from graphrag.storage.pipeline_storage import PipelineStorage
 from graphrag.utils.api import create_cache_from_config, create_storage_from_config
 from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
@@ -41,8 +56,17 @@ async def run_pipeline(
     callbacks: WorkflowCallbacks,
     logger: ProgressLogger,
     is_update_run: bool = False,
+    resume: bool = False,
+    profile: bool = False,
 ) -> AsyncIterable[PipelineRunResult]:
-    """Run all workflows using a simplified pipeline."""
+    """Run all workflows using a simplified pipeline.
+
+    Workflows run as soon as the ones they depend on are done, up to
+    `concurrent_workflows` at a time. With `resume`, workflows that already completed in
+    the output storage with the same inputs and configuration are skipped. With
+    `profile`, workflows run one at a time and a profile of each is written to the
+    reporting directory.
+    """
     root_dir = config.root_dir
 
     storage = create_storage_from_config(config.output)
@@ -78,6 +102,8 @@ async def run_pipeline(
                 storage=delta_storage,
                 callbacks=callbacks,
                 logger=logger,
+                resume=resume,
+                profile=profile,
             ):
                 yield table
 
@@ -104,6 +130,8 @@ async def run_pipeline(
             storage=storage,
             callbacks=callbacks,
             logger=logger,
+            resume=resume,
+            profile=profile,
         ):
             yield table
 
@@ -116,6 +144,8 @@ async def _run_pipeline(
     storage: PipelineStorage,
     callbacks: WorkflowCallbacks,
     logger: ProgressLogger,
+    resume: bool = False,
+    profile: bool = False,
 ) -> AsyncIterable[PipelineRunResult]:
     start_time = time.time()
 
@@ -124,30 +154,114 @@ async def _run_pipeline(
     state = json.loads(state_json) if state_json else {}
 
     context = create_run_context(
-        storage=storage, cache=cache, callbacks=callbacks, state=state
+        storage=storage,
+        cache=cache,
+        callbacks=callbacks,
+        state=state,
+        max_table_memory_bytes=config.max_table_memory_mb * 1024 * 1024,
     )
 
     log.info("Final # of rows loaded: %s", len(dataset))
     context.stats.num_documents = len(dataset)
     last_workflow = "starting documents"
+    checkpoints = get_checkpoints(context.state)
+    fingerprints = fingerprint_pipeline(pipeline, config, dataset)
+    if resume:
+        to_run, write_documents = select_workflows_to_resume(
+            pipeline, fingerprints, checkpoints
+        )
+    else:
+        to_run, write_documents = set(pipeline.names()), True
 
+    dependencies = pipeline.dependencies()
+    workflows = dict(pipeline.run())
+    order = {name: index for index, name in enumerate(pipeline.names())}
+    pending = [name for name in pipeline.names() if name in to_run]
+    finished = {name for name in pipeline.names() if name not in to_run}
+    running: dict[asyncio.Task, tuple[str, float, ProgressLogger]] = {}
+    # profiles cover the whole event loop, so profiled workflows run one at a time
+    max_running = 1 if profile else config.concurrent_workflows
+    profiles_storage = _create_profiles_storage(config.reporting) if profile else None
+    profiles: dict[str, WorkflowProfile] = {}
+    monitor = ResourceMonitor()
+    # finished workflows whose tables may not be persisted yet
+    unsaved: list[str] = []
+
+    monitor.start()
     try:
+        # a failure must not leave the checkpoints of outputs that are being replaced
+        for name in pending:
+            checkpoints.pop(name, None)
         await _dump_json(context)
-        await write_table_to_storage(dataset, "documents", context.storage)
-
-        for name, workflow_function in pipeline.run():
-            last_workflow = name
-            progress = logger.child(name, transient=False)
-            callbacks.workflow_start(name, None)
-            work_time = time.time()
-            result = await workflow_function(config, context)
-            progress(Progress(percent=1))
-            callbacks.workflow_end(name, result)
-            yield PipelineRunResult(
-                workflow=name, result=result.result, state=context.state, errors=None
-            )
+        if write_documents:
+            await context.tables.write(dataset, "documents")
+
+        for name in pipeline.names():
+            if name in finished:
+                logger.info(f"Skipping workflow {name}, it already completed.")  # noqa: G004
+                yield PipelineRunResult(
+                    workflow=name, result=None, state=context.state, errors=None
+                )
+
+        while pending or running or unsaved:
+            # start, in pipeline order, every workflow whose dependencies are done
+            for name in list(pending):
+                if len(running) >= max_running:
+                    break
+                if all(dependency in finished for dependency in dependencies[name]):
+                    pending.remove(name)
+                    progress = logger.child(name, transient=False)
+                    callbacks.workflow_start(name, None)
+                    task = asyncio.create_task(
+                        _run_workflow(
+                            name,
+                            workflows[name],
+                            config,
+                            context,
+                            monitor,
+                            profiles,
+                            profiles_storage,
+                        )
+                    )
+                    running[task] = (name, time.time(), progress)
 
-            context.stats.workflows[name] = {"overall": time.time() - work_time}
+            # the following workflows read the tables from memory, a workflow is only
+            # checkpointed once they are in the storage as well
+            if unsaved:
+                await context.tables.flush()
+                for name in unsaved:
+                    checkpoints[name] = fingerprints[name]
+                    # the bytes written include the tables persisted in the background
+                    context.stats.workflows[name].update(profile_stats(profiles[name]))
+                unsaved.clear()
+                await _dump_json(context)
+            if not running:
+                continue
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=lambda task: order[running[task][0]]):
+                name, work_time, progress = running.pop(task)
+                last_workflow = name
+                result = task.result()
+                progress(Progress(percent=1))
+                callbacks.workflow_end(name, result)
+                context.stats.workflows[name] = {
+                    "overall": time.time() - work_time,
+                    **profile_stats(profiles[name]),
+                }
+                context.stats.concurrency = {
+                    model: asdict(stats)
+                    for model, stats in context.concurrency.stats().items()
+                }
+                context.concurrency.report(name)
+                finished.add(name)
+                unsaved.append(name)
+                yield PipelineRunResult(
+                    workflow=name,
+                    result=result.result,
+                    state=context.state,
+                    errors=None,
+                )
 
         context.stats.total_runtime = time.time() - start_time
         await _dump_json(context)
@@ -159,6 +273,39 @@ async def _run_pipeline(
             workflow=last_workflow, result=None, state=context.state, errors=[e]
         )
 
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        # let the writes that already started finish rather than leave partial files
+        await asyncio.gather(context.tables.flush(), return_exceptions=True)
+        monitor.stop()
+
+
+async def _run_workflow(
+    name: str,
+    workflow: WorkflowFunction,
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+    monitor: ResourceMonitor,
+    profiles: dict[str, WorkflowProfile],
+    profiles_storage: PipelineStorage | None,
+) -> WorkflowFunctionOutput:
+    async with monitor.profile(name, profiles_storage) as profile:
+        profiles[name] = profile
+        return await workflow(config, context)
+
+
+def _create_profiles_storage(config: ReportingConfig) -> PipelineStorage | None:
+    """Create the storage the workflow profiles are written to, in the reporting directory."""
+    if config.type == ReportingType.console:
+        log.warning("Console reporting has no directory to write the profiles to.")
+        return None
+    storage = StorageFactory().create_storage(
+        storage_type=config.type.value, kwargs=config.model_dump()
+    )
+    return storage.child("profiles")
+
 
 async def _dump_json(context: PipelineRunContext) -> None:
     """Dump the stats and context state to the storage."""
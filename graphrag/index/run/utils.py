@@ -12,9 +12,13 @@ from graphrag.callbacks.workflow_callbacks_manager import WorkflowCallbacksManag
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.state import PipelineState
 from graphrag.index.typing.stats import PipelineRunStats
+from graphrag.index.utils.concurrency_limiter import ConcurrencyLimiters
 from graphrag.logger.base import ProgressLogger
 from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
 from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.storage.table_registry import PipelineTableRegistry
+
+DEFAULT_MAX_TABLE_MEMORY_BYTES = 1024 * 1024 * 1024
 
 
 def create_run_context(
@@ -23,14 +27,19 @@ def create_run_context(
     callbacks: WorkflowCallbacks | None = None,
     stats: PipelineRunStats | None = None,
     state: PipelineState | None = None,
+    max_table_memory_bytes: int = DEFAULT_MAX_TABLE_MEMORY_BYTES,
 ) -> PipelineRunContext:
     """Create the run context for the pipeline."""
+    storage = storage or MemoryPipelineStorage()
+    callbacks = callbacks or NoopWorkflowCallbacks()
     return PipelineRunContext(
         stats=stats or PipelineRunStats(),
         cache=cache or InMemoryCache(),
-        storage=storage or MemoryPipelineStorage(),
-        callbacks=callbacks or NoopWorkflowCallbacks(),
+        storage=storage,
+        callbacks=callbacks,
         state=state or {},
+        tables=PipelineTableRegistry(storage, max_table_memory_bytes),
+        concurrency=ConcurrencyLimiters(callbacks),
     )
 
 
@@ -0,0 +1,154 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'ChineseTokenTextSplitter' model."""
+
+from functools import cache
+
+import numpy as np
+
+import tiktoken
+
+# the boundaries text is preferably cut at, from the coarsest: paragraphs, lines,
+# sentences and clauses; a separator stays at the end of the chunk before the cut
+SEPARATORS = [
+    ["\n\n"],
+    ["\n"],
+    ["。", "！", "？"],
+    [". ", "! ", "? "],
+    ["；", "; "],
+    ["，", ", "],
+]
+
+
+class ChineseTokenTextSplitter:
+    """Splits text into chunks of up to `chunk_size` tokens, cut at punctuation.
+
+    Each text is tokenized once. A chunk is cut at the coarsest boundary found in the
+    second half of its tokens (a paragraph, then a line, a sentence, a clause), at the
+    furthest boundary in the chunk when there is none there, and at the last whole
+    character when there is no boundary at all. The next chunk starts at the earliest
+    boundary within the last `chunk_overlap` tokens, so the overlap is made of whole
+    sentences where possible.
+
+    Boundaries are found on the UTF-8 bytes of the text and mapped to token offsets,
+    so the chunks are exact slices of the text, and their token counts are the tokens
+    of the text they span.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int,
+        chunk_overlap: int,
+        encoding_name: str,
+        separators: list[list[str]] | None = None,
+    ):
+        if chunk_overlap >= chunk_size:
+            msg = f"Chunk overlap ({chunk_overlap}) must be smaller than the chunk size ({chunk_size})."
+            raise ValueError(msg)
+        self._chunk_size = chunk_size
+        self._chunk_overlap = chunk_overlap
+        self._encoding = tiktoken.get_encoding(encoding_name)
+        self._token_lengths = _token_byte_lengths(encoding_name)
+        self._separators = [
+            [
+                np.frombuffer(separator.encode("utf-8"), dtype=np.uint8)
+                for separator in level
+            ]
+            for level in separators or SEPARATORS
+        ]
+
+    def split_text(self, text: str) -> list[tuple[str, int]]:
+        """Split a text into chunks, as (chunk, number of tokens) tuples."""
+        if not isinstance(text, str):
+            text = f"{text}"
+        data = text.encode("utf-8")
+        tokens = np.asarray(self._encoding.encode_ordinary(text), dtype=np.int64)
+        token_count = len(tokens)
+        if token_count == 0:
+            return []
+
+        # the byte offset each token starts at, with the end of the text appended
+        starts = np.zeros(token_count + 1, dtype=np.int64)
+        np.cumsum(self._token_lengths[tokens], out=starts[1:])
+        # tokens may split a character, the text can only be cut where one starts
+        octets = np.frombuffer(data, dtype=np.uint8)
+        whole = np.flatnonzero((octets[starts[:-1]] & 0xC0) != 0x80)
+        whole = np.append(whole, token_count)
+        levels = [
+            self._boundaries(octets, separators, starts, whole)
+            for separators in self._separators
+        ]
+        boundaries = np.unique(np.concatenate(levels))
+
+        chunks = []
+        start = 0
+        while start < token_count:
+            end = self._cut(start, levels, whole, token_count)
+            chunk = data[starts[start] : starts[end]].decode("utf-8", errors="replace")
+            if chunk.strip():
+                chunks.append((chunk, int(end - start)))
+            if end >= token_count:
+                break
+            start = self._next_start(start, end, boundaries, whole)
+        return chunks
+
+    def _boundaries(
+        self,
+        octets: np.ndarray,
+        separators: list[np.ndarray],
+        starts: np.ndarray,
+        whole: np.ndarray,
+    ) -> np.ndarray:
+        """Get the token offsets right after any of the separators, on whole characters."""
+        ends = []
+        for separator in separators:
+            # the bytes the separator can start at, narrowed down byte after byte
+            matches = np.flatnonzero(
+                octets[: len(octets) - len(separator) + 1] == separator[0]
+            )
+            for index in range(1, len(separator)):
+                matches = matches[octets[matches + index] == separator[index]]
+            ends.append(matches + len(separator))
+        # a separator merged into a token with what follows cuts after that token
+        offsets = np.searchsorted(starts, np.concatenate(ends))
+        return whole[np.searchsorted(whole, np.unique(offsets))]
+
+    def _cut(
+        self, start: int, levels: list[np.ndarray], whole: np.ndarray, token_count: int
+    ) -> int:
+        limit = start + self._chunk_size
+        if limit >= token_count:
+            return token_count
+        for low in (start + self._chunk_size // 2, start):
+            for boundaries in levels:
+                index = np.searchsorted(boundaries, limit, side="right") - 1
+                if index >= 0 and boundaries[index] > low:
+                    return int(boundaries[index])
+        index = np.searchsorted(whole, limit, side="right") - 1
+        return int(whole[index]) if whole[index] > start else limit
+
+    def _next_start(
+        self, start: int, end: int, boundaries: np.ndarray, whole: np.ndarray
+    ) -> int:
+        if self._chunk_overlap <= 0:
+            return end
+        low = max(end - self._chunk_overlap, start + 1)
+        index = np.searchsorted(boundaries, low)
+        if index < len(boundaries) and boundaries[index] < end:
+            return int(boundaries[index])
+        index = np.searchsorted(whole, low)
+        return int(whole[index]) if whole[index] < end else end
+
+
+@cache
+def _token_byte_lengths(encoding_name: str) -> np.ndarray:
+    """Get the number of bytes of every token of an encoding, by token id."""
+    encoding = tiktoken.get_encoding(encoding_name)
+    lengths = np.zeros(encoding.max_token_value + 1, dtype=np.int64)
+    for token in range(len(lengths)):
+        try:
+            lengths[token] = len(encoding.decode_single_token_bytes(token))
+        except KeyError:  # ids unused by the encoding
+            continue
+    return lengths
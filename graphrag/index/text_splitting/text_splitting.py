@@ -9,6 +9,7 @@ from collections.abc import Callable, Collection, Iterable
 from dataclasses import dataclass
 from typing import Any, Literal, cast
 
+import numpy as np
 import pandas as pd
 import tiktoken
 
@@ -164,30 +165,38 @@ def split_single_text_on_tokens(text: str, tokenizer: Tokenizer) -> list[str]:
 def split_multiple_texts_on_tokens(
     texts: list[str], tokenizer: Tokenizer, tick: ProgressTicker
 ) -> list[TextChunk]:
-    """Split multiple texts and return chunks with metadata using the tokenizer."""
+    """Split multiple texts and return chunks with metadata using the tokenizer.
+
+    The token ids of all the texts are kept in a single array, and the texts a chunk
+    comes from are found from the offsets the texts end at in it.
+    """
     result = []
-    mapped_ids = []
+    encoded_texts = []
 
-    for source_doc_idx, text in enumerate(texts):
-        encoded = tokenizer.encode(text)
+    for text in texts:
+        encoded_texts.append(np.asarray(tokenizer.encode(text), dtype=np.int64))
         if tick:
             tick(1)  # Track progress if tick callback is provided
-        mapped_ids.append((source_doc_idx, encoded))
 
-    input_ids = [
-        (source_doc_idx, id) for source_doc_idx, ids in mapped_ids for id in ids
-    ]
+    input_ids = (
+        np.concatenate(encoded_texts) if encoded_texts else np.empty(0, np.int64)
+    )
+    text_lengths = np.array([len(ids) for ids in encoded_texts], dtype=np.int64)
+    text_ends = np.cumsum(text_lengths)
+    del encoded_texts
 
     start_idx = 0
-    cur_idx = min(start_idx + tokenizer.tokens_per_chunk, len(input_ids))
-    chunk_ids = input_ids[start_idx:cur_idx]
-
     while start_idx < len(input_ids):
-        chunk_text = tokenizer.decode([id for _, id in chunk_ids])
-        doc_indices = list({doc_idx for doc_idx, _ in chunk_ids})
-        result.append(TextChunk(chunk_text, doc_indices, len(chunk_ids)))
-        start_idx += tokenizer.tokens_per_chunk - tokenizer.chunk_overlap
         cur_idx = min(start_idx + tokenizer.tokens_per_chunk, len(input_ids))
-        chunk_ids = input_ids[start_idx:cur_idx]
+        chunk_text = tokenizer.decode(input_ids[start_idx:cur_idx].tolist())
+        first_doc, last_doc = np.searchsorted(
+            text_ends, [start_idx, cur_idx - 1], side="right"
+        )
+        doc_indices = np.arange(first_doc, last_doc + 1)
+        # built as a set from the texts in order, so the indices come out in the
+        # same order as the set of the texts of every token
+        doc_indices = list(set(doc_indices[text_lengths[doc_indices] > 0].tolist()))
+        result.append(TextChunk(chunk_text, doc_indices, cur_idx - start_idx))
+        start_idx += tokenizer.tokens_per_chunk - tokenizer.chunk_overlap
 
     return result
@@ -10,7 +10,9 @@ from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.index.typing.state import PipelineState
 from graphrag.index.typing.stats import PipelineRunStats
+from graphrag.index.utils.concurrency_limiter import ConcurrencyLimiters
 from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.storage.table_registry import PipelineTableRegistry
 
 
 @dataclass
@@ -26,3 +28,7 @@ class PipelineRunContext:
     "Callbacks to be called during the pipeline run."
     state: PipelineState
     "Arbitrary property bag for runtime state, persistent pre-computes, or experimental features."
+    tables: PipelineTableRegistry
+    "Tables produced by the workflows, handed over in memory and persisted to the storage."
+    concurrency: ConcurrencyLimiters
+    "Adaptive concurrency limiters shared by the workflows calling the same language model."
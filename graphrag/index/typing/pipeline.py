@@ -5,14 +5,19 @@
 
 from collections.abc import Generator
 
-from graphrag.index.typing.workflow import Workflow
+from graphrag.index.typing.workflow import Workflow, WorkflowTables
 
 
 class Pipeline:
     """Encapsulates running workflows."""
 
-    def __init__(self, workflows: list[Workflow]):
+    def __init__(
+        self,
+        workflows: list[Workflow],
+        tables: dict[str, WorkflowTables] | None = None,
+    ):
         self.workflows = workflows
+        self.tables = tables or {}
 
     def run(self) -> Generator[Workflow]:
         """Return a Generator over the pipeline workflows."""
@@ -21,3 +26,33 @@ class Pipeline:
     def names(self) -> list[str]:
         """Return the names of the workflows in the pipeline."""
         return [name for name, _ in self.workflows]
+
+    def dependencies(self) -> dict[str, list[str]]:
+        """Return, for each workflow, the earlier workflows it has to wait for.
+
+        A workflow waits for an earlier one if it reads a table the earlier one writes,
+        or writes a table the earlier one reads or writes, so that every workflow sees
+        the tables as they would be when running the list in order. Workflows that do
+        not declare their tables wait for, and are waited for by, everything.
+        """
+        names = self.names()
+        dependencies: dict[str, list[str]] = {}
+        for index, name in enumerate(names):
+            tables = self.tables.get(name)
+            dependencies[name] = [
+                earlier
+                for earlier in names[:index]
+                if tables is None
+                or earlier not in self.tables
+                or _conflicts(self.tables[earlier], tables)
+            ]
+        return dependencies
+
+
+def _conflicts(earlier: WorkflowTables, later: WorkflowTables) -> bool:
+    writes = set(earlier.writes)
+    return bool(
+        writes.intersection(later.reads)
+        or writes.intersection(later.writes)
+        or set(earlier.reads).intersection(later.writes)
+    )
@@ -20,4 +20,13 @@ class PipelineRunStats:
     """Float representing the input load time."""
 
     workflows: dict[str, dict[str, float]] = field(default_factory=dict)
-    """A dictionary of workflows."""
+    """The run time ("overall") and the resources used by each workflow."""
+
+    text_embedding_store: dict[str, float] = field(default_factory=dict)
+    """Hit and miss counts of the text embedding store."""
+
+    text_unit_duplicates: dict[str, float] = field(default_factory=dict)
+    """Counts of the text units and of the near-duplicate ones among them, and their ratio."""
+
+    concurrency: dict[str, dict[str, float]] = field(default_factory=dict)
+    """The state of the adaptive concurrency limiter of each language model, as of the end of the latest workflow."""
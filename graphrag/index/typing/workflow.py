@@ -4,7 +4,7 @@
 """Pipeline workflow types."""
 
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from graphrag.config.models.graph_rag_config import GraphRagConfig
@@ -19,6 +19,16 @@ class WorkflowFunctionOutput:
     """The result of the workflow function. This can be anything - we use it only for logging downstream, and expect each workflow function to write official outputs to the provided storage."""
 
 
+@dataclass
+class WorkflowTables:
+    """The storage tables a workflow reads and writes, used to work out what it depends on."""
+
+    reads: list[str] = field(default_factory=list)
+    """The tables the workflow may load."""
+    writes: list[str] = field(default_factory=list)
+    """The tables the workflow writes, including ones it loads and overwrites."""
+
+
 WorkflowFunction = Callable[
     [GraphRagConfig, PipelineRunContext],
     Awaitable[WorkflowFunctionOutput],
@@ -0,0 +1,264 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Adaptive concurrency limiting for the requests sent to a language model."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import statistics
+import time
+from collections import deque
+from contextvars import ContextVar, Token
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING
+
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+
+if TYPE_CHECKING:
+    from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+    from graphrag.config.models.language_model_config import LanguageModelConfig
+
+LATENCY_TOLERANCE = 2.0
+"""How many times the baseline median latency the median latency of the latest requests can reach before the service counts as slowing down."""
+
+LATENCY_WINDOW = 50
+"""The number of requests the baseline and the latest median latencies are measured over."""
+
+BACKOFF = 0.5
+"""The factor the limit is multiplied by when the service is throttling or slowing down."""
+
+WINDOW = 100
+"""The number of latest tasks the throughput is measured over."""
+
+
+@dataclass
+class ConcurrencyStats:
+    """The state of a concurrency limiter."""
+
+    limit: int
+    """The number of tasks currently allowed to run at the same time."""
+
+    in_flight: int
+    """The number of tasks running."""
+
+    completed: int
+    """The number of tasks completed."""
+
+    throttled: int
+    """The number of times the limit was lowered."""
+
+    throughput: float
+    """The number of tasks completed per second, over the latest tasks."""
+
+
+@dataclass
+class _Slot:
+    limiter: AdaptiveConcurrencyLimiter
+    start: float
+    token: Token | None = None
+    request_start: float | None = None
+    requested: bool = field(default=False)
+    throttled: bool = field(default=False)
+
+
+_current_slot: ContextVar[_Slot | None] = ContextVar("current_slot", default=None)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits the number of tasks running at the same time, adapting the limit to the service they call.
+
+    The limit follows an additive-increase/multiplicative-decrease scheme: it grows by one
+    for every `limit` tasks completed while it was fully in use, and is multiplied by
+    `backoff` when a request is throttled or times out, or when the service slows down
+    under the load. The latency is compared on the median of windows of requests, so the
+    latency of requests of different sizes does not count as a slowdown as long as the
+    mix stays the same: the median of the first window, after the start and after every
+    time the limit is lowered, is the baseline the following windows are compared to.
+    The limit is lowered at most once for the tasks started before the last time it was
+    lowered, so a burst of errors only counts once, and their latency is not measured.
+    Tasks that do not call the service (e.g. because the responses are cached) leave the
+    limit as it is.
+
+    It is used like an `asyncio.Semaphore`, and can be shared by everything calling the
+    same service.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        min_limit: int,
+        max_limit: int,
+        initial_limit: int | None = None,
+        callbacks: WorkflowCallbacks | None = None,
+        latency_tolerance: float = LATENCY_TOLERANCE,
+        backoff: float = BACKOFF,
+    ):
+        self._name = name
+        self._min_limit = max(min_limit, 1)
+        self._max_limit = max(max_limit, self._min_limit)
+        self._limit = float(
+            min(max(initial_limit or self._min_limit, self._min_limit), self._max_limit)
+        )
+        self._callbacks = callbacks or NoopWorkflowCallbacks()
+        self._latency_tolerance = latency_tolerance
+        self._backoff = backoff
+        self._condition = asyncio.Condition()
+        self._in_flight = 0
+        self._completed = 0
+        self._throttled = 0
+        self._baseline: float | None = None
+        self._latencies: list[float] = []
+        self._last_back_off = -math.inf
+        self._completions: deque[float] = deque(maxlen=WINDOW)
+
+    @property
+    def limit(self) -> int:
+        """Get the number of tasks currently allowed to run at the same time."""
+        return int(self._limit)
+
+    def stats(self) -> ConcurrencyStats:
+        """Get the state of the limiter."""
+        span = (
+            self._completions[-1] - self._completions[0]
+            if len(self._completions) > 1
+            else 0
+        )
+        return ConcurrencyStats(
+            limit=self.limit,
+            in_flight=self._in_flight,
+            completed=self._completed,
+            throttled=self._throttled,
+            throughput=(len(self._completions) - 1) / span if span > 0 else 0,
+        )
+
+    async def __aenter__(self) -> None:
+        """Wait for a slot to run a task in."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        slot = _Slot(self, time.monotonic())
+        slot.token = _current_slot.set(slot)
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Release the slot of the task, adapting the limit to how it went."""
+        slot = _current_slot.get()
+        if slot is not None and slot.token is not None:
+            _current_slot.reset(slot.token)
+        if slot is not None and slot.limiter is self:
+            self._complete(slot, failed=exc_type is not None)
+        async with self._condition:
+            self._in_flight -= 1
+            # wake only the waiters that can run, in the order they came in
+            self._condition.notify(max(self.limit - self._in_flight, 0))
+
+    def _complete(self, slot: _Slot, failed: bool) -> None:
+        self._completed += 1
+        self._completions.append(time.monotonic())
+        if not slot.requested or slot.throttled or failed:
+            # the service was not called (e.g. the responses were cached), or the
+            # limit was already lowered
+            return
+        if slot.start >= self._last_back_off and self._in_flight >= self.limit:
+            # tasks started under a limit that was since lowered do not raise it
+            self._set_limit(self._limit + 1 / self._limit)
+
+    def observe(self, latency: float, started: float) -> None:
+        """Record the latency of a request, in seconds, made by a task started at `started` (a `time.monotonic` time)."""
+        if started < self._last_back_off:
+            # the request ran under a limit that was since lowered
+            return
+        self._latencies.append(latency)
+        if len(self._latencies) < LATENCY_WINDOW:
+            return
+        median = statistics.median(self._latencies)
+        self._latencies.clear()
+        if self._baseline is None:
+            self._baseline = median
+        elif median > self._latency_tolerance * self._baseline:
+            self.back_off(started)
+
+    def back_off(self, started: float) -> None:
+        """Lower the limit, as a task started at `started` (a `time.monotonic` time) hit a busy service."""
+        if started < self._last_back_off:
+            return
+        self._last_back_off = time.monotonic()
+        self._throttled += 1
+        # the baseline latency is measured again under the lowered limit
+        self._baseline = None
+        self._latencies.clear()
+        self._set_limit(self._limit * self._backoff)
+
+    def _set_limit(self, limit: float) -> None:
+        previous = self.limit
+        self._limit = min(max(limit, self._min_limit), self._max_limit)
+        if self.limit != previous:
+            self._callbacks.log(
+                f"{self._name} concurrency limit changed from {previous} to {self.limit}",
+                details=asdict(self.stats()),
+            )
+
+
+class ConcurrencyLimiters:
+    """The adaptive concurrency limiters of a pipeline run, one per language model."""
+
+    def __init__(self, callbacks: WorkflowCallbacks | None = None):
+        self._callbacks = callbacks
+        self._limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+
+    def get(
+        self, model_id: str, config: LanguageModelConfig
+    ) -> AdaptiveConcurrencyLimiter | None:
+        """Get the limiter of a language model, or None if its concurrency is fixed."""
+        if not config.adaptive_concurrency:
+            return None
+        if model_id not in self._limiters:
+            self._limiters[model_id] = AdaptiveConcurrencyLimiter(
+                name=model_id,
+                min_limit=config.min_concurrent_requests,
+                max_limit=config.max_concurrent_requests,
+                initial_limit=config.concurrent_requests,
+                callbacks=self._callbacks,
+            )
+        return self._limiters[model_id]
+
+    def stats(self) -> dict[str, ConcurrencyStats]:
+        """Get the state of every limiter, by language model."""
+        return {name: limiter.stats() for name, limiter in self._limiters.items()}
+
+    def report(self, workflow: str) -> None:
+        """Log the state of every limiter, as of the end of a workflow."""
+        if self._callbacks is None:
+            return
+        for name, stats in self.stats().items():
+            self._callbacks.log(
+                f"{name} concurrency after {workflow}: limit {stats.limit}, "
+                f"{stats.completed} tasks completed, {stats.throttled} back-offs, "
+                f"{stats.throughput:.1f} tasks/s",
+                details=asdict(stats),
+            )
+
+
+def record_throttle() -> None:
+    """Lower the limit of the task being run, as its request was throttled or timed out."""
+    slot = _current_slot.get()
+    if slot is not None and not slot.throttled:
+        slot.throttled = True
+        slot.limiter.back_off(slot.start)
+
+
+def record_request() -> None:
+    """Note that the task being run is sending a request to the service."""
+    slot = _current_slot.get()
+    if slot is not None:
+        slot.requested = True
+        slot.request_start = time.monotonic()
+
+
+def record_response() -> None:
+    """Note that the task being run got the response to its request, recording its latency."""
+    slot = _current_slot.get()
+    if slot is not None and slot.request_start is not None:
+        slot.limiter.observe(time.monotonic() - slot.request_start, slot.start)
+        slot.request_start = None
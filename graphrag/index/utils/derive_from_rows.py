@@ -7,14 +7,17 @@ import asyncio
 import inspect
 import logging
 import traceback
-from collections.abc import Awaitable, Callable, Coroutine, Hashable
+from collections.abc import Awaitable, Callable, Coroutine, Hashable, Sequence
 from typing import Any, TypeVar, cast
 
+import numpy as np
 import pandas as pd
 
 from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
+from graphrag.index.utils.concurrency_limiter import AdaptiveConcurrencyLimiter
+from graphrag.index.utils.scheduling import TaskTimings, gather_longest_first
 from graphrag.logger.progress import progress_ticker
 
 logger = logging.getLogger(__name__)
@@ -37,17 +40,27 @@ async def derive_from_rows(
     callbacks: WorkflowCallbacks | None = None,
     num_threads: int = 4,
     async_type: AsyncType = AsyncType.AsyncIO,
+    limiter: AdaptiveConcurrencyLimiter | None = None,
+    costs: Sequence[float] | np.ndarray | None = None,
+    name: str = "derive_from_rows",
 ) -> list[ItemType | None]:
-    """Apply a generic transform function to each row. Any errors will be reported and thrown."""
+    """Apply a generic transform function to each row. Any errors will be reported and thrown.
+
+    With a `limiter`, the number of rows transformed at the same time is adapted by the
+    limiter instead of being fixed to `num_threads`. With the estimated `costs` of the
+    rows, the most expensive rows are started first, so they do not stretch the end of
+    the run; the results are in the order of the rows either way. The latency statistics
+    of the rows are reported under `name`.
+    """
     callbacks = callbacks or NoopWorkflowCallbacks()
     match async_type:
         case AsyncType.AsyncIO:
             return await derive_from_rows_asyncio(
-                input, transform, callbacks, num_threads
+                input, transform, callbacks, num_threads, limiter, costs, name
             )
         case AsyncType.Threaded:
             return await derive_from_rows_asyncio_threads(
-                input, transform, callbacks, num_threads
+                input, transform, callbacks, num_threads, limiter, costs, name
             )
         case _:
             msg = f"Unsupported scheduling type {async_type}"
@@ -62,13 +75,16 @@ async def derive_from_rows_asyncio_threads(
     transform: Callable[[pd.Series], Awaitable[ItemType]],
     callbacks: WorkflowCallbacks,
     num_threads: int | None = 4,
+    limiter: AdaptiveConcurrencyLimiter | None = None,
+    costs: Sequence[float] | np.ndarray | None = None,
+    name: str = "derive_from_rows",
 ) -> list[ItemType | None]:
     """
     Derive from rows asynchronously.
 
     This is useful for IO bound operations.
     """
-    semaphore = asyncio.Semaphore(num_threads or 4)
+    semaphore = limiter or asyncio.Semaphore(num_threads or 4)
 
     async def gather(execute: ExecuteFn[ItemType]) -> list[ItemType | None]:
         tasks = [asyncio.to_thread(execute, row) for row in input.iterrows()]
@@ -79,9 +95,9 @@ async def derive_from_rows_asyncio_threads(
                 thread = await task
                 return await thread
 
-        return await asyncio.gather(*[execute_task(task) for task in tasks])
+        return await gather_longest_first([execute_task(task) for task in tasks], costs)
 
-    return await _derive_from_rows_base(input, transform, callbacks, gather)
+    return await _derive_from_rows_base(input, transform, callbacks, gather, name)
 
 
 """A module containing the derive_from_rows_async method."""
@@ -92,13 +108,16 @@ async def derive_from_rows_asyncio(
     transform: Callable[[pd.Series], Awaitable[ItemType]],
     callbacks: WorkflowCallbacks,
     num_threads: int = 4,
+    limiter: AdaptiveConcurrencyLimiter | None = None,
+    costs: Sequence[float] | np.ndarray | None = None,
+    name: str = "derive_from_rows",
 ) -> list[ItemType | None]:
     """
     Derive from rows asynchronously.
 
     This is useful for IO bound operations.
     """
-    semaphore = asyncio.Semaphore(num_threads or 4)
+    semaphore = limiter or asyncio.Semaphore(num_threads or 4)
 
     async def gather(execute: ExecuteFn[ItemType]) -> list[ItemType | None]:
         async def execute_row_protected(
@@ -107,12 +126,11 @@ async def derive_from_rows_asyncio(
             async with semaphore:
                 return await execute(row)
 
-        tasks = [
-            asyncio.create_task(execute_row_protected(row)) for row in input.iterrows()
-        ]
-        return await asyncio.gather(*tasks)
+        return await gather_longest_first(
+            [execute_row_protected(row) for row in input.iterrows()], costs
+        )
 
-    return await _derive_from_rows_base(input, transform, callbacks, gather)
+    return await _derive_from_rows_base(input, transform, callbacks, gather, name)
 
 
 ItemType = TypeVar("ItemType")
@@ -126,6 +144,7 @@ async def _derive_from_rows_base(
     transform: Callable[[pd.Series], Awaitable[ItemType]],
     callbacks: WorkflowCallbacks,
     gather: GatherFn[ItemType],
+    name: str = "derive_from_rows",
 ) -> list[ItemType | None]:
     """
     Derive from rows asynchronously.
@@ -134,12 +153,14 @@ async def _derive_from_rows_base(
     """
     tick = progress_ticker(callbacks.progress, num_total=len(input))
     errors: list[tuple[BaseException, str]] = []
+    timings = TaskTimings()
 
     async def execute(row: tuple[Any, pd.Series]) -> ItemType | None:
         try:
-            result = transform(row[1])
-            if inspect.iscoroutine(result):
-                result = await result
+            with timings.track():
+                result = transform(row[1])
+                if inspect.iscoroutine(result):
+                    result = await result
         except Exception as e:  # noqa: BLE001
             errors.append((e, traceback.format_exc()))
             return None
@@ -151,6 +172,7 @@ async def _derive_from_rows_base(
     result = await gather(execute)
 
     tick.done()
+    timings.report(name, callbacks)
 
     for error, stack in errors:
         callbacks.error("parallel transformation error", error, stack)
@@ -0,0 +1,113 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Longest-first scheduling of concurrent tasks, with their latency statistics."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+
+import numpy as np
+
+from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+
+T = TypeVar("T")
+
+
+@dataclass
+class TaskLatencyStats:
+    """The latency of the tasks run by a stage, in seconds."""
+
+    tasks: int
+    """The number of tasks run."""
+
+    wall_time: float
+    """The time from the first task started to the last one completed."""
+
+    work_time: float
+    """The total time the tasks ran, one after the other."""
+
+    p50: float
+    """The median latency of a task."""
+
+    p95: float
+    """The 95th percentile latency of a task."""
+
+    max: float
+    """The latency of the slowest task."""
+
+    tail_time: float
+    """The time from the last task started to the last one completed."""
+
+
+class TaskTimings:
+    """Records when the tasks of a stage run, to report their latency statistics."""
+
+    def __init__(self):
+        self._starts: list[float] = []
+        self._ends: list[float] = []
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Time a task run within the context."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._starts.append(start)
+            self._ends.append(time.monotonic())
+
+    def stats(self) -> TaskLatencyStats:
+        """Get the latency statistics of the tasks run so far."""
+        if not self._starts:
+            return TaskLatencyStats(0, 0, 0, 0, 0, 0, 0)
+        starts = np.asarray(self._starts)
+        ends = np.asarray(self._ends)
+        latencies = ends - starts
+        p50, p95 = np.percentile(latencies, [50, 95])
+        return TaskLatencyStats(
+            tasks=len(latencies),
+            wall_time=float(ends.max() - starts.min()),
+            work_time=float(latencies.sum()),
+            p50=float(p50),
+            p95=float(p95),
+            max=float(latencies.max()),
+            tail_time=float(ends.max() - starts.max()),
+        )
+
+    def report(self, name: str, callbacks: WorkflowCallbacks) -> None:
+        """Log the latency statistics of the tasks run so far."""
+        stats = self.stats()
+        if stats.tasks == 0:
+            return
+        callbacks.log(
+            f"{name}: {stats.tasks} tasks in {stats.wall_time:.1f}s, latency p50 "
+            f"{stats.p50:.2f}s p95 {stats.p95:.2f}s max {stats.max:.2f}s, "
+            f"tail {stats.tail_time:.1f}s",
+            details=asdict(stats),
+        )
+
+
+def longest_first(costs: Sequence[float] | np.ndarray) -> np.ndarray:
+    """Get the order to start tasks in, from the most expensive, keeping ties in order."""
+    return np.argsort(-np.asarray(costs, dtype=float), kind="stable")
+
+
+async def gather_longest_first(
+    awaitables: Sequence[Awaitable[T]], costs: Sequence[float] | np.ndarray | None
+) -> list[T]:
+    """Run the awaitables concurrently, starting the most expensive ones first.
+
+    The awaitables are expected to wait for a shared semaphore, which lets them through
+    in the order they were started. The results are returned in the order of the
+    awaitables, as with `asyncio.gather`.
+    """
+    if costs is None:
+        return await asyncio.gather(*awaitables)
+    tasks: list[Any] = [None] * len(awaitables)
+    for index in longest_first(costs):
+        tasks[index] = asyncio.ensure_future(awaitables[index])
+    return await asyncio.gather(*tasks)
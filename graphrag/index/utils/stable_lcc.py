@@ -63,5 +63,10 @@ def _stabilize_graph(graph: nx.Graph) -> nx.Graph:
 
 def normalize_node_names(graph: nx.Graph | nx.DiGraph) -> nx.Graph | nx.DiGraph:
     """Normalize node names."""
-    node_mapping = {node: html.unescape(node.upper().strip()) for node in graph.nodes()}  # type: ignore
+    node_mapping = {node: normalize_node_name(node) for node in graph.nodes()}  # type: ignore
     return nx.relabel_nodes(graph, node_mapping)
+
+
+def normalize_node_name(name: str) -> str:
+    """Normalize a node name."""
+    return html.unescape(name.upper().strip())
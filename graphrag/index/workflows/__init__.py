@@ -4,6 +4,7 @@
 
 """A package containing all built-in workflow definitions."""
 
+from graphrag.index.typing.workflow import WorkflowTables
 from graphrag.index.workflows.factory import PipelineFactory
 
 from .create_base_text_units import (
@@ -24,6 +25,9 @@ from .create_final_documents import (
 from .create_final_text_units import (
     run_workflow as run_create_final_text_units,
 )
+from .deduplicate_text_units import (
+    run_workflow as run_deduplicate_text_units,
+)
 from .extract_covariates import (
     run_workflow as run_extract_covariates,
 )
@@ -43,18 +47,72 @@ from .prune_graph import (
     run_workflow as run_prune_graph,
 )
 
-# register all of our built-in workflows at once
-PipelineFactory.register_all({
-    "create_base_text_units": run_create_base_text_units,
-    "create_communities": run_create_communities,
-    "create_community_reports_text": run_create_community_reports_text,
-    "create_community_reports": run_create_community_reports,
-    "extract_covariates": run_extract_covariates,
-    "create_final_documents": run_create_final_documents,
-    "create_final_text_units": run_create_final_text_units,
-    "extract_graph_nlp": run_extract_graph_nlp,
-    "extract_graph": run_extract_graph,
-    "finalize_graph": run_finalize_graph,
-    "generate_text_embeddings": run_generate_text_embeddings,
-    "prune_graph": run_prune_graph,
-})
+# register all of our built-in workflows at once, along with the tables they
+# read and write so that independent ones can run concurrently
+PipelineFactory.register_all(
+    {
+        "create_base_text_units": run_create_base_text_units,
+        "create_communities": run_create_communities,
+        "create_community_reports_text": run_create_community_reports_text,
+        "create_community_reports": run_create_community_reports,
+        "deduplicate_text_units": run_deduplicate_text_units,
+        "extract_covariates": run_extract_covariates,
+        "create_final_documents": run_create_final_documents,
+        "create_final_text_units": run_create_final_text_units,
+        "extract_graph_nlp": run_extract_graph_nlp,
+        "extract_graph": run_extract_graph,
+        "finalize_graph": run_finalize_graph,
+        "generate_text_embeddings": run_generate_text_embeddings,
+        "prune_graph": run_prune_graph,
+    },
+    tables={
+        "create_base_text_units": WorkflowTables(
+            reads=["documents"], writes=["text_units"]
+        ),
+        "create_communities": WorkflowTables(
+            reads=["entities", "relationships"], writes=["communities"]
+        ),
+        "create_community_reports_text": WorkflowTables(
+            reads=["entities", "communities", "text_units"],
+            writes=["community_reports"],
+        ),
+        "create_community_reports": WorkflowTables(
+            reads=["relationships", "entities", "communities", "covariates"],
+            writes=["community_reports"],
+        ),
+        "deduplicate_text_units": WorkflowTables(
+            reads=["text_units"], writes=["text_units"]
+        ),
+        "extract_covariates": WorkflowTables(
+            reads=["text_units"], writes=["covariates"]
+        ),
+        "create_final_documents": WorkflowTables(
+            reads=["documents", "text_units"], writes=["documents"]
+        ),
+        "create_final_text_units": WorkflowTables(
+            reads=["text_units", "entities", "relationships", "covariates"],
+            writes=["text_units"],
+        ),
+        "extract_graph_nlp": WorkflowTables(
+            reads=["text_units"], writes=["entities", "relationships"]
+        ),
+        "extract_graph": WorkflowTables(
+            reads=["text_units"], writes=["entities", "relationships"]
+        ),
+        "finalize_graph": WorkflowTables(
+            reads=["entities", "relationships"], writes=["entities", "relationships"]
+        ),
+        "generate_text_embeddings": WorkflowTables(
+            reads=[
+                "documents",
+                "relationships",
+                "text_units",
+                "entities",
+                "community_reports",
+            ],
+        ),
+        "prune_graph": WorkflowTables(
+            reads=["entities", "relationships"], writes=["entities", "relationships"]
+        ),
+    },
+)
@@ -3,7 +3,11 @@
 
 """A module containing run_workflow method definition."""
 
-import json
+import asyncio
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Any, cast
 
 import pandas as pd
@@ -11,13 +15,15 @@ import pandas as pd
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.chunking_config import ChunkStrategyType
 from graphrag.config.models.graph_rag_config import GraphRagConfig
-from graphrag.index.operations.chunk_text.chunk_text import chunk_text
-from graphrag.index.operations.chunk_text.strategies import get_encoding_fn
+from graphrag.index.operations.chunk_text.chunk_rows import chunk_row, chunk_shard
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
 from graphrag.index.utils.hashing import gen_sha512_hash
-from graphrag.logger.progress import Progress
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.logger.progress import Progress, progress_ticker
+
+# the number of shards each worker gets, so the progress moves in small steps and a
+# worker done with its shards picks up the remaining ones
+SHARDS_PER_WORKER = 4
 
 
 async def run_workflow(
@@ -25,11 +31,11 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to transform base text_units."""
-    documents = await load_table_from_storage("documents", context.storage)
+    documents = await context.tables.load("documents")
 
     chunks = config.chunks
 
-    output = create_base_text_units(
+    output = await create_base_text_units(
         documents,
         context.callbacks,
         chunks.group_by_columns,
@@ -39,14 +45,15 @@ async def run_workflow(
         strategy=chunks.strategy,
         prepend_metadata=chunks.prepend_metadata,
         chunk_size_includes_metadata=chunks.chunk_size_includes_metadata,
+        workers=chunks.workers,
     )
 
-    await write_table_to_storage(output, "text_units", context.storage)
+    await context.tables.write(output, "text_units")
 
     return WorkflowFunctionOutput(result=output)
 
 
-def create_base_text_units(
+async def create_base_text_units(
     documents: pd.DataFrame,
     callbacks: WorkflowCallbacks,
     group_by_columns: list[str],
@@ -56,8 +63,14 @@ def create_base_text_units(
     strategy: ChunkStrategyType,
     prepend_metadata: bool = False,
     chunk_size_includes_metadata: bool = False,
+    workers: int = 1,
 ) -> pd.DataFrame:
-    """All the steps to transform base text_units."""
+    """All the steps to transform base text_units.
+
+    With more than one worker, the documents are chunked in a pool of processes, while
+    the event loop keeps running. The chunks come out in the same order, with the same
+    ids, as when chunked in this one.
+    """
     sort = documents.sort_values(by=["id"], ascending=[True])
 
     sort["text_with_ids"] = list(
@@ -81,51 +94,30 @@ def create_base_text_units(
     )
     aggregated.rename(columns={"text_with_ids": "texts"}, inplace=True)
 
+    chunk_one_row = partial(
+        chunk_row,
+        size=size,
+        overlap=overlap,
+        encoding_model=encoding_model,
+        strategy=strategy,
+        prepend_metadata=prepend_metadata,
+        chunk_size_includes_metadata=chunk_size_includes_metadata,
+    )
+
     def chunker(row: dict[str, Any]) -> Any:
-        line_delimiter = ".\n"
-        metadata_str = ""
-        metadata_tokens = 0
-
-        if prepend_metadata and "metadata" in row:
-            metadata = row["metadata"]
-            if isinstance(metadata, str):
-                metadata = json.loads(metadata)
-            if isinstance(metadata, dict):
-                metadata_str = (
-                    line_delimiter.join(f"{k}: {v}" for k, v in metadata.items())
-                    + line_delimiter
-                )
-
-            if chunk_size_includes_metadata:
-                encode, _ = get_encoding_fn(encoding_model)
-                metadata_tokens = len(encode(metadata_str))
-                if metadata_tokens >= size:
-                    message = "Metadata tokens exceeds the maximum tokens per chunk. Please increase the tokens per chunk."
-                    raise ValueError(message)
-
-        chunked = chunk_text(
-            pd.DataFrame([row]).reset_index(drop=True),
-            column="texts",
-            size=size - metadata_tokens,
-            overlap=overlap,
-            encoding_model=encoding_model,
-            strategy=strategy,
-            callbacks=callbacks,
-        )[0]
-
-        if prepend_metadata:
-            for index, chunk in enumerate(chunked):
-                if isinstance(chunk, str):
-                    chunked[index] = metadata_str + chunk
-                else:
-                    chunked[index] = (
-                        (chunk[0], metadata_str + chunk[1], chunk[2]) if chunk else None
-                    )
-
-        row["chunks"] = chunked
+        row["chunks"] = chunk_one_row(row, callbacks=callbacks)
         return row
 
-    aggregated = aggregated.apply(lambda row: chunker(row), axis=1)
+    if workers > 1 and len(aggregated) > 1:
+        aggregated["chunks"] = pd.Series(
+            await _chunk_rows_in_processes(
+                aggregated, chunk_one_row, workers, callbacks
+            ),
+            index=aggregated.index,
+            dtype=object,
+        )
+    else:
+        aggregated = aggregated.apply(lambda row: chunker(row), axis=1)
 
     aggregated = cast("pd.DataFrame", aggregated[[*group_by_columns, "chunks"]])
     aggregated = aggregated.explode("chunks")
@@ -147,3 +139,43 @@ def create_base_text_units(
     return cast(
         "pd.DataFrame", aggregated[aggregated["text"].notna()].reset_index(drop=True)
     )
+
+
+async def _chunk_rows_in_processes(
+    rows: pd.DataFrame,
+    chunk_one_row: partial,
+    workers: int,
+    callbacks: WorkflowCallbacks,
+) -> list[list[Any]]:
+    """Chunk the rows in a pool of processes, reporting the progress as the shards complete."""
+    records = rows.to_dict("records")
+    shard_size = math.ceil(len(records) / (workers * SHARDS_PER_WORKER))
+    shards = [
+        records[start : start + shard_size]
+        for start in range(0, len(records), shard_size)
+    ]
+    tick = progress_ticker(callbacks.progress, len(records))
+    results: list[list[list[Any]]] = [[] for _ in shards]
+    loop = asyncio.get_running_loop()
+
+    async def run_shard(executor: ProcessPoolExecutor, index: int) -> None:
+        results[index] = await loop.run_in_executor(
+            executor, chunk_shard, shards[index], chunk_one_row
+        )
+        tick(len(shards[index]))
+
+    # the pipeline runs other threads (e.g. the resource monitor), which forked
+    # processes would inherit in whatever state they are in
+    executor = ProcessPoolExecutor(
+        max_workers=min(workers, len(shards)),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    try:
+        await asyncio.gather(
+            *[run_shard(executor, index) for index in range(len(shards))]
+        )
+    finally:
+        # the results are all in, or the shards left are not needed anymore
+        executor.shutdown(wait=False, cancel_futures=True)
+    tick.done()
+    return [chunks for shard in results for chunks in shard]
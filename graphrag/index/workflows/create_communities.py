@@ -10,13 +10,13 @@ from uuid import uuid4
 import numpy as np
 import pandas as pd
 
+from graphrag.config.enums import ClusterStrategyType
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.data_model.schemas import COMMUNITIES_FINAL_COLUMNS
 from graphrag.index.operations.cluster_graph import cluster_graph
-from graphrag.index.operations.create_graph import create_graph
+from graphrag.index.operations.compact_graph import create_compact_graph
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 
 async def run_workflow(
@@ -24,12 +24,13 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to transform final communities."""
-    entities = await load_table_from_storage("entities", context.storage)
-    relationships = await load_table_from_storage("relationships", context.storage)
+    entities = await context.tables.load("entities")
+    relationships = await context.tables.load("relationships")
 
     max_cluster_size = config.cluster_graph.max_cluster_size
     use_lcc = config.cluster_graph.use_lcc
     seed = config.cluster_graph.seed
+    strategy = config.cluster_graph.strategy
 
     output = create_communities(
         entities,
@@ -37,9 +38,10 @@ async def run_workflow(
         max_cluster_size=max_cluster_size,
         use_lcc=use_lcc,
         seed=seed,
+        strategy=strategy,
     )
 
-    await write_table_to_storage(output, "communities", context.storage)
+    await context.tables.write(output, "communities")
 
     return WorkflowFunctionOutput(result=output)
 
@@ -50,15 +52,17 @@ def create_communities(
     max_cluster_size: int,
     use_lcc: bool,
     seed: int | None = None,
+    strategy: ClusterStrategyType = ClusterStrategyType.graspologic,
 ) -> pd.DataFrame:
     """All the steps to transform final communities."""
-    graph = create_graph(relationships)
+    graph = create_compact_graph(relationships)
 
     clusters = cluster_graph(
         graph,
         max_cluster_size,
         use_lcc,
         seed=seed,
+        strategy=strategy,
     )
 
     communities = pd.DataFrame(
@@ -69,52 +73,15 @@ def create_communities(
     # aggregate entity ids for each community
     entity_ids = communities.merge(entities, on="title", how="inner")
     entity_ids = (
-        entity_ids.groupby("community").agg(entity_ids=("id", list)).reset_index()
+        _group_ids(entity_ids["community"].to_numpy(), entity_ids["id"].to_numpy())
+        .rename("entity_ids")
+        .rename_axis("community")
+        .reset_index()
     )
 
     # aggregate relationships ids for each community
     # these are limited to only those where the source and target are in the same community
-    max_level = communities["level"].max()
-    all_grouped = pd.DataFrame(
-        columns=["community", "level", "relationship_ids", "text_unit_ids"]  # type: ignore
-    )
-    for level in range(max_level + 1):
-        communities_at_level = communities.loc[communities["level"] == level]
-        sources = relationships.merge(
-            communities_at_level, left_on="source", right_on="title", how="inner"
-        )
-        targets = sources.merge(
-            communities_at_level, left_on="target", right_on="title", how="inner"
-        )
-        matched = targets.loc[targets["community_x"] == targets["community_y"]]
-        text_units = matched.explode("text_unit_ids")
-        grouped = (
-            text_units.groupby(["community_x", "level_x", "parent_x"])
-            .agg(relationship_ids=("id", list), text_unit_ids=("text_unit_ids", list))
-            .reset_index()
-        )
-        grouped.rename(
-            columns={
-                "community_x": "community",
-                "level_x": "level",
-                "parent_x": "parent",
-            },
-            inplace=True,
-        )
-        all_grouped = pd.concat([
-            all_grouped,
-            grouped.loc[
-                :, ["community", "level", "parent", "relationship_ids", "text_unit_ids"]
-            ],
-        ])
-
-    # deduplicate the lists
-    all_grouped["relationship_ids"] = all_grouped["relationship_ids"].apply(
-        lambda x: sorted(set(x))
-    )
-    all_grouped["text_unit_ids"] = all_grouped["text_unit_ids"].apply(
-        lambda x: sorted(set(x))
-    )
+    all_grouped = _aggregate_relationships(communities, relationships)
 
     # join it all up and add some new fields
     final_communities = all_grouped.merge(entity_ids, on="community", how="inner")
@@ -147,3 +114,99 @@ def create_communities(
         :,
         COMMUNITIES_FINAL_COLUMNS,
     ]
+
+
+def _aggregate_relationships(
+    communities: pd.DataFrame, relationships: pd.DataFrame
+) -> pd.DataFrame:
+    """Collect the sorted, unique relationship and text unit ids of each community.
+
+    The relationship ends are coded as integers once, then each level only maps them
+    to the community of their node, so the relationships are never merged or exploded
+    per level.
+    """
+    titles = pd.Index(communities["title"].unique())
+    sources = titles.get_indexer(relationships["source"])
+    targets = titles.get_indexer(relationships["target"])
+
+    matched_communities = [np.empty(0, dtype=np.int64)]
+    matched_relationships = [np.empty(0, dtype=np.int64)]
+    for _, at_level in communities.groupby("level"):
+        # the community of each node at the level, -1 for the nodes not in one at that
+        # level; the extra last entry is where the ends not in any community (-1) point
+        node_community = np.full(len(titles) + 1, -1, dtype=np.int64)
+        node_community[titles.get_indexer(at_level["title"])] = at_level["community"]
+        source_community = node_community[sources]
+        matched = np.flatnonzero(
+            (source_community >= 0) & (source_community == node_community[targets])
+        )
+        matched_communities.append(source_community[matched])
+        matched_relationships.append(matched)
+    matches = pd.DataFrame(
+        {
+            "community": np.concatenate(matched_communities),
+            "relationship": np.concatenate(matched_relationships),
+        }
+    )
+
+    relationship_ids = _collect_ids(
+        matches["community"],
+        relationships["id"].to_numpy()[matches["relationship"].to_numpy()],
+    )
+    text_unit_ids = relationships["text_unit_ids"].reset_index(drop=True).explode()
+    text_unit_ids = text_unit_ids[text_unit_ids.notna()]
+    text_units = matches.merge(
+        pd.DataFrame(
+            {
+                "relationship": text_unit_ids.index.to_numpy(),
+                "text_unit_id": text_unit_ids.to_numpy(),
+            }
+        ),
+        on="relationship",
+    )
+    text_unit_ids = _collect_ids(
+        text_units["community"], text_units["text_unit_id"].to_numpy()
+    ).reindex(relationship_ids.index)
+
+    levels = communities.drop_duplicates("community").set_index("community")
+    grouped = pd.DataFrame(
+        {
+            "community": relationship_ids.index.to_numpy(),
+            "relationship_ids": relationship_ids.to_numpy(),
+            "text_unit_ids": [
+                ids if isinstance(ids, list) else [] for ids in text_unit_ids.to_numpy()
+            ],
+        }
+    )
+    grouped["level"] = grouped["community"].map(levels["level"])
+    grouped["parent"] = grouped["community"].map(levels["parent"])
+    grouped.sort_values(["level", "community"], inplace=True)
+    return grouped.loc[
+        :, ["community", "level", "parent", "relationship_ids", "text_unit_ids"]
+    ]
+
+
+def _collect_ids(communities: pd.Series, ids: np.ndarray) -> pd.Series:
+    """Collect the sorted, unique ids of each community."""
+    pairs = pd.DataFrame({"community": communities.to_numpy(), "id": ids})
+    pairs = pairs.drop_duplicates().sort_values(["community", "id"])
+    return _group_ids(pairs["community"].to_numpy(), pairs["id"].to_numpy())
+
+
+def _group_ids(communities: np.ndarray, ids: np.ndarray) -> pd.Series:
+    """Group ids into a list per community, keeping their order within a community.
+
+    The arrays are cut where the community changes, rather than building a list per
+    group through a groupby, which is slow with many small communities.
+    """
+    if len(communities) == 0:
+        return pd.Series([], index=communities.astype(np.int64), dtype=object)
+    order = np.argsort(communities, kind="stable")
+    communities = communities[order]
+    boundaries = np.flatnonzero(communities[1:] != communities[:-1]) + 1
+    groups = np.split(ids[order], boundaries)
+    return pd.Series(
+        [group.tolist() for group in groups],
+        index=communities[np.r_[0, boundaries]],
+        dtype=object,
+    )
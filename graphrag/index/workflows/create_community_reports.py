@@ -26,11 +26,7 @@ from graphrag.index.operations.summarize_communities.summarize_communities impor
 )
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import (
-    load_table_from_storage,
-    storage_has_table,
-    write_table_to_storage,
-)
+from graphrag.index.utils.concurrency_limiter import AdaptiveConcurrencyLimiter
 
 
 async def run_workflow(
@@ -38,20 +34,21 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to transform community reports."""
-    edges = await load_table_from_storage("relationships", context.storage)
-    entities = await load_table_from_storage("entities", context.storage)
-    communities = await load_table_from_storage("communities", context.storage)
+    edges = await context.tables.load("relationships")
+    entities = await context.tables.load("entities")
+    communities = await context.tables.load("communities")
     claims = None
-    if config.extract_claims.enabled and await storage_has_table(
-        "covariates", context.storage
-    ):
-        claims = await load_table_from_storage("covariates", context.storage)
+    if config.extract_claims.enabled and await context.tables.has("covariates"):
+        claims = await context.tables.load("covariates")
 
     community_reports_llm_settings = config.get_language_model_config(
         config.community_reports.model_id
     )
     async_mode = community_reports_llm_settings.async_mode
     num_threads = community_reports_llm_settings.concurrent_requests
+    limiter = context.concurrency.get(
+        config.community_reports.model_id, community_reports_llm_settings
+    )
     summarization_strategy = config.community_reports.resolved_strategy(
         config.root_dir, community_reports_llm_settings
     )
@@ -66,9 +63,10 @@ async def run_workflow(
         summarization_strategy=summarization_strategy,
         async_mode=async_mode,
         num_threads=num_threads,
+        limiter=limiter,
     )
 
-    await write_table_to_storage(output, "community_reports", context.storage)
+    await context.tables.write(output, "community_reports")
 
     return WorkflowFunctionOutput(result=output)
 
@@ -83,6 +81,7 @@ async def create_community_reports(
     summarization_strategy: dict,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
+    limiter: AdaptiveConcurrencyLimiter | None = None,
 ) -> pd.DataFrame:
     """All the steps to transform community reports."""
     nodes = explode_communities(communities, entities)
@@ -119,6 +118,7 @@ async def create_community_reports(
         max_input_length=max_input_length,
         async_mode=async_mode,
         num_threads=num_threads,
+        limiter=limiter,
     )
 
     return finalize_community_reports(community_reports, communities)
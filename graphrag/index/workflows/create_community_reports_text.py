@@ -27,7 +27,7 @@ from graphrag.index.operations.summarize_communities.text_unit_context.context_b
 )
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.index.utils.concurrency_limiter import AdaptiveConcurrencyLimiter
 
 log = logging.getLogger(__name__)
 
@@ -37,16 +37,19 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to transform community reports."""
-    entities = await load_table_from_storage("entities", context.storage)
-    communities = await load_table_from_storage("communities", context.storage)
+    entities = await context.tables.load("entities")
+    communities = await context.tables.load("communities")
 
-    text_units = await load_table_from_storage("text_units", context.storage)
+    text_units = await context.tables.load("text_units")
 
     community_reports_llm_settings = config.get_language_model_config(
         config.community_reports.model_id
     )
     async_mode = community_reports_llm_settings.async_mode
     num_threads = community_reports_llm_settings.concurrent_requests
+    limiter = context.concurrency.get(
+        config.community_reports.model_id, community_reports_llm_settings
+    )
     summarization_strategy = config.community_reports.resolved_strategy(
         config.root_dir, community_reports_llm_settings
     )
@@ -60,9 +63,10 @@ async def run_workflow(
         summarization_strategy,
         async_mode=async_mode,
         num_threads=num_threads,
+        limiter=limiter,
     )
 
-    await write_table_to_storage(output, "community_reports", context.storage)
+    await context.tables.write(output, "community_reports")
 
     return WorkflowFunctionOutput(result=output)
 
@@ -76,6 +80,7 @@ async def create_community_reports_text(
     summarization_strategy: dict,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
+    limiter: AdaptiveConcurrencyLimiter | None = None,
 ) -> pd.DataFrame:
     """All the steps to transform community reports."""
     nodes = explode_communities(communities, entities)
@@ -101,6 +106,7 @@ async def create_community_reports_text(
         max_input_length=max_input_length,
         async_mode=async_mode,
         num_threads=num_threads,
+        limiter=limiter,
     )
 
     return finalize_community_reports(community_reports, communities)
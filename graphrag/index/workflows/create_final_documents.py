@@ -9,7 +9,6 @@ from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.data_model.schemas import DOCUMENTS_FINAL_COLUMNS
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 
 async def run_workflow(
@@ -17,12 +16,12 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to transform final documents."""
-    documents = await load_table_from_storage("documents", context.storage)
-    text_units = await load_table_from_storage("text_units", context.storage)
+    documents = await context.tables.load("documents")
+    text_units = await context.tables.load("text_units")
 
     output = create_final_documents(documents, text_units)
 
-    await write_table_to_storage(output, "documents", context.storage)
+    await context.tables.write(output, "documents")
 
     return WorkflowFunctionOutput(result=output)
 
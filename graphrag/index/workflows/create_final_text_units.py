@@ -9,11 +9,6 @@ from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.data_model.schemas import TEXT_UNITS_FINAL_COLUMNS
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import (
-    load_table_from_storage,
-    storage_has_table,
-    write_table_to_storage,
-)
 
 
 async def run_workflow(
@@ -21,16 +16,12 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to transform the text units."""
-    text_units = await load_table_from_storage("text_units", context.storage)
-    final_entities = await load_table_from_storage("entities", context.storage)
-    final_relationships = await load_table_from_storage(
-        "relationships", context.storage
-    )
+    text_units = await context.tables.load("text_units")
+    final_entities = await context.tables.load("entities")
+    final_relationships = await context.tables.load("relationships")
     final_covariates = None
-    if config.extract_claims.enabled and await storage_has_table(
-        "covariates", context.storage
-    ):
-        final_covariates = await load_table_from_storage("covariates", context.storage)
+    if config.extract_claims.enabled and await context.tables.has("covariates"):
+        final_covariates = await context.tables.load("covariates")
 
     output = create_final_text_units(
         text_units,
@@ -39,7 +30,7 @@ async def run_workflow(
         final_covariates,
     )
 
-    await write_table_to_storage(output, "text_units", context.storage)
+    await context.tables.write(output, "text_units")
 
     return WorkflowFunctionOutput(result=output)
 
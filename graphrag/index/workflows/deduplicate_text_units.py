@@ -0,0 +1,63 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing run_workflow method definition."""
+
+import logging
+
+import pandas as pd
+
+import graphrag.data_model.schemas as schemas
+from graphrag.config.models.deduplicate_text_units_config import (
+    DeduplicateTextUnitsConfig,
+)
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.operations.deduplicate_text_units import find_duplicates
+from graphrag.index.typing.context import PipelineRunContext
+from graphrag.index.typing.workflow import WorkflowFunctionOutput
+
+log = logging.getLogger(__name__)
+
+
+async def run_workflow(
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+) -> WorkflowFunctionOutput:
+    """All the steps to mark the near-duplicate text units."""
+    text_units = await context.tables.load("text_units")
+
+    output = deduplicate_text_units(text_units, config.deduplicate_text_units)
+
+    duplicates = int(output[schemas.DUPLICATE_OF].notna().sum())
+    context.stats.text_unit_duplicates = {
+        "text_units": len(output),
+        "duplicates": duplicates,
+        "ratio": duplicates / len(output) if len(output) > 0 else 0,
+    }
+    log.info("Found %s near-duplicate text units of %s", duplicates, len(output))
+
+    await context.tables.write(output, "text_units")
+
+    return WorkflowFunctionOutput(result=output)
+
+
+def deduplicate_text_units(
+    text_units: pd.DataFrame, config: DeduplicateTextUnitsConfig
+) -> pd.DataFrame:
+    """Mark the text units that are near-duplicates of an earlier one with the id of that one.
+
+    The graph and claim extraction skip the marked text units, and attribute copies of
+    the results of the text unit they duplicate to them instead.
+    """
+    duplicate_of = find_duplicates(
+        text_units["text"],
+        threshold=config.threshold,
+        num_perm=config.num_perm,
+        shingle_size=config.shingle_size,
+    )
+    output = text_units.copy()
+    ids = output["id"].to_numpy()
+    output[schemas.DUPLICATE_OF] = [
+        ids[index] if index >= 0 else None for index in duplicate_of
+    ]
+    return output
@@ -18,7 +18,7 @@ from graphrag.index.operations.extract_covariates.extract_covariates import (
 )
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.index.utils.concurrency_limiter import AdaptiveConcurrencyLimiter
 
 
 async def run_workflow(
@@ -26,7 +26,7 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to extract and format covariates."""
-    text_units = await load_table_from_storage("text_units", context.storage)
+    text_units = await context.tables.load("text_units")
 
     extract_claims_llm_settings = config.get_language_model_config(
         config.extract_claims.model_id
@@ -37,6 +37,9 @@ async def run_workflow(
 
     async_mode = extract_claims_llm_settings.async_mode
     num_threads = extract_claims_llm_settings.concurrent_requests
+    limiter = context.concurrency.get(
+        config.extract_claims.model_id, extract_claims_llm_settings
+    )
 
     output = await extract_covariates(
         text_units,
@@ -47,9 +50,10 @@ async def run_workflow(
         async_mode=async_mode,
         entity_types=None,
         num_threads=num_threads,
+        limiter=limiter,
     )
 
-    await write_table_to_storage(output, "covariates", context.storage)
+    await context.tables.write(output, "covariates")
 
     return WorkflowFunctionOutput(result=output)
 
@@ -63,6 +67,7 @@ async def extract_covariates(
     async_mode: AsyncType = AsyncType.AsyncIO,
     entity_types: list[str] | None = None,
     num_threads: int = 4,
+    limiter: AdaptiveConcurrencyLimiter | None = None,
 ) -> pd.DataFrame:
     """All the steps to extract and format covariates."""
     # reassign the id because it will be overwritten in the output by a covariate one
@@ -78,6 +83,7 @@ async def extract_covariates(
         async_mode=async_mode,
         entity_types=entity_types,
         num_threads=num_threads,
+        limiter=limiter,
     )
     text_units.drop(columns=["text_unit_id"], inplace=True)  # don't pollute the global
     covariates["id"] = covariates["covariate_type"].apply(lambda _x: str(uuid4()))
@@ -19,7 +19,7 @@ from graphrag.index.operations.summarize_descriptions import (
 )
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.index.utils.concurrency_limiter import AdaptiveConcurrencyLimiter
 
 
 async def run_workflow(
@@ -27,7 +27,7 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to create the base entity graph."""
-    text_units = await load_table_from_storage("text_units", context.storage)
+    text_units = await context.tables.load("text_units")
 
     extract_graph_llm_settings = config.get_language_model_config(
         config.extract_graph.model_id
@@ -53,10 +53,16 @@ async def run_workflow(
         entity_types=config.extract_graph.entity_types,
         summarization_strategy=summarization_strategy,
         summarization_num_threads=summarization_llm_settings.concurrent_requests,
+        extraction_limiter=context.concurrency.get(
+            config.extract_graph.model_id, extract_graph_llm_settings
+        ),
+        summarization_limiter=context.concurrency.get(
+            config.summarize_descriptions.model_id, summarization_llm_settings
+        ),
     )
 
-    await write_table_to_storage(entities, "entities", context.storage)
-    await write_table_to_storage(relationships, "relationships", context.storage)
+    await context.tables.write(entities, "entities")
+    await context.tables.write(relationships, "relationships")
 
     return WorkflowFunctionOutput(
         result={
@@ -76,6 +82,8 @@ async def extract_graph(
     entity_types: list[str] | None = None,
     summarization_strategy: dict[str, Any] | None = None,
     summarization_num_threads: int = 4,
+    extraction_limiter: AdaptiveConcurrencyLimiter | None = None,
+    summarization_limiter: AdaptiveConcurrencyLimiter | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """All the steps to create the base entity graph."""
     # this returns a graph for each text unit, to be merged later
@@ -89,6 +97,7 @@ async def extract_graph(
         async_mode=extraction_async_mode,
         entity_types=entity_types,
         num_threads=extraction_num_threads,
+        limiter=extraction_limiter,
     )
 
     if not _validate_data(extracted_entities):
@@ -110,6 +119,7 @@ async def extract_graph(
         cache=cache,
         summarization_strategy=summarization_strategy,
         summarization_num_threads=summarization_num_threads,
+        summarization_limiter=summarization_limiter,
     )
 
     return (entities, relationships)
@@ -122,6 +132,7 @@ async def get_summarized_entities_relationships(
     cache: PipelineCache,
     summarization_strategy: dict[str, Any] | None = None,
     summarization_num_threads: int = 4,
+    summarization_limiter: AdaptiveConcurrencyLimiter | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Summarize the entities and relationships."""
     entity_summaries, relationship_summaries = await summarize_descriptions(
@@ -131,6 +142,7 @@ async def get_summarized_entities_relationships(
         cache=cache,
         strategy=summarization_strategy,
         num_threads=summarization_num_threads,
+        limiter=summarization_limiter,
     )
 
     relationships = extracted_relationships.drop(columns=["description"]).merge(
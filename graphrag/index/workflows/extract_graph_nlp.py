@@ -14,7 +14,6 @@ from graphrag.index.operations.build_noun_graph.np_extractors.factory import (
 )
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 
 async def run_workflow(
@@ -22,7 +21,7 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to create the base entity graph."""
-    text_units = await load_table_from_storage("text_units", context.storage)
+    text_units = await context.tables.load("text_units")
 
     entities, relationships = await extract_graph_nlp(
         text_units,
@@ -30,8 +29,8 @@ async def run_workflow(
         extraction_config=config.extract_graph_nlp,
     )
 
-    await write_table_to_storage(entities, "entities", context.storage)
-    await write_table_to_storage(relationships, "relationships", context.storage)
+    await context.tables.write(entities, "entities")
+    await context.tables.write(relationships, "relationships")
 
     return WorkflowFunctionOutput(
         result={
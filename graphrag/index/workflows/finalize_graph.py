@@ -8,13 +8,15 @@ import pandas as pd
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.embed_graph_config import EmbedGraphConfig
 from graphrag.config.models.graph_rag_config import GraphRagConfig
-from graphrag.index.operations.create_graph import create_graph
+from graphrag.index.operations.compact_graph import (
+    CompactGraph,
+    create_compact_graph,
+)
 from graphrag.index.operations.finalize_entities import finalize_entities
 from graphrag.index.operations.finalize_relationships import finalize_relationships
 from graphrag.index.operations.snapshot_graphml import snapshot_graphml
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 
 async def run_workflow(
@@ -22,8 +24,9 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to create the base entity graph."""
-    entities = await load_table_from_storage("entities", context.storage)
-    relationships = await load_table_from_storage("relationships", context.storage)
+    entities = await context.tables.load("entities")
+    relationships = await context.tables.load("relationships")
+    graph = create_compact_graph(relationships)
 
     final_entities, final_relationships = finalize_graph(
         entities,
@@ -31,16 +34,16 @@ async def run_workflow(
         callbacks=context.callbacks,
         embed_config=config.embed_graph,
         layout_enabled=config.umap.enabled,
+        graph=graph,
     )
 
-    await write_table_to_storage(final_entities, "entities", context.storage)
-    await write_table_to_storage(final_relationships, "relationships", context.storage)
+    await context.tables.write(final_entities, "entities")
+    await context.tables.write(final_relationships, "relationships")
 
     if config.snapshots.graphml:
         # todo: extract graphs at each level, and add in meta like descriptions
-        graph = create_graph(relationships)
         await snapshot_graphml(
-            graph,
+            graph.to_networkx(),
             name="graph",
             storage=context.storage,
         )
@@ -59,10 +62,13 @@ def finalize_graph(
     callbacks: WorkflowCallbacks,
     embed_config: EmbedGraphConfig | None = None,
     layout_enabled: bool = False,
+    graph: CompactGraph | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """All the steps to finalize the entity and relationship formats."""
+    if graph is None:
+        graph = create_compact_graph(relationships)
     final_entities = finalize_entities(
-        entities, relationships, callbacks, embed_config, layout_enabled
+        entities, relationships, callbacks, embed_config, layout_enabled, graph
     )
-    final_relationships = finalize_relationships(relationships)
+    final_relationships = finalize_relationships(relationships, graph)
     return (final_entities, final_relationships)
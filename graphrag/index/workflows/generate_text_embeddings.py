@@ -3,6 +3,7 @@
 
 """A module containing run_workflow method definition."""
 
+import asyncio
 import logging
 
 import pandas as pd
@@ -23,9 +24,10 @@ from graphrag.config.embeddings import (
 )
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.operations.embed_text import embed_text
+from graphrag.index.operations.embed_text.embedding_store import TextEmbeddingStore
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.utils.storage import write_table_to_storage
 
 log = logging.getLogger(__name__)
 
@@ -35,16 +37,15 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to transform community reports."""
-    documents = await load_table_from_storage("documents", context.storage)
-    relationships = await load_table_from_storage("relationships", context.storage)
-    text_units = await load_table_from_storage("text_units", context.storage)
-    entities = await load_table_from_storage("entities", context.storage)
-    community_reports = await load_table_from_storage(
-        "community_reports", context.storage
-    )
+    documents = await context.tables.load("documents")
+    relationships = await context.tables.load("relationships")
+    text_units = await context.tables.load("text_units")
+    entities = await context.tables.load("entities")
+    community_reports = await context.tables.load("community_reports")
 
     embedded_fields = get_embedded_fields(config)
     text_embed = get_embedding_settings(config)
+    embedding_store = TextEmbeddingStore(context.cache)
 
     output = await generate_text_embeddings(
         documents=documents,
@@ -56,7 +57,9 @@ async def run_workflow(
         cache=context.cache,
         text_embed_config=text_embed,
         embedded_fields=embedded_fields,
+        embedding_store=embedding_store,
     )
+    context.stats.text_embedding_store = embedding_store.stats()
 
     if config.snapshots.embeddings:
         for name, table in output.items():
@@ -79,6 +82,7 @@ async def generate_text_embeddings(
     cache: PipelineCache,
     text_embed_config: dict,
     embedded_fields: set[str],
+    embedding_store: TextEmbeddingStore | None = None,
 ) -> dict[str, pd.DataFrame]:
     """All the steps to generate all embeddings."""
     embedding_param_map = {
@@ -131,16 +135,30 @@ async def generate_text_embeddings(
     }
 
     log.info("Creating embeddings")
-    outputs = {}
-    for field in embedded_fields:
-        outputs[field] = await _run_and_snapshot_embeddings(
-            name=field,
-            callbacks=callbacks,
-            cache=cache,
-            text_embed_config=text_embed_config,
-            **embedding_param_map[field],
-        )
-    return outputs
+    # all fields are embedded concurrently, sharing one bound on in-flight requests
+    semaphore = asyncio.Semaphore(
+        text_embed_config["strategy"].get("num_threads", 4)
+    )
+    # texts repeated within or across fields are embedded once
+    embedding_store = embedding_store or TextEmbeddingStore(cache)
+    fields = list(embedded_fields)
+    try:
+        results = await asyncio.gather(*[
+            _run_and_snapshot_embeddings(
+                name=field,
+                callbacks=callbacks,
+                cache=cache,
+                text_embed_config=text_embed_config,
+                semaphore=semaphore,
+                embedding_store=embedding_store,
+                **embedding_param_map[field],
+            )
+            for field in fields
+        ])
+    finally:
+        # the batches stored so far are reused by the next run, even if this one failed
+        await embedding_store.flush()
+    return dict(zip(fields, results, strict=True))
 
 
 async def _run_and_snapshot_embeddings(
@@ -150,6 +168,8 @@ async def _run_and_snapshot_embeddings(
     callbacks: WorkflowCallbacks,
     cache: PipelineCache,
     text_embed_config: dict,
+    semaphore: asyncio.Semaphore | None = None,
+    embedding_store: TextEmbeddingStore | None = None,
 ) -> pd.DataFrame:
     """All the steps to generate single embedding."""
     data["embedding"] = await embed_text(
@@ -159,6 +179,8 @@ async def _run_and_snapshot_embeddings(
         embed_column=embed_column,
         embedding_name=name,
         strategy=text_embed_config["strategy"],
+        semaphore=semaphore,
+        embedding_store=embedding_store,
     )
 
     return data.loc[:, ["id", "embedding"]]
@@ -12,7 +12,6 @@ from graphrag.index.operations.graph_to_dataframes import graph_to_dataframes
 from graphrag.index.operations.prune_graph import prune_graph as prune_graph_operation
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 
 async def run_workflow(
@@ -20,8 +19,8 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to create the base entity graph."""
-    entities = await load_table_from_storage("entities", context.storage)
-    relationships = await load_table_from_storage("relationships", context.storage)
+    entities = await context.tables.load("entities")
+    relationships = await context.tables.load("relationships")
 
     pruned_entities, pruned_relationships = prune_graph(
         entities,
@@ -29,8 +28,8 @@ async def run_workflow(
         pruning_config=config.prune_graph,
     )
 
-    await write_table_to_storage(pruned_entities, "entities", context.storage)
-    await write_table_to_storage(pruned_relationships, "relationships", context.storage)
+    await context.tables.write(pruned_entities, "entities")
+    await context.tables.write(pruned_relationships, "relationships")
 
     return WorkflowFunctionOutput(
         result={
@@ -6,14 +6,25 @@
 from typing import Any
 
 from fnllm.events import LLMEvents
+from fnllm.types.metrics import LLMUsageMetrics
+from openai import APITimeoutError, RateLimitError
 
 from graphrag.index.typing.error_handler import ErrorHandlerFn
+from graphrag.index.utils.concurrency_limiter import (
+    record_request,
+    record_response,
+    record_throttle,
+)
+from graphrag.utils.profiling import current_profile
+
+# errors telling the service is overloaded, rather than the request being wrong
+_THROTTLING_ERRORS = (RateLimitError, APITimeoutError)
 
 
 class FNLLMEvents(LLMEvents):
-    """FNLLM events handler that calls the error handler."""
+    """FNLLM events handler that calls the error handler, records the usage in the workflow profile and reports the latency and throttling of the requests to the concurrency limiter."""
 
-    def __init__(self, on_error: ErrorHandlerFn):
+    def __init__(self, on_error: ErrorHandlerFn | None = None):
         self._on_error = on_error
 
     async def on_error(
@@ -23,4 +34,41 @@ class FNLLMEvents(LLMEvents):
         arguments: dict[str, Any] | None = None,
     ) -> None:
         """Handle an fnllm error."""
-        self._on_error(error, traceback, arguments)
+        if isinstance(error, _THROTTLING_ERRORS):
+            record_throttle()
+        if self._on_error is not None:
+            self._on_error(error, traceback, arguments)
+
+    async def on_execute_llm(self) -> None:
+        """Count a request sent to the model."""
+        record_request()
+        profile = current_profile()
+        if profile is not None:
+            profile.llm_calls += 1
+
+    async def on_usage(self, usage: LLMUsageMetrics) -> None:
+        """Count the tokens used by a request."""
+        record_response()
+        profile = current_profile()
+        if profile is not None:
+            profile.prompt_tokens += usage.input_tokens
+            profile.completion_tokens += usage.output_tokens
+
+    async def on_cache_hit(self, cache_key: str, name: str | None) -> None:
+        """Count a response read from the cache."""
+        profile = current_profile()
+        if profile is not None:
+            profile.llm_cache_hits += 1
+
+    async def on_cache_miss(self, cache_key: str, name: str | None) -> None:
+        """Count a response that was not in the cache."""
+        profile = current_profile()
+        if profile is not None:
+            profile.llm_cache_misses += 1
+
+    async def on_retryable_error(
+        self, error: BaseException, attempt_number: int
+    ) -> None:
+        """Back off the concurrency if the service is throttling or timing out."""
+        if isinstance(error, _THROTTLING_ERRORS):
+            record_throttle()
@@ -60,7 +60,7 @@ class OpenAIChatFNLLM:
             model_config,
             client=client,
             cache=model_cache,
-            events=FNLLMEvents(error_handler) if error_handler else None,
+            events=FNLLMEvents(error_handler),
         )
 
     async def achat(
@@ -165,7 +165,7 @@ class OpenAIEmbeddingFNLLM:
             model_config,
             client=client,
             cache=model_cache,
-            events=FNLLMEvents(error_handler) if error_handler else None,
+            events=FNLLMEvents(error_handler),
         )
 
     async def aembed_batch(self, text_list: list[str], **kwargs) -> list[list[float]]:
@@ -256,7 +256,7 @@ class AzureOpenAIChatFNLLM:
             model_config,
             client=client,
             cache=model_cache,
-            events=FNLLMEvents(error_handler) if error_handler else None,
+            events=FNLLMEvents(error_handler),
         )
 
     async def achat(
@@ -363,7 +363,7 @@ class AzureOpenAIEmbeddingFNLLM:
             model_config,
             client=client,
             cache=model_cache,
-            events=FNLLMEvents(error_handler) if error_handler else None,
+            events=FNLLMEvents(error_handler),
         )
 
     async def aembed_batch(self, text_list: list[str], **kwargs) -> list[list[float]]:
@@ -53,6 +53,12 @@ def _create_openai_config(config: LanguageModelConfig, azure: bool) -> OpenAICon
     json_strategy = (
         JsonStrategy.VALID if config.model_supports_json else JsonStrategy.LOOSE
     )
+    # with adaptive concurrency, the pipeline keeps the requests under its own limit
+    max_concurrency = (
+        config.max_concurrent_requests
+        if config.adaptive_concurrency
+        else config.concurrent_requests
+    )
     chat_parameters = OpenAIChatParameters(
         frequency_penalty=config.frequency_penalty,
         presence_penalty=config.presence_penalty,
@@ -81,7 +87,7 @@ def _create_openai_config(config: LanguageModelConfig, azure: bool) -> OpenAICon
             audience=audience,
             retry_strategy=RetryStrategy(config.retry_strategy),
             timeout=config.request_timeout,
-            max_concurrency=config.concurrent_requests,
+            max_concurrency=max_concurrency,
             model=config.model,
             encoding=encoding_model,
             deployment=config.deployment_name,
@@ -99,7 +105,7 @@ def _create_openai_config(config: LanguageModelConfig, azure: bool) -> OpenAICon
         requests_per_minute=config.requests_per_minute,
         tokens_per_minute=config.tokens_per_minute,
         timeout=config.request_timeout,
-        max_concurrency=config.concurrent_requests,
+        max_concurrency=max_concurrency,
         model=config.model,
         encoding=encoding_model,
         chat_parameters=chat_parameters,
@@ -63,7 +63,7 @@ async def load_docs_in_chunks(
 
     dataset = await create_input(config.input, logger, root)
     chunk_config = config.chunks
-    chunks_df = create_base_text_units(
+    chunks_df = await create_base_text_units(
         documents=dataset,
         callbacks=NoopWorkflowCallbacks(),
         group_by_columns=chunk_config.group_by_columns,
@@ -73,6 +73,7 @@ async def load_docs_in_chunks(
         strategy=chunk_config.strategy,
         prepend_metadata=chunk_config.prepend_metadata,
         chunk_size_includes_metadata=chunk_config.chunk_size_includes_metadata,
+        workers=chunk_config.workers,
     )
 
     # Depending on the select method, build the dataset
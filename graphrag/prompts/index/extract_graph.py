@@ -127,3 +127,9 @@ Output:"""
 
 CONTINUE_PROMPT = "MANY entities and relationships were missed in the last extraction. Remember to ONLY emit entities that match any of the previously extracted types. Add them below using the same format:\n"
 LOOP_PROMPT = "It appears some entities and relationships may have still been missed.  Answer Y or N if there are still entities or relationships that need to be added.\n"
+BATCH_INPUT_TEXT = """The text below is made of {text_unit_count} separate text units, each starting with a line "-Text unit <n>-" that gives its number. Extract from each text unit on its own, in order: start with the record ("text_unit"{tuple_delimiter}<n>) for its number, followed by the entities and relationships of that text unit only.
+
+{text_units}"""
+BATCH_TEXT_UNIT = "-Text unit {number}-\n{text}"
+BATCH_CONTINUE_PROMPT = """Start the records of each text unit with the record ("text_unit"{tuple_delimiter}<n>) for its number, as before, and only add the text units that have missing records.
+"""
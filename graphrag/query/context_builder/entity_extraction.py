@@ -9,6 +9,7 @@ from graphrag.data_model.entity import Entity
 from graphrag.data_model.relationship import Relationship
 from graphrag.language_model.protocol.base import EmbeddingModel
 from graphrag.query.input.retrieval.entities import (
+    EntityIndex,
     get_entity_by_id,
     get_entity_by_key,
     get_entity_by_name,
@@ -44,6 +45,7 @@ def map_query_to_entities(
     exclude_entity_names: list[str] | None = None,
     k: int = 10,
     oversample_scaler: int = 2,
+    entity_index: EntityIndex | None = None,
 ) -> list[Entity]:
     """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions."""
     if include_entity_names is None:
@@ -65,6 +67,10 @@ def map_query_to_entities(
                 result.document.id, str
             ):
                 matched = get_entity_by_id(all_entities_dict, result.document.id)
+            elif entity_index is not None:
+                matched = entity_index.get_by_key(
+                    embedding_vectorstore_key, result.document.id
+                )
             else:
                 matched = get_entity_by_key(
                     entities=all_entities,
@@ -88,7 +94,10 @@ def map_query_to_entities(
     # add entities in the include_entity list
     included_entities = []
     for entity_name in include_entity_names:
-        included_entities.extend(get_entity_by_name(all_entities, entity_name))
+        if entity_index is not None:
+            included_entities.extend(entity_index.get_by_name(entity_name))
+        else:
+            included_entities.extend(get_entity_by_name(all_entities, entity_name))
     return included_entities + matched_entities
 
 
@@ -251,33 +251,15 @@ def _filter_relationships(
 
     # within out-of-network relationships, prioritize mutual relationships
     # (i.e. relationships with out-network entities that are shared with multiple selected entities)
-    selected_entity_names = [entity.title for entity in selected_entities]
-    out_network_source_names = [
-        relationship.source
-        for relationship in out_network_relationships
-        if relationship.source not in selected_entity_names
-    ]
-    out_network_target_names = [
-        relationship.target
-        for relationship in out_network_relationships
-        if relationship.target not in selected_entity_names
-    ]
-    out_network_entity_names = list(
-        set(out_network_source_names + out_network_target_names)
-    )
+    selected_entity_names = {entity.title for entity in selected_entities}
+    linked_entity_names = defaultdict(set)
+    for relationship in out_network_relationships:
+        linked_entity_names[relationship.source].add(relationship.target)
+        linked_entity_names[relationship.target].add(relationship.source)
     out_network_entity_links = defaultdict(int)
-    for entity_name in out_network_entity_names:
-        targets = [
-            relationship.target
-            for relationship in out_network_relationships
-            if relationship.source == entity_name
-        ]
-        sources = [
-            relationship.source
-            for relationship in out_network_relationships
-            if relationship.target == entity_name
-        ]
-        out_network_entity_links[entity_name] = len(set(targets + sources))
+    for entity_name, linked_names in linked_entity_names.items():
+        if entity_name not in selected_entity_names:
+            out_network_entity_links[entity_name] = len(linked_names)
 
     # sort out-network relationships by number of links and rank_attributes
     for rel in out_network_relationships:
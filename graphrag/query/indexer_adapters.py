@@ -132,8 +132,11 @@ def read_indexer_report_embeddings(
     embeddings_store: BaseVectorStore,
 ):
     """Read in the Community Reports from the raw indexing outputs."""
-    for report in community_reports:
-        report.full_content_embedding = embeddings_store.search_by_id(report.id).vector
+    documents = embeddings_store.search_by_ids([
+        report.id for report in community_reports
+    ])
+    for report, document in zip(community_reports, documents, strict=True):
+        report.full_content_embedding = document.vector
 
 
 def read_indexer_entities(
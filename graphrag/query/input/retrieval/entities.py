@@ -4,6 +4,7 @@
 """Util functions to get entities from a collection."""
 
 import uuid
+from collections import defaultdict
 from collections.abc import Iterable
 from typing import Any, cast
 
@@ -12,6 +13,52 @@ import pandas as pd
 from graphrag.data_model.entity import Entity
 
 
+class EntityIndex:
+    """Hash maps for looking up entities by id, title and short_id.
+
+    Built once per loaded index. Lookups return the same entity as the linear
+    `get_entity_by_*` helpers, i.e. the first match in the original entity order.
+    """
+
+    indexed_keys = ("id", "title", "short_id")
+
+    def __init__(self, entities: Iterable[Entity]):
+        self.entities = list(entities)
+        self._positions: dict[str, dict[Any, int]] = {
+            key: {} for key in self.indexed_keys
+        }
+        self._title_positions: dict[str, list[int]] = defaultdict(list)
+        for position, entity in enumerate(self.entities):
+            for key, positions in self._positions.items():
+                positions.setdefault(getattr(entity, key), position)
+            self._title_positions[entity.title].append(position)
+
+    def get_by_key(self, key: str, value: str | int) -> Entity | None:
+        """Get entity by key, matching dashed and undashed forms of a uuid value."""
+        if key not in self._positions:
+            return get_entity_by_key(self.entities, key, value)
+        positions = self._positions[key]
+        candidates = [value]
+        if isinstance(value, str) and is_valid_uuid(value):
+            candidates.append(value.replace("-", ""))
+        matches = [positions[c] for c in candidates if c in positions]
+        return self.entities[min(matches)] if matches else None
+
+    def get_by_name(self, entity_name: str) -> list[Entity]:
+        """Get entities by name."""
+        return [
+            self.entities[position]
+            for position in self._title_positions.get(entity_name, ())
+        ]
+
+    def get_by_names(self, entity_names: Iterable[str]) -> list[Entity]:
+        """Get entities whose name is in entity_names, in original order."""
+        positions = set()
+        for name in entity_names:
+            positions.update(self._title_positions.get(name, ()))
+        return [self.entities[position] for position in sorted(positions)]
+
+
 def get_entity_by_id(entities: dict[str, Entity], value: str) -> Entity | None:
     """Get entity by id."""
     entity = entities.get(value)
@@ -3,6 +3,8 @@
 
 """Util functions to retrieve relationships from a collection."""
 
+from collections import defaultdict
+from collections.abc import Iterable
 from typing import Any, cast
 
 import pandas as pd
@@ -11,13 +13,44 @@ from graphrag.data_model.entity import Entity
 from graphrag.data_model.relationship import Relationship
 
 
+class RelationshipIndex:
+    """Adjacency index from entity title to the relationships attached to it.
+
+    Built once per loaded index so that query-time retrieval only touches the
+    neighborhood of the selected entities. Relationships are kept in their original
+    list order, so filtering the candidates and sorting them by rank gives the same
+    result as scanning the full list.
+    """
+
+    def __init__(self, relationships: list[Relationship]):
+        self.relationships = relationships
+        self._positions: dict[str, list[int]] = defaultdict(list)
+        for position, relationship in enumerate(relationships):
+            self._positions[relationship.source].append(position)
+            if relationship.target != relationship.source:
+                self._positions[relationship.target].append(position)
+
+    def get_relationships(self, entity_names: Iterable[str]) -> list[Relationship]:
+        """Get all relationships with the source or target in entity_names, in original order."""
+        positions = set()
+        for name in entity_names:
+            positions.update(self._positions.get(name, ()))
+        return [self.relationships[position] for position in sorted(positions)]
+
+    def get_candidate_relationships(
+        self, selected_entities: list[Entity]
+    ) -> list[Relationship]:
+        """Get all relationships that are associated with the selected entities."""
+        return self.get_relationships(entity.title for entity in selected_entities)
+
+
 def get_in_network_relationships(
     selected_entities: list[Entity],
     relationships: list[Relationship],
     ranking_attribute: str = "rank",
 ) -> list[Relationship]:
     """Get all directed relationships between selected entities, sorted by ranking_attribute."""
-    selected_entity_names = [entity.title for entity in selected_entities]
+    selected_entity_names = {entity.title for entity in selected_entities}
     selected_relationships = [
         relationship
         for relationship in relationships
@@ -37,7 +70,7 @@ def get_out_network_relationships(
     ranking_attribute: str = "rank",
 ) -> list[Relationship]:
     """Get relationships from selected entities to other entities that are not within the selected entities, sorted by ranking_attribute."""
-    selected_entity_names = [entity.title for entity in selected_entities]
+    selected_entity_names = {entity.title for entity in selected_entities}
     source_relationships = [
         relationship
         for relationship in relationships
@@ -59,7 +92,7 @@ def get_candidate_relationships(
     relationships: list[Relationship],
 ) -> list[Relationship]:
     """Get all relationships that are associated with the selected entities."""
-    selected_entity_names = [entity.title for entity in selected_entities]
+    selected_entity_names = {entity.title for entity in selected_entities}
     return [
         relationship
         for relationship in relationships
@@ -72,9 +105,9 @@ def get_entities_from_relationships(
     relationships: list[Relationship], entities: list[Entity]
 ) -> list[Entity]:
     """Get all entities that are associated with the selected relationships."""
-    selected_entity_names = [relationship.source for relationship in relationships] + [
+    selected_entity_names = {relationship.source for relationship in relationships} | {
         relationship.target for relationship in relationships
-    ]
+    }
     return [entity for entity in entities if entity.title in selected_entity_names]
 
 
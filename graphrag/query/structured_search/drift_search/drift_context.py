@@ -74,6 +74,11 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
 
         self.response_type = response_type
 
+        # report frame and contiguous embedding matrix, built on first use
+        self._report_df: pd.DataFrame | None = None
+        self._report_embeddings: np.ndarray | None = None
+        self._report_norms: np.ndarray | None = None
+
         self.local_mixed_context = (
             local_mixed_context or self.init_local_context_builder()
         )
@@ -140,6 +145,18 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
             )
         return report_df
 
+    def _get_report_matrix(self) -> tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+        """Return the report frame, report embedding matrix and row norms, building them once."""
+        if self._report_df is None:
+            report_df = self.convert_reports_to_df(self.reports or [])
+            report_embeddings = np.ascontiguousarray(
+                np.vstack(report_df["full_content_embedding"].to_list())
+            )
+            self._report_norms = np.linalg.norm(report_embeddings, axis=1)
+            self._report_embeddings = report_embeddings
+            self._report_df = report_df
+        return self._report_df, self._report_embeddings, self._report_norms  # type: ignore
+
     @staticmethod
     def check_query_doc_encodings(query_embedding: Any, embedding: Any) -> bool:
         """
@@ -201,7 +218,7 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
 
         query_embedding, token_ct = await query_processor(query)
 
-        report_df = self.convert_reports_to_df(self.reports)
+        report_df, report_embeddings, report_norms = self._get_report_matrix()
 
         # Check compatibility between query embedding and document embeddings
         if not self.check_query_doc_encodings(
@@ -215,13 +232,10 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
 
         # Vectorized cosine similarity computation
         query_norm = np.linalg.norm(query_embedding)
-        document_norms = np.linalg.norm(
-            report_df["full_content_embedding"].to_list(), axis=1
-        )
-        dot_products = np.dot(
-            np.vstack(report_df["full_content_embedding"].to_list()), query_embedding
+        dot_products = report_embeddings @ np.asarray(query_embedding)
+        report_df = report_df.assign(
+            similarity=dot_products / (report_norms * query_norm)
         )
-        report_df["similarity"] = dot_products / (document_norms * query_norm)
 
         # Sort by similarity and select top-k
         top_k = report_df.nlargest(self.config.drift_k_followups, "similarity")
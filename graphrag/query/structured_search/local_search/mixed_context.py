@@ -39,6 +39,8 @@ from graphrag.query.context_builder.source_context import (
 from graphrag.query.input.retrieval.community_reports import (
     get_candidate_communities,
 )
+from graphrag.query.input.retrieval.entities import EntityIndex
+from graphrag.query.input.retrieval.relationships import RelationshipIndex
 from graphrag.query.input.retrieval.text_units import get_candidate_text_units
 from graphrag.query.llm.text_utils import num_tokens
 from graphrag.query.structured_search.base import LocalContextBuilder
@@ -71,6 +73,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
         if text_units is None:
             text_units = []
         self.entities = {entity.id: entity for entity in entities}
+        self.entity_index = EntityIndex(self.entities.values())
         self.community_reports = {
             community.community_id: community for community in community_reports
         }
@@ -78,6 +81,9 @@ class LocalSearchMixedContext(LocalContextBuilder):
         self.relationships = {
             relationship.id: relationship for relationship in relationships
         }
+        self.relationship_index = RelationshipIndex(
+            list(self.relationships.values())
+        )
         self.covariates = covariates
         self.entity_text_embeddings = entity_text_embeddings
         self.text_embedder = text_embedder
@@ -146,6 +152,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
             exclude_entity_names=exclude_entity_names,
             k=top_k_mapped_entities,
             oversample_scaler=2,
+            entity_index=self.entity_index,
         )
 
         # build context
@@ -318,15 +325,12 @@ class LocalSearchMixedContext(LocalContextBuilder):
         text_unit_ids_set = set()
 
         unit_info_list = []
-        relationship_values = list(self.relationships.values())
 
         for index, entity in enumerate(selected_entities):
             # get matching relationships
-            entity_relationships = [
-                rel
-                for rel in relationship_values
-                if rel.source == entity.title or rel.target == entity.title
-            ]
+            entity_relationships = self.relationship_index.get_relationships([
+                entity.title
+            ])
 
             for text_id in entity.text_unit_ids or []:
                 if text_id not in text_unit_ids_set and text_id in self.text_units:
@@ -416,7 +420,9 @@ class LocalSearchMixedContext(LocalContextBuilder):
                 relationship_context_data,
             ) = build_relationship_context(
                 selected_entities=added_entities,
-                relationships=list(self.relationships.values()),
+                relationships=self.relationship_index.get_candidate_relationships(
+                    added_entities
+                ),
                 token_encoder=self.token_encoder,
                 max_tokens=max_tokens,
                 column_delimiter=column_delimiter,
@@ -459,10 +465,18 @@ class LocalSearchMixedContext(LocalContextBuilder):
         if return_candidate_context:
             # we return all the candidate entities/relationships/covariates (not only those that were fitted into the context window)
             # and add a tag to indicate which records were included in the context window
+            candidate_relationships = (
+                self.relationship_index.get_candidate_relationships(selected_entities)
+            )
+            candidate_entities = self.entity_index.get_by_names(
+                name
+                for relationship in candidate_relationships
+                for name in (relationship.source, relationship.target)
+            )
             candidate_context_data = get_candidate_context(
                 selected_entities=selected_entities,
-                entities=list(self.entities.values()),
-                relationships=list(self.relationships.values()),
+                entities=candidate_entities,
+                relationships=candidate_relationships,
                 covariates=self.covariates,
                 include_entity_rank=include_entity_rank,
                 entity_rank_description=rank_description,
@@ -18,6 +18,7 @@ from graphrag.storage.pipeline_storage import (
     PipelineStorage,
     get_timestamp_formatted_with_local_tz,
 )
+from graphrag.utils.profiling import record_io
 
 log = logging.getLogger(__name__)
 
@@ -183,6 +184,7 @@ class BlobPipelineStorage(PipelineStorage):
             )
             blob_client = container_client.get_blob_client(key)
             blob_data = blob_client.download_blob().readall()
+            record_io(bytes_read=len(blob_data))
             if not as_bytes:
                 coding = encoding or self._encoding
                 blob_data = blob_data.decode(coding)
@@ -200,11 +202,11 @@ class BlobPipelineStorage(PipelineStorage):
                 self._container_name
             )
             blob_client = container_client.get_blob_client(key)
-            if isinstance(value, bytes):
-                blob_client.upload_blob(value, overwrite=True)
-            else:
+            if not isinstance(value, bytes):
                 coding = encoding or self._encoding
-                blob_client.upload_blob(value.encode(coding), overwrite=True)
+                value = value.encode(coding)
+            blob_client.upload_blob(value, overwrite=True)
+            record_io(bytes_written=len(value))
         except Exception:
             log.exception("Error setting key %s: %s", key)
 
@@ -22,6 +22,7 @@ from graphrag.storage.pipeline_storage import (
     PipelineStorage,
     get_timestamp_formatted_with_local_tz,
 )
+from graphrag.utils.profiling import record_io
 
 log = logging.getLogger(__name__)
 
@@ -57,16 +58,15 @@ class FilePipelineStorage(PipelineStorage):
 
         search_path = Path(self._root_dir) / (base_dir or "")
         log.info("search %s for files matching %s", search_path, file_pattern.pattern)
-        all_files = list(search_path.rglob("**/*"))
         num_loaded = 0
-        num_total = len(all_files)
         num_filtered = 0
-        for file in all_files:
-            match = file_pattern.search(f"{file}")
+        # the tree is scanned as the files are consumed, rather than listed up front
+        for file in _scan_tree(str(search_path)):
+            match = file_pattern.search(file)
             if match:
                 group = match.groupdict()
                 if item_filter(group):
-                    filename = f"{file}".replace(self._root_dir, "")
+                    filename = file.replace(self._root_dir, "")
                     if filename.startswith(os.sep):
                         filename = filename[1:]
                     yield (filename, group)
@@ -78,7 +78,9 @@ class FilePipelineStorage(PipelineStorage):
             else:
                 num_filtered += 1
             if progress is not None:
-                progress(_create_progress_status(num_loaded, num_filtered, num_total))
+                # the total is only known once the whole tree is scanned
+                num_seen = num_loaded + num_filtered
+                progress(_create_progress_status(num_loaded, num_filtered, num_seen))
 
     async def get(
         self, key: str, as_bytes: bool | None = False, encoding: str | None = None
@@ -110,19 +112,23 @@ class FilePipelineStorage(PipelineStorage):
             cast("Any", read_type),
             encoding=encoding,
         ) as f:
-            return await f.read()
+            content = await f.read()
+        record_io(bytes_read=len(content) if as_bytes else os.path.getsize(path))
+        return content
 
     async def set(self, key: str, value: Any, encoding: str | None = None) -> None:
         """Set method definition."""
         is_bytes = isinstance(value, bytes)
         write_type = "wb" if is_bytes else "w"
         encoding = None if is_bytes else encoding or self._encoding
+        file_path = join_path(self._root_dir, key)
         async with aiofiles.open(
-            join_path(self._root_dir, key),
+            file_path,
             cast("Any", write_type),
             encoding=encoding,
         ) as f:
             await f.write(value)
+        record_io(bytes_written=len(value) if is_bytes else os.path.getsize(file_path))
 
     async def has(self, key: str) -> bool:
         """Has method definition."""
@@ -166,6 +172,33 @@ def join_path(file_path: str, file_name: str) -> Path:
     return Path(file_path) / Path(file_name).parent / Path(file_name).name
 
 
+def _scan_tree(directory: str) -> Iterator[str]:
+    """Get the paths of everything under a directory, in the order of `Path.rglob("**/*")`.
+
+    The entries of a directory come before those of its subdirectories, and symbolic
+    links to directories are not followed.
+    """
+    subdirectories = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                path = (
+                    entry.name
+                    if directory == "."
+                    else os.path.join(directory, entry.name)
+                )
+                yield path
+                try:
+                    if entry.is_dir() and not entry.is_symlink():
+                        subdirectories.append(path)
+                except OSError:
+                    continue
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return
+    for subdirectory in subdirectories:
+        yield from _scan_tree(subdirectory)
+
+
 def create_file_storage(**kwargs: Any) -> PipelineStorage:
     """Create a file based storage."""
     base_dir = kwargs["base_dir"]
@@ -0,0 +1,92 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'PipelineTableRegistry' model."""
+
+import asyncio
+import logging
+from collections import OrderedDict
+
+import pandas as pd
+
+from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.utils.storage import (
+    load_table_from_storage,
+    storage_has_table,
+    write_table_to_storage,
+)
+
+log = logging.getLogger(__name__)
+
+
+class PipelineTableRegistry:
+    """Hands tables over between workflows in memory, persisting them in the background.
+
+    Written tables are kept in memory, up to `max_memory_bytes` in total, so a following
+    workflow does not have to re-parse what the previous one just wrote. The least
+    recently used tables are dropped from memory past that, and are read back from the
+    storage. Every table is written to the storage as well, without blocking the writer;
+    `flush` waits for those writes to finish.
+    """
+
+    def __init__(self, storage: PipelineStorage, max_memory_bytes: int):
+        self._storage = storage
+        self._max_memory_bytes = max_memory_bytes
+        self._tables: OrderedDict[str, tuple[pd.DataFrame, int]] = OrderedDict()
+        self._memory_bytes = 0
+        self._writes: dict[str, asyncio.Task] = {}
+
+    async def load(self, name: str) -> pd.DataFrame:
+        """Load a table, from memory if it is still there."""
+        if name in self._tables:
+            self._tables.move_to_end(name)
+            # readers may modify what they load, and other workflows may be reading it
+            return self._tables[name][0].copy()
+        if name in self._writes:
+            await self._writes[name]
+        return await load_table_from_storage(name, self._storage)
+
+    async def write(self, table: pd.DataFrame, name: str) -> None:
+        """Write a table, keeping it in memory and persisting it in the background."""
+        self._evict(name)
+        size = int(table.memory_usage(index=True, deep=True).sum())
+        if size <= self._max_memory_bytes:
+            self._tables[name] = (table, size)
+            self._memory_bytes += size
+            while self._memory_bytes > self._max_memory_bytes:
+                self._evict(next(iter(self._tables)))
+
+        # writes of the same table are persisted in order
+        previous = self._writes.get(name)
+        self._writes[name] = asyncio.create_task(self._persist(table, name, previous))
+
+    async def has(self, name: str) -> bool:
+        """Check if a table exists."""
+        return (
+            name in self._tables
+            or name in self._writes
+            or await storage_has_table(name, self._storage)
+        )
+
+    async def flush(self) -> None:
+        """Wait for the tables written so far to be persisted to the storage."""
+        writes = list(self._writes.values())
+        try:
+            await asyncio.gather(*writes)
+        finally:
+            for name, write in list(self._writes.items()):
+                if write.done():
+                    del self._writes[name]
+
+    async def _persist(
+        self, table: pd.DataFrame, name: str, previous: asyncio.Task | None
+    ) -> None:
+        if previous is not None:
+            await asyncio.gather(previous, return_exceptions=True)
+        await write_table_to_storage(table, name, self._storage)
+
+    def _evict(self, name: str) -> None:
+        if name in self._tables:
+            _, size = self._tables.pop(name)
+            self._memory_bytes -= size
+            log.debug("dropped table %s from memory", name)
@@ -63,6 +63,30 @@ class MultiVectorStore(BaseVectorStore):
             message = f"Index {search_index_name} not found."
             raise ValueError(message)
 
+    def search_by_ids(self, ids: list[str]) -> list[VectorStoreDocument]:
+        """Search for documents by a list of ids, with one bulk lookup per index."""
+        positions_by_index: dict[str, list[int]] = {}
+        for position, id in enumerate(ids):
+            search_index_name = id.split("-")[1]
+            if search_index_name not in self.index_names:
+                message = f"Index {search_index_name} not found."
+                raise ValueError(message)
+            positions_by_index.setdefault(search_index_name, []).append(position)
+
+        documents: list[VectorStoreDocument] = [None] * len(ids)  # type: ignore
+        for index_name, embedding_store in zip(
+            self.index_names, self.embedding_stores, strict=False
+        ):
+            positions = positions_by_index.get(index_name, [])
+            if not positions:
+                continue
+            index_documents = embedding_store.search_by_ids([
+                ids[position].split("-")[0] for position in positions
+            ])
+            for position, document in zip(positions, index_documents, strict=True):
+                documents[position] = document
+        return documents
+
     def similarity_search_by_vector(
         self, query_embedding: list[float], k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
@@ -0,0 +1,73 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""The resource counters of the workflow being run, updated by the storage, cache and language model layers."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+_current_profile: ContextVar["WorkflowProfile | None"] = ContextVar(
+    "current_profile", default=None
+)
+
+
+@dataclass
+class WorkflowProfile:
+    """The resources used by a workflow run.
+
+    The counters are updated by whatever the workflow calls, through `current_profile`.
+    CPU time and peak memory are measured for the whole process while the workflow
+    runs, so they are shared by the workflows that run at the same time.
+    """
+
+    cpu_time: float = field(default=0)
+    """CPU time of the process while the workflow ran, in seconds."""
+
+    peak_memory: int = field(default=0)
+    """Peak resident memory of the process while the workflow ran, in bytes."""
+
+    llm_calls: int = field(default=0)
+    """Number of requests sent to a language model, retries included."""
+
+    prompt_tokens: int = field(default=0)
+    """Number of prompt tokens sent to a language model."""
+
+    completion_tokens: int = field(default=0)
+    """Number of completion tokens received from a language model."""
+
+    llm_cache_hits: int = field(default=0)
+    """Number of language model responses read from the cache."""
+
+    llm_cache_misses: int = field(default=0)
+    """Number of language model responses that were not in the cache."""
+
+    bytes_read: int = field(default=0)
+    """Number of bytes read from the storage and the cache."""
+
+    bytes_written: int = field(default=0)
+    """Number of bytes written to the storage and the cache."""
+
+
+def current_profile() -> WorkflowProfile | None:
+    """Get the profile of the workflow being run, if any."""
+    return _current_profile.get()
+
+
+def record_io(bytes_read: int = 0, bytes_written: int = 0) -> None:
+    """Add the bytes read or written to the profile of the workflow being run."""
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.bytes_read += bytes_read
+        profile.bytes_written += bytes_written
+
+
+@contextmanager
+def track_profile(profile: WorkflowProfile) -> Iterator[None]:
+    """Make the profile the one updated by everything run within the context."""
+    token = _current_profile.set(profile)
+    try:
+        yield
+    finally:
+        _current_profile.reset(token)
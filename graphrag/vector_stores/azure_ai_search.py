@@ -37,6 +37,8 @@ class AzureAISearchVectorStore(BaseVectorStore):
     """Azure AI Search vector storage implementation."""
 
     index_client: SearchIndexClient
+    # keep search.in filters well below the service's filter length limit
+    _ids_batch_size: int = 500
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -204,3 +206,26 @@ class AzureAISearchVectorStore(BaseVectorStore):
             vector=response.get("vector", []),
             attributes=(json.loads(response.get("attributes", "{}"))),
         )
+
+    def search_by_ids(self, ids: list[str]) -> list[VectorStoreDocument]:
+        """Search for documents by a list of ids using batched search.in filters."""
+        found = {}
+        for start in range(0, len(ids), self._ids_batch_size):
+            batch = ids[start : start + self._ids_batch_size]
+            id_filter = ",".join([f"{id!s}" for id in batch])
+            response = self.db_connection.search(
+                search_text="*",
+                filter=f"search.in(id, '{id_filter}', ',')",
+                top=len(batch),
+            )
+            for doc in response:
+                found[doc.get("id", "")] = VectorStoreDocument(
+                    id=doc.get("id", ""),
+                    text=doc.get("text", ""),
+                    vector=doc.get("vector", []),
+                    attributes=(json.loads(doc.get("attributes", "{}"))),
+                )
+        return [
+            found.get(id, VectorStoreDocument(id=id, text=None, vector=None))
+            for id in ids
+        ]
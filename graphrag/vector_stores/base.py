@@ -83,3 +83,12 @@ class BaseVectorStore(ABC):
     @abstractmethod
     def search_by_id(self, id: str) -> VectorStoreDocument:
         """Search for a document by id."""
+
+    def search_by_ids(self, ids: list[str]) -> list[VectorStoreDocument]:
+        """Search for documents by a list of ids.
+
+        Returns one document per id, in the same order; ids that are not found
+        get a document with no vector. Stores should override this with a bulk
+        lookup, the default falls back to one `search_by_id` call per id.
+        """
+        return [self.search_by_id(id) for id in ids]
@@ -214,3 +214,31 @@ class CosmosDBVectoreStore(BaseVectorStore):
             text=item.get("text", ""),
             attributes=(json.loads(item.get("attributes", "{}"))),
         )
+
+    def search_by_ids(self, ids: list[str]) -> list[VectorStoreDocument]:
+        """Search for documents by a list of ids with a single query."""
+        if self._container_client is None:
+            msg = "Container client is not initialized."
+            raise ValueError(msg)
+        if len(ids) == 0:
+            return []
+
+        query = "SELECT c.id, c.text, c.vector, c.attributes FROM c WHERE ARRAY_CONTAINS(@ids, c.id)"
+        items = self._container_client.query_items(
+            query=query,
+            parameters=[{"name": "@ids", "value": ids}],
+            enable_cross_partition_query=True,
+        )
+        found = {
+            item.get("id", ""): VectorStoreDocument(
+                id=item.get("id", ""),
+                vector=item.get("vector", []),
+                text=item.get("text", ""),
+                attributes=(json.loads(item.get("attributes", "{}"))),
+            )
+            for item in items
+        }
+        return [
+            found.get(id, VectorStoreDocument(id=id, text=None, vector=None))
+            for id in ids
+        ]
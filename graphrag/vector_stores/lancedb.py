@@ -151,3 +151,28 @@ class LanceDBVectorStore(BaseVectorStore):
                 attributes=json.loads(doc[0]["attributes"]),
             )
         return VectorStoreDocument(id=id, text=None, vector=None)
+
+    def search_by_ids(self, ids: list[str]) -> list[VectorStoreDocument]:
+        """Search for documents by a list of ids in a single filtered scan."""
+        if len(ids) == 0:
+            return []
+        id_filter = ", ".join([f"'{id}'" for id in ids])
+        docs = (
+            self.document_collection.search()
+            .where(f"id in ({id_filter})", prefilter=True)
+            .limit(len(ids))
+            .to_list()
+        )
+        found = {
+            doc["id"]: VectorStoreDocument(
+                id=doc["id"],
+                text=doc["text"],
+                vector=doc["vector"],
+                attributes=json.loads(doc["attributes"]),
+            )
+            for doc in docs
+        }
+        return [
+            found.get(id, VectorStoreDocument(id=id, text=None, vector=None))
+            for id in ids
+        ]
@@ -59,6 +59,16 @@ if __name__ == "__main__":
         help="Update an existing knowledge graph index",
         action="store_true",
     )
+    parser.add_argument(
+        "--resume",
+        help="Skip workflows that already completed with the same inputs and settings",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--profile",
+        help="Run the workflows one at a time and write a profile of each to the logs",
+        action="store_true",
+    )
     args = parser.parse_args()
 
     stime = time.time()
@@ -90,6 +100,7 @@ if __name__ == "__main__":
             skip_validation=False,
             output_dir=None,
             method=IndexingMethod.Standard,
+            profile=args.profile,
         )
     else:
         print("Method: index")
@@ -104,4 +115,6 @@ if __name__ == "__main__":
             skip_validation=False,
             output_dir=None,
             method=IndexingMethod.Standard,
+            resume=args.resume,
+            profile=args.profile,
         )
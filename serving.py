@@ -4,6 +4,9 @@ import pandas as pd
 import json
 import asyncio
 from typing import List, Literal, Optional, Union, Any
+from collections.abc import Awaitable, Callable
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pydantic import BaseModel, Field
 from fastapi import FastAPI, HTTPException, Response, Query
 from fastapi.responses import FileResponse
@@ -17,7 +20,7 @@ from graphrag.config.load_config import load_config
 from graphrag.utils.api import create_storage_from_config
 from graphrag.utils.storage import load_table_from_storage, storage_has_table
 from graphrag.callbacks.noop_query_callbacks import NoopQueryCallbacks
-from graphrag.config.enums import SearchMethod
+from graphrag.config.enums import OutputType, SearchMethod
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 
 DEFAULT_COMMUNITY_LEVEL = 2
@@ -74,23 +77,152 @@ async def run_query(
     ):
     match method:
         case SearchMethod.LOCAL:
-            return await run_local_search(root_dir=root, query=query, streaming=streaming)
+            build_request = build_local_request
         case SearchMethod.GLOBAL:
-            return await run_global_search(root_dir=root, query=query, streaming=streaming)
+            build_request = build_global_request
         case SearchMethod.DRIFT:
-            return await run_drift_search(root_dir=root, query=query, streaming=streaming)
+            build_request = build_drift_request
         case SearchMethod.BASIC:
-            return await run_basic_search(root_dir=root, query=query, streaming=streaming)
+            build_request = build_basic_request
         case _:
             raise HTTPException(status_code=400, detail=f"Invalid request method: {method}")
 
+    search_engine = await index_registry.get_search_engine(
+        root, method, DEFAULT_COMMUNITY_LEVEL, build_request
+    )
+    return await run_search(
+        search_engine=search_engine, query=query, method=method, streaming=streaming
+    )
 
-async def build_local_request(root_dir: Path):
-    root = root_dir.resolve()
-    config = load_config(root)
 
-    dataframe_dict = await _resolve_output_files(
-        config=config,
+@dataclass
+class IndexEntry:
+    config: GraphRagConfig
+    signature: tuple
+    tables: dict[str, Any] = field(default_factory=dict)
+    engines: dict[tuple, api.SearchEngine] = field(default_factory=dict)
+    nbytes: int = 0
+
+
+class IndexRegistry:
+    """Keep loaded index config and output tables resident, keyed by resolved root.
+
+    Entries are evicted least-recently-used first once the total size of the
+    resident tables exceeds `max_bytes`, and reloaded whenever `stats.json` or
+    any parquet file in the output directory changes. Search engines built
+    from an entry live and die with it.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Path, IndexEntry] = OrderedDict()
+        self._locks: dict[Any, asyncio.Lock] = {}
+
+    async def get(
+        self,
+        root_dir: Path,
+        output_list: list[str],
+        optional_list: list[str] | None = None,
+    ) -> tuple[GraphRagConfig, dict[str, Any]]:
+        optional_list = optional_list or []
+        entry = await self._get_entry(root_dir, output_list, optional_list)
+        return entry.config, {
+            name: entry.tables[name] for name in output_list + optional_list
+        }
+
+    async def get_search_engine(
+        self,
+        root_dir: Path,
+        method: SearchMethod,
+        community_level: int,
+        build_request: Callable[[Path], Awaitable[api.SearchEngine]],
+    ) -> api.SearchEngine:
+        key = (method, community_level)
+        lock = self._locks.setdefault((root_dir.resolve(), key), asyncio.Lock())
+        # serialize builds per engine so concurrent first requests build it once
+        async with lock:
+            entry = await self._get_entry(root_dir, [], [])
+            if key not in entry.engines:
+                print(f"[IndexRegistry] building {method.value} search engine: {root_dir}")
+                entry.engines[key] = await build_request(root_dir)
+            return entry.engines[key]
+
+    async def _get_entry(
+        self,
+        root_dir: Path,
+        output_list: list[str],
+        optional_list: list[str],
+    ) -> IndexEntry:
+        root = root_dir.resolve()
+        lock = self._locks.setdefault(root, asyncio.Lock())
+        async with lock:
+            entry = self._entries.get(root)
+            if entry is not None and entry.signature != _output_signature(entry.config):
+                print(f"[IndexRegistry] output changed, reloading: {root}")
+                self._entries.pop(root)
+                entry = None
+            if entry is None:
+                config = load_config(root)
+                entry = IndexEntry(config=config, signature=_output_signature(config))
+
+            missing = [name for name in output_list if name not in entry.tables]
+            missing_optional = [name for name in optional_list if name not in entry.tables]
+            if missing or missing_optional:
+                dataframe_dict = await _resolve_output_files(
+                    config=entry.config,
+                    output_list=missing,
+                    optional_list=missing_optional,
+                )
+                for name in missing + missing_optional:
+                    entry.tables[name] = dataframe_dict[name]
+                    entry.nbytes += _table_nbytes(dataframe_dict[name])
+
+            self._entries[root] = entry
+            self._entries.move_to_end(root)
+            self._evict()
+            return entry
+
+    def _evict(self) -> None:
+        total = sum(entry.nbytes for entry in self._entries.values())
+        # always keep the most recently used entry, even if it alone exceeds the bound
+        while total > self._max_bytes and len(self._entries) > 1:
+            root, entry = self._entries.popitem(last=False)
+            total -= entry.nbytes
+            print(f"[IndexRegistry] evicted {root} ({entry.nbytes} bytes)")
+
+
+def _output_signature(config: GraphRagConfig) -> tuple:
+    """Fingerprint the output directories by stats.json/parquet mtimes and sizes."""
+    outputs = config.outputs.values() if config.outputs else [config.output]
+    signature = []
+    for output in outputs:
+        # only file outputs can be checked cheaply; other storages are loaded once
+        if output.type != OutputType.file or not os.path.isdir(output.base_dir):
+            continue
+        with os.scandir(output.base_dir) as it:
+            for item in it:
+                if item.is_file() and (item.name == "stats.json" or item.name.endswith(".parquet")):
+                    stat = item.stat()
+                    signature.append((item.path, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(signature))
+
+
+def _table_nbytes(value: Any) -> int:
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, list):
+        return sum(_table_nbytes(v) for v in value)
+    return 0
+
+
+# upper bound on the in-memory size of all resident index tables, read after load_dotenv
+INDEX_REGISTRY_MAX_BYTES = int(os.getenv("GRAPHRAG_INDEX_REGISTRY_MAX_BYTES", str(4 * 1024**3)))
+index_registry = IndexRegistry(max_bytes=INDEX_REGISTRY_MAX_BYTES)
+
+
+async def build_local_request(root_dir: Path) -> api.SearchEngine:
+    config, dataframe_dict = await index_registry.get(
+        root_dir,
         output_list=[
             "communities",
             "community_reports",
@@ -110,47 +242,7 @@ async def build_local_request(root_dir: Path):
     final_entities: pd.DataFrame = dataframe_dict["entities"]
     final_covariates: pd.DataFrame | None = dataframe_dict["covariates"]
 
-    return config, final_communities, final_community_reports, final_text_units,\
-        final_relationships, final_entities, final_covariates
-
-
-async def run_local_search(root_dir: Path, query: str, streaming: bool):
-    config, final_communities, final_community_reports, final_text_units,\
-        final_relationships, final_entities, final_covariates = await build_local_request(root_dir)
-    
-    if streaming:
-        async def streaming_search():
-            full_response = ""
-            context_data = {}
-
-            def on_context(context: Any) -> None:
-                nonlocal context_data
-                context_data = context
-
-            callbacks = NoopQueryCallbacks()
-            callbacks.on_context = on_context
-            
-            async for stream_chunk in api.local_search_streaming(
-                config=config,
-                entities=final_entities,
-                communities=final_communities,
-                community_reports=final_community_reports,
-                text_units=final_text_units,
-                relationships=final_relationships,
-                covariates=final_covariates,
-                community_level=DEFAULT_COMMUNITY_LEVEL,
-                response_type=DEFAULT_RESPONSE_TYPE,
-                query=query,
-                callbacks=[callbacks],
-            ):
-                full_response += stream_chunk
-                yield(stream_chunk)
-            yield("[DONE]")
-        
-        streaming_resp = streaming_search()
-        return EventSourceResponse(streaming_resp, media_type="text/event-stream")
-
-    response, context_data = await api.local_search(
+    return api.build_local_search_engine(
         config=config,
         entities=final_entities,
         communities=final_communities,
@@ -160,17 +252,12 @@ async def run_local_search(root_dir: Path, query: str, streaming: bool):
         covariates=final_covariates,
         community_level=DEFAULT_COMMUNITY_LEVEL,
         response_type=DEFAULT_RESPONSE_TYPE,
-        query=query,
     )
-    return Response(content=response, media_type="text/plain")
-
 
-async def build_global_request(root_dir: Path):
-    root = root_dir.resolve()
-    config = load_config(root)
 
-    dataframe_dict = await _resolve_output_files(
-        config=config,
+async def build_global_request(root_dir: Path) -> api.SearchEngine:
+    config, dataframe_dict = await index_registry.get(
+        root_dir,
         output_list=[
             "entities",
             "communities",
@@ -183,44 +270,7 @@ async def build_global_request(root_dir: Path):
     final_communities: pd.DataFrame = dataframe_dict["communities"]
     final_community_reports: pd.DataFrame = dataframe_dict["community_reports"]
 
-    return config, final_entities, final_communities, final_community_reports
-
-
-async def run_global_search(root_dir: Path, query: str, streaming: bool):
-    config, final_entities, final_communities,\
-        final_community_reports = await build_global_request(root_dir)
-    
-    if streaming:
-        async def streaming_search():
-            full_response = ""
-            context_data = {}
-
-            def on_context(context: Any) -> None:
-                nonlocal context_data
-                context_data = context
-
-            callbacks = NoopQueryCallbacks()
-            callbacks.on_context = on_context
-
-            async for stream_chunk in api.global_search_streaming(
-                config=config,
-                entities=final_entities,
-                communities=final_communities,
-                community_reports=final_community_reports,
-                community_level=DEFAULT_COMMUNITY_LEVEL,
-                dynamic_community_selection=False,
-                response_type=DEFAULT_RESPONSE_TYPE,
-                query=query,
-                callbacks=[callbacks],
-            ):
-                full_response += stream_chunk
-                yield(stream_chunk)
-            yield("[DONE]")
-
-        streaming_resp = streaming_search()
-        return EventSourceResponse(streaming_resp, media_type="text/event-stream")
-
-    response, context_data = await api.global_search(
+    return api.build_global_search_engine(
         config=config,
         entities=final_entities,
         communities=final_communities,
@@ -228,18 +278,12 @@ async def run_global_search(root_dir: Path, query: str, streaming: bool):
         community_level=DEFAULT_COMMUNITY_LEVEL,
         dynamic_community_selection=False,
         response_type=DEFAULT_RESPONSE_TYPE,
-        query=query,
     )
 
-    return response
 
-
-async def build_drift_request(root_dir: Path):
-    root = root_dir.resolve()
-    config = load_config(root)
-
-    dataframe_dict = await _resolve_output_files(
-        config=config,
+async def build_drift_request(root_dir: Path) -> api.SearchEngine:
+    config, dataframe_dict = await index_registry.get(
+        root_dir,
         output_list=[
             "communities",
             "community_reports",
@@ -254,46 +298,7 @@ async def build_drift_request(root_dir: Path):
     final_relationships: pd.DataFrame = dataframe_dict["relationships"]
     final_entities: pd.DataFrame = dataframe_dict["entities"]
 
-    return config, final_communities, final_entities, final_community_reports,\
-        final_text_units, final_relationships
-
-
-async def run_drift_search(root_dir: Path, query: str, streaming: bool):
-    config, final_communities, final_entities, final_community_reports,\
-        final_text_units, final_relationships = await build_drift_request(root_dir)
-
-    if streaming:
-        async def streaming_search():
-            full_response = ""
-            context_data = {}
-
-            def on_context(context: Any) -> None:
-                nonlocal context_data
-                context_data = context
-
-            callbacks = NoopQueryCallbacks()
-            callbacks.on_context = on_context
-
-            async for stream_chunk in api.drift_search_streaming(
-                config=config,
-                entities=final_entities,
-                communities=final_communities,
-                community_reports=final_community_reports,
-                text_units=final_text_units,
-                relationships=final_relationships,
-                community_level=DEFAULT_COMMUNITY_LEVEL,
-                response_type=DEFAULT_RESPONSE_TYPE,
-                query=query,
-                callbacks=[callbacks],
-            ):
-                full_response += stream_chunk
-                yield(stream_chunk)
-            yield("[DONE]")
-
-        streaming_resp = streaming_search()
-        return EventSourceResponse(streaming_resp, media_type="text/event-stream")
-
-    response, context_data = await api.drift_search(
+    return api.build_drift_search_engine(
         config=config,
         entities=final_entities,
         communities=final_communities,
@@ -302,30 +307,30 @@ async def run_drift_search(root_dir: Path, query: str, streaming: bool):
         relationships=final_relationships,
         community_level=DEFAULT_COMMUNITY_LEVEL,
         response_type=DEFAULT_RESPONSE_TYPE,
-        query=query,
     )
 
-    return response
-
-
-async def build_basic_request(root_dir: Path):
-    root = root_dir.resolve()
-    config = load_config(root)
 
-    dataframe_dict = await _resolve_output_files(
-        config=config,
+async def build_basic_request(root_dir: Path) -> api.SearchEngine:
+    config, dataframe_dict = await index_registry.get(
+        root_dir,
         output_list=[
             "text_units",
         ],
     )
     final_text_units: pd.DataFrame = dataframe_dict["text_units"]
 
-    return config, final_text_units
-
+    return api.build_basic_search_engine(
+        config=config,
+        text_units=final_text_units,
+    )
 
-async def run_basic_search(root_dir: Path, query: str, streaming: bool):
-    config, final_text_units = await build_basic_request(root_dir)
 
+async def run_search(
+    search_engine: api.SearchEngine,
+    query: str,
+    method: SearchMethod,
+    streaming: bool,
+    ):
     if streaming:
         async def streaming_search():
             full_response = ""
@@ -338,11 +343,10 @@ async def run_basic_search(root_dir: Path, query: str, streaming: bool):
             callbacks = NoopQueryCallbacks()
             callbacks.on_context = on_context
 
-            async for stream_chunk in api.basic_search_streaming(
-                config=config,
-                text_units=final_text_units,
+            async for stream_chunk in search_engine.stream_search(
                 query=query,
-            ): 
+                callbacks=[callbacks],
+            ):
                 full_response += stream_chunk
                 yield(stream_chunk)
             yield("[DONE]")
@@ -350,12 +354,9 @@ async def run_basic_search(root_dir: Path, query: str, streaming: bool):
         streaming_resp = streaming_search()
         return EventSourceResponse(streaming_resp, media_type="text/event-stream")
 
-    response, context_data = await api.basic_search(
-        config=config,
-        text_units=final_text_units,
-        query=query,
-    )
-    
+    response, context_data = await search_engine.search(query=query)
+    if method == SearchMethod.LOCAL:
+        return Response(content=response, media_type="text/plain")
     return response
 
 
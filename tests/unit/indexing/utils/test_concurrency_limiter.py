@@ -0,0 +1,51 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import random
+import time
+
+from graphrag.index.utils.concurrency_limiter import (
+    LATENCY_WINDOW,
+    AdaptiveConcurrencyLimiter,
+)
+
+
+def test_load_independent_latency_variance_keeps_the_limit():
+    rng = random.Random(0)
+    for low, high in [(1.0, 4.0), (0.2, 4.0)]:
+        limiter = AdaptiveConcurrencyLimiter(
+            "test", min_limit=1, max_limit=32, initial_limit=8
+        )
+        for _ in range(10_000):
+            limiter.observe(rng.uniform(low, high), started=time.monotonic())
+        assert limiter.limit == 8
+        assert limiter.stats().throttled == 0
+
+
+def test_latency_growing_under_load_lowers_the_limit():
+    limiter = AdaptiveConcurrencyLimiter(
+        "test", min_limit=1, max_limit=32, initial_limit=8
+    )
+    for _ in range(LATENCY_WINDOW):
+        limiter.observe(1.0, started=time.monotonic())
+    for _ in range(LATENCY_WINDOW):
+        limiter.observe(3.0, started=time.monotonic())
+    assert limiter.limit == 4
+    assert limiter.stats().throttled == 1
+
+    # the baseline is measured again under the lowered limit
+    for _ in range(2 * LATENCY_WINDOW):
+        limiter.observe(3.0, started=time.monotonic())
+    assert limiter.limit == 4
+
+
+def test_latency_of_tasks_started_before_a_back_off_is_ignored():
+    limiter = AdaptiveConcurrencyLimiter(
+        "test", min_limit=1, max_limit=32, initial_limit=8
+    )
+    started = time.monotonic()
+    limiter.back_off(started)
+    for _ in range(3 * LATENCY_WINDOW):
+        limiter.observe(10.0, started=started - 1)
+    assert limiter.limit == 4
+    assert limiter.stats().throttled == 1